@@ -0,0 +1,95 @@
+"""Benchmark: size, load and seek time of a grid rollout in each `SimulationHistory` encoding.
+
+A synthetic fire front spreads over a ``--size`` × ``--size`` grid for
+``--steps`` steps (states 0 = unburned, 1 = burning, 2 = burned), with
+constant wind and static vegetation fields.  The baseline is what the
+wildfire module used to keep: ``int64`` states and ``float64`` fields.
+
+    python benchmarks/fire_history.py
+    python benchmarks/fire_history.py --steps 200 --size 256 --interval 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from manim_deck.animations.history import ENCODINGS, SimulationHistory
+
+
+def synthetic_rollout(steps: int, size: int, seed: int = 0) -> tuple[np.ndarray, dict]:
+    """``(steps, size, size)`` uint8 states of a noisy circular front, and its fields."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[:size, :size]
+    distance = np.hypot(y - size / 2, x - size / 2) + rng.normal(0, 2, (size, size))
+    states = np.empty((steps, size, size), dtype=np.uint8)
+    for t, radius in enumerate(np.linspace(0, size * 0.7, steps)):
+        states[t] = (distance < radius).astype(np.uint8) + (distance < radius - 3)
+    fields = {
+        "wind_direction": np.broadcast_to(45.0, states.shape),
+        "wind_speed": np.broadcast_to(3.5, states.shape),
+        "landcover": np.broadcast_to(rng.integers(0, 11, (size, size)), states.shape),
+        "vegetation_canopy": np.broadcast_to(rng.random((size, size)), states.shape),
+        "vegetation_density": np.broadcast_to(rng.random((size, size)), states.shape),
+    }
+    return states, fields
+
+
+def seek_ms(history: SimulationHistory, samples: int = 50, seed: int = 0) -> float:
+    """Median milliseconds to decode one random step."""
+    steps = np.random.default_rng(seed).integers(0, len(history), samples)
+    times = []
+    for t in steps:
+        start = time.perf_counter()
+        history.states[int(t)]
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def load_ms(path: Path, runs: int = 3) -> float:
+    """Median milliseconds to load the history saved at *path*."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        SimulationHistory.load(path)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=1000, help="timesteps (default 1000)")
+    parser.add_argument("--size", type=int, default=512, help="grid side (default 512)")
+    parser.add_argument(
+        "--interval", type=int, default=32, help="keyframe interval of 'delta' (default 32)"
+    )
+    args = parser.parse_args(argv)
+
+    states, fields = synthetic_rollout(args.steps, args.size)
+    baseline = states.size * 8 * (1 + len(fields))
+    print(f"{args.steps} steps of {args.size}×{args.size}")
+    print(f"{'storage':<22} {'MB':>10} {'load ms':>9} {'seek ms':>9}")
+    print(f"{'int64 + float64':<22} {baseline / 2**20:>10.1f} {'-':>9} {'-':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for encoding in ENCODINGS:
+            history = SimulationHistory.from_arrays(
+                states, encoding=encoding, keyframe_interval=args.interval, **fields
+            )
+            path = Path(tmp, f"{encoding}.npz")
+            history.save(path)
+            label = f"{encoding} + compact"
+            print(
+                f"{label:<22} {path.stat().st_size / 2**20:>10.1f}"
+                f" {load_ms(path):>9.1f} {seek_ms(history):>9.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Benchmark: shared-memory frame ring vs. pipe between two processes.
+
+Streams FireSpreadModule-scale frames (a grid of burning cells, upscaled to
+the output resolution) from this process to an encoder-side process that
+copies every frame out of the transport, as an encoder building its video
+frame does, and reports the throughput of each transport.
+
+    python benchmarks/frame_transport.py                  # 720p, 1080p and 4K
+    python benchmarks/frame_transport.py --frames 300 --sizes 4k
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import time
+
+import numpy as np
+
+from manim_deck.render.transport import FrameRing, PipeTransport
+
+SIZES = {"720p": (720, 1280), "1080p": (1080, 1920), "4k": (2160, 3840)}
+TRANSPORTS = {"shared-memory": FrameRing, "pipe": PipeTransport}
+
+
+def fire_frames(height: int, width: int, count: int = 4, cells: int = 90) -> list[np.ndarray]:
+    """*count* RGBA frames of a *cells*-wide fire grid, upscaled like an ImageMobject."""
+    rng = np.random.default_rng(0)
+    palette = np.array(
+        [[34, 85, 34, 255], [255, 120, 0, 255], [200, 30, 0, 255], [40, 40, 40, 255]],
+        dtype=np.uint8,
+    )
+    rows = max(1, cells * height // width)
+    frames = []
+    for _ in range(count):
+        grid = palette[rng.integers(0, len(palette), size=(rows, cells))]
+        scaled = grid.repeat(-(-height // rows), axis=0).repeat(-(-width // cells), axis=1)
+        frames.append(np.ascontiguousarray(scaled[:height, :width]))
+    return frames
+
+
+def _consume(transport, done) -> None:
+    checksum = 0
+    buffer = np.empty(transport.shape, transport.dtype)
+    for frame, num_frames in transport.read():
+        np.copyto(buffer, frame)  # read the whole frame on both transports
+        checksum += int(buffer[-1, -1, 0]) * num_frames
+    done.put(checksum)
+
+
+def run(kind: str, size: str, frames: int, slots: int) -> float:
+    height, width = SIZES[size]
+    ctx = mp.get_context("spawn")
+    transport = TRANSPORTS[kind]((height, width, 4), slots=slots, ctx=ctx)
+    done = ctx.SimpleQueue()
+    consumer = ctx.Process(target=_consume, args=(transport, done))
+    consumer.start()
+    source = fire_frames(height, width)
+    transport.write(source[0])  # warm up: the consumer has started
+    start = time.perf_counter()
+    for i in range(frames):
+        transport.write(source[i % len(source)])
+    transport.close()
+    done.get()
+    seconds = time.perf_counter() - start
+    consumer.join()
+    transport.release()
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=120, help="frames per run")
+    parser.add_argument("--slots", type=int, default=4, help="ring slots / queue depth")
+    parser.add_argument("--sizes", nargs="+", default=list(SIZES), choices=list(SIZES))
+    args = parser.parse_args()
+
+    print(f"{'transport':<14} {'size':<6} {'frames/s':>9} {'GB/s':>7} {'ms/frame':>9}")
+    for size in args.sizes:
+        height, width = SIZES[size]
+        frame_gb = height * width * 4 / 1e9
+        for kind in TRANSPORTS:
+            seconds = run(kind, size, args.frames, args.slots)
+            fps = args.frames / seconds
+            print(
+                f"{kind:<14} {size:<6} {fps:>9.1f} {fps * frame_gb:>7.2f} "
+                f"{1000 / fps:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
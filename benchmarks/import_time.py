@@ -0,0 +1,83 @@
+"""Benchmark: how long ``import manim_deck`` and friends take in a fresh interpreter.
+
+Each statement runs in its own ``python -c`` process, so nothing is already
+imported, and reports the median wall time and whether Manim got loaded.
+``-X importtime`` output for one statement is printed with ``--detail``.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 10 --detail "import manim_deck"
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import manim_deck",
+    "from manim_deck import Theme",
+    "from manim_deck.deck import compile_deck",
+    "import manim_deck.cli",
+    "from manim_deck import TemplateSlide",
+)
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start, "manim" in sys.modules)
+"""
+
+
+def time_statement(statement: str) -> tuple[float, bool]:
+    """Seconds *statement* takes in a fresh interpreter, and whether it imported Manim."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(statement=statement)],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    seconds, manim = result.stdout.split()
+    return float(seconds), manim == "True"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="runs per statement (median)")
+    parser.add_argument("--detail", metavar="STATEMENT", help="print -X importtime for one")
+    args = parser.parse_args(argv)
+
+    if args.detail:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", args.detail],
+            capture_output=True,
+            text=True,
+        )
+        rows = []
+        for line in result.stderr.splitlines():
+            _, _, fields = line.partition("import time:")
+            self_us, cumulative, name = (field.strip() for field in fields.split("|"))
+            if cumulative.isdigit():
+                rows.append((int(cumulative), int(self_us), name))
+        print(f"{'cumulative ms':>14} {'self ms':>8}  module")
+        for cumulative, self_us, name in sorted(rows, reverse=True)[:30]:
+            print(f"{cumulative / 1000:>14.1f} {self_us / 1000:>8.1f}  {name}")
+        return result.returncode
+
+    print(f"{'statement':<42} {'ms':>8}  manim")
+    for statement in STATEMENTS:
+        try:
+            samples = [time_statement(statement) for _ in range(args.runs)]
+        except RuntimeError as exc:
+            print(f"{statement:<42} {'-':>8}  ({exc})")
+            continue
+        ms = statistics.median(seconds for seconds, _ in samples) * 1000
+        print(f"{statement:<42} {ms:>8.1f}  {'yes' if samples[0][1] else 'no'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,56 @@
-"""manim_deck — Reusable Manim Slides templates and animations for research presentations."""
+"""manim_deck — Reusable Manim Slides templates and animations for research presentations.
 
-from manim_deck.templates import *  # noqa: F401,F403
-from manim_deck.animations import *  # noqa: F401,F403
+The names below are imported on first use (PEP 562), so ``import manim_deck``
+and the pure-Python parts (`Theme`, `manim_deck.deck`, `manim_deck.config`)
+load without Manim.  ``from manim_deck import TemplateSlide`` imports it.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+_EXPORTS = {
+    "TemplateSlide": "manim_deck.templates.base",
+    "DeckSlide": "manim_deck.templates.deck_slide",
+    "deck_scene": "manim_deck.templates.deck_slide",
+    "Theme": "manim_deck.templates.theme",
+    "DARK_THEME": "manim_deck.templates.theme",
+    "LIGHT_THEME": "manim_deck.templates.theme",
+    "COLOR_ROLES": "manim_deck.templates.theme",
+    "PipelineModule": "manim_deck.animations.pipeline",
+    "CalloutModule": "manim_deck.animations.callout",
+}
+
+__all__ = [
+    "TemplateSlide",
+    "DeckSlide",
+    "deck_scene",
+    "Theme",
+    "DARK_THEME",
+    "LIGHT_THEME",
+    "COLOR_ROLES",
+    "PipelineModule",
+    "CalloutModule",
+]
+
+if TYPE_CHECKING:
+    from manim_deck.animations.callout import CalloutModule
+    from manim_deck.animations.pipeline import PipelineModule
+    from manim_deck.templates.base import TemplateSlide
+    from manim_deck.templates.deck_slide import DeckSlide, deck_scene
+    from manim_deck.templates.theme import COLOR_ROLES, DARK_THEME, LIGHT_THEME, Theme
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
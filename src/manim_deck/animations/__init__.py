@@ -10,3 +10,33 @@ Example
 ...     def construct(self):
 ...         PipelineModule(self, steps=["Data", "Train", "Eval"]).run()
 """
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+_EXPORTS = {
+    "PipelineModule": "manim_deck.animations.pipeline",
+    "CalloutModule": "manim_deck.animations.callout",
+}
+
+__all__ = ["PipelineModule", "CalloutModule"]
+
+if TYPE_CHECKING:
+    from manim_deck.animations.callout import CalloutModule
+    from manim_deck.animations.pipeline import PipelineModule
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -11,7 +11,17 @@ Usage
 
 from __future__ import annotations
 
-from manim import *
+from manim import (
+    BOLD,
+    DOWN,
+    LEFT,
+    ORIGIN,
+    WHITE,
+    FadeIn,
+    RoundedRectangle,
+    Text,
+    VGroup,
+)
 
 
 class CalloutModule:
@@ -1,5 +1,7 @@
 from manim import *
 
+from manim_deck.animations.grid import CellGrid
+
 
 class AirtankerModule:
     """
@@ -20,20 +22,11 @@ class AirtankerModule:
         self.cell_size = cell_size
         self.spacing = cell_size + 0.1
 
-        self.squares = []
-        self.grid_group = VGroup()
-        x0 = -(cols - 1) * self.spacing / 2
-        y0 = (rows - 1) * self.spacing / 2
-        for i in range(rows):
-            row = []
-            for j in range(cols):
-                sq = Square(side_length=self.cell_size)
-                sq.set_stroke(BLACK, width=1)
-                sq.set_fill(GREEN, opacity=0.8)
-                sq.move_to([x0 + j * self.spacing, y0 - i * self.spacing, 0])
-                self.grid_group.add(sq)
-                row.append(sq)
-            self.squares.append(row)
+        # an explicit stroke: the borders stay at least a pixel wide at -ql
+        self.grid_group = CellGrid(
+            rows, cols, cell_size, spacing=self.spacing, stroke_width=1, camera=scene.camera
+        )
+        self.grid_group.set_fill(GREEN, opacity=0.8)
 
     def run(self):
         """
@@ -45,21 +38,13 @@ class AirtankerModule:
         mid_i, mid_j = self.rows // 2, self.cols // 2
         tanker = SVGMobject("images/airplane.svg").scale(0.3)
         tanker.set_color(YELLOW).set_stroke(BLACK, width=1)
-        tanker.move_to(self.squares[mid_i][mid_j].get_center())
+        tanker.move_to(self.grid_group.cell(mid_i, mid_j).get_center())
         self.tanker = tanker
         self.scene.play(FadeIn(tanker))
         self.scene.next_slide()
 
         view_radius = 1
-        obs_cells = [
-            self.squares[i][j]
-            for i in range(
-                max(0, mid_i - view_radius), min(self.rows, mid_i + view_radius + 1)
-            )
-            for j in range(
-                max(0, mid_j - view_radius), min(self.cols, mid_j + view_radius + 1)
-            )
-        ]
+        obs_cells = self.grid_group.window(mid_i, mid_j, view_radius)
         obs_box = SurroundingRectangle(
             VGroup(*obs_cells), color=PURPLE, buff=0, stroke_width=8
         )
@@ -81,7 +66,7 @@ class AirtankerModule:
             if 0 <= ni < self.rows and 0 <= nj < self.cols:
                 arr = Arrow(
                     start=tanker.get_center(),
-                    end=self.squares[ni][nj].get_center(),
+                    end=self.grid_group.cell(ni, nj).get_center(),
                     buff=0,
                 )
                 arrows.append(arr)
@@ -97,7 +82,7 @@ class AirtankerModule:
         self.scene.play(Write(valve_text))
         self.scene.wait(0.1)
 
-        self.scene.play(self.squares[mid_i][mid_j].animate.set_fill(BLUE, opacity=1))
+        self.scene.play(self.grid_group.cell(mid_i, mid_j).animate.set_fill(BLUE, opacity=1))
         self.scene.wait(0.5)
 
         close_text = Text("Valve Closed", font_size=24).next_to(
@@ -152,20 +137,10 @@ class AirtankerModule:
             anims = []
             current_i += di
             current_j += dj
-            target = self.squares[current_i][current_j].get_center()
+            target = self.grid_group.cell(current_i, current_j).get_center()
 
             new_obs_cells = VGroup(
-                *[
-                    self.squares[i][j]
-                    for i in range(
-                        max(0, current_i - view_radius),
-                        min(self.rows, current_i + view_radius + 1),
-                    )
-                    for j in range(
-                        max(0, current_j - view_radius),
-                        min(self.cols, current_j + view_radius + 1),
-                    )
-                ]
+                *self.grid_group.window(current_i, current_j, view_radius)
             )
             new_obs_box = SurroundingRectangle(
                 new_obs_cells, color=PURPLE, buff=0, stroke_width=8
@@ -182,7 +157,7 @@ class AirtankerModule:
 
             if valve:
                 anims.append(
-                    self.squares[current_i][current_j].animate.set_fill(BLUE, opacity=1)
+                    self.grid_group.cell(current_i, current_j).animate.set_fill(BLUE, opacity=1)
                 )
 
             self.scene.play(*anims, run_time=0.1)
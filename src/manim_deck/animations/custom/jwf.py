@@ -13,17 +13,20 @@ from jwf.environment.landcover import Landcover
 
 from dataclasses import dataclass
 
+from manim_deck.animations.grid import cell_grid
+from manim_deck.animations.history import SimulationHistory
+
 # Create a dummy DictConfig
 _CONFIG_PATH = Path(__file__).resolve().parent / "jwf_config.yaml"
 JWF_DUMMY_CONFIG = OmegaConf.load(str(_CONFIG_PATH))
 
 
+@dataclass(frozen=True, slots=True)
 class Params:
-    def __init__(self, grid_height, grid_width, wind_angle, wind_speed):
-        self.grid_height = grid_height
-        self.grid_width = grid_width
-        self.wind_angle = wind_angle
-        self.wind_speed = wind_speed
+    grid_height: int
+    grid_width: int
+    wind_angle: float
+    wind_speed: float
 
 
 def run_simulation_custom(rollout_seed, grid_height, grid_width, file_name="jwf"):
@@ -62,49 +65,29 @@ def run_simulation_custom(rollout_seed, grid_height, grid_width, file_name="jwf"
     # Save if needed
     datapath = f"data/{file_name}"
     os.makedirs("data", exist_ok=True)
-    # Save selected fields from history into a single .npz file
-
-    fire_states = np.array(history.fire.cells)
-    landcover_data = np.array(history.landcover.data)
-    wind_direction = np.array(history.wind.direction)
-    wind_speed = np.array(history.wind.speed)
-    vegetatiion_canopy = np.array(history.vegetation.canopy)
-    vegetation_density = np.array(history.vegetation.density)
-
-    np.savez(
-        f"{datapath}_sim_data.npz",
-        fire_states=np.array(history.fire.cells),
-        landcover=np.array(history.landcover.data),
-        wind_direction=np.array(history.wind.direction),
-        wind_speed=np.array(history.wind.speed),
-        vegetation_canopy=np.array(history.vegetation.canopy),
-        vegetation_density=np.array(history.vegetation.density),
-    )
-
-    return Data(
-        fire_states=fire_states,
-        wind_direction=wind_direction,
-        wind_speed=wind_speed,
-        landcover_data=landcover_data,
-        vegetation_canopy=vegetatiion_canopy,
-        vegetation_density=vegetation_density,
+    # Save the history as keyframes plus per-step changes (uint8 states, float16 fields)
+    data = SimulationHistory.from_arrays(
+        np.asarray(history.fire.cells),
+        encoding="delta",
+        landcover=np.asarray(history.landcover.data),
+        wind_direction=np.asarray(history.wind.direction),
+        wind_speed=np.asarray(history.wind.speed),
+        vegetation_canopy=np.asarray(history.vegetation.canopy),
+        vegetation_density=np.asarray(history.vegetation.density),
     )
-
-
-@dataclass
-class Data:
-    fire_states: np.ndarray
-    wind_direction: np.ndarray
-    wind_speed: np.ndarray
-    landcover_data: np.ndarray
-    vegetation_canopy: np.ndarray
-    vegetation_density: np.ndarray
+    data.save(f"{datapath}_sim_data.npz")
+    return data
 
 
 class FireSpreadModule:
     """
     Runs a wildfire rollout via perform_rollout, then plays it back
     on a Manim Scene/Slide by recoloring a grid of squares per timestep.
+
+    lod picks how the grid is drawn: "vector" (one Square per cell), "raster"
+    (one image), or "auto" to choose by the cells' size on screen.
+    With incremental, the grid is pinned to the scene's background layer so
+    each frame only redraws the cells (or raster tiles) that changed.
     """
 
     def __init__(
@@ -114,6 +97,8 @@ class FireSpreadModule:
         cell_size: float = 0.05,
         overwrite_simulation: bool = True,
         agent_interaction: bool = False,
+        lod: str = "auto",
+        incremental: bool = False,
     ):
         self.scene = scene
 
@@ -127,34 +112,37 @@ class FireSpreadModule:
         )
         self.data = data
 
-        T = self.data.fire_states.shape[0]  # Number of timesteps
+        T = len(self.data)  # Number of timesteps
 
-        self.landcover_states = Landcover(data=self.data.landcover_data[0])
+        # fields are compacted (constant axes have length 1), so broadcast back to (H, W)
+        landcover = np.broadcast_to(self.data.landcover, self.data.shape)[0]
+        self.landcover_states = Landcover(data=np.asarray(landcover, dtype=np.int32))
         self.agent_interaction = agent_interaction
 
         print(
-            f"Simulated {T} timesteps with {self.data.fire_states.shape[1]}x{self.data.fire_states.shape[2]} grid."
+            f"Simulated {T} timesteps with {self.data.shape[1]}x{self.data.shape[2]} grid "
+            f"({self.data.nbytes / 2**20:.1f} MB)."
         )
 
         self.T = T
-        self.H, self.W = self.data.fire_states.shape[1:3]
+        self.H, self.W = self.data.shape[1:3]
         # sim_states has shape (T, H, W) of integer cell codes (0=unburned,1=burning,2=burned)
         self.cell_size = cell_size
 
-        # 2) Build a grid of Squares once
-        self.squares: list[list[Square]] = []
-        # center the grid at ORIGIN
-        x0 = -(self.W - 1) * (cell_size) / 2
-        y0 = (self.H - 1) * (cell_size) / 2
-        for i in range(self.H):
-            row = []
-            for j in range(self.W):
-                sq = Square(side_length=cell_size)
-                sq.set_stroke(BLACK, width=1)
-                sq.move_to([x0 + j * (cell_size), y0 - i * (cell_size), 0])
-                scene.add(sq)
-                row.append(sq)
-            self.squares.append(row)
+        # 2) Build the grid once, centred at ORIGIN; cells are addressed by flat index.
+        # Cells only a few pixels wide on screen are drawn as a raster instead of Squares.
+        self.grid = cell_grid(
+            self.H,
+            self.W,
+            cell_size,
+            lod=lod,
+            camera=scene.camera,
+            stroke_color=BLACK,
+        )
+        scene.add(self.grid)
+        pin = getattr(scene, "pin_to_background", None)
+        if incremental and pin is not None:
+            pin(self.grid)
 
     def _run_simulation(self, rollout_seed, file_name: str = "jwf"):
         return run_simulation_custom(
@@ -186,23 +174,7 @@ class FireSpreadModule:
         else:
             # Check if the saved states exist
             print("Simulation data found. Loading existing data...")
-            # If they exist, load them
-            # Load the saved states
-            data = np.load(f"data/{file_name}_sim_data.npz", allow_pickle=True)
-            fire_cells = data["fire_cells"]
-            landcover_data = data["landcover"]
-            wind_direction = data["wind_direction"]
-            wind_speed = data["wind_speed"]
-            vegetation_canopy = data["vegetation_canopy"]
-            vegetation_density = data["vegetation_density"]
-            return Data(
-                fire_states=fire_cells,
-                wind_direction=wind_direction,
-                wind_speed=wind_speed,
-                landcover_data=landcover_data,
-                vegetation_canopy=vegetation_canopy,
-                vegetation_density=vegetation_density,
-            )
+            return SimulationHistory.load(f"data/{file_name}_sim_data.npz")
 
     def run(self):
         """
@@ -213,7 +185,7 @@ class FireSpreadModule:
             1: RED,  # burning
             2: DARK_GREY,  # burned
         }
-        previous_frame = None
+        palette = np.array([color_map[state].to_rgb() for state in sorted(color_map)])
 
         # Show the initial states
         #
@@ -223,22 +195,11 @@ class FireSpreadModule:
         print("Converting fire states to RGB image for initial display...")
         print(f"LANDCOVER: {landcover}")
         print(f"LANDCOVER SHAPE: {landcover.data.shape if landcover else 'None'}")
-        rgb_image = cells_to_image(self.data.fire_states[0], landcover=landcover)
-
-        anims = []
-        for i in range(self.H):
-            for j in range(self.W):
-                anims.append(
-                    self.squares[i][j].animate.set_fill(
-                        ManimColor.from_rgb(rgb_image[i, j]),
-                        opacity=1,
-                        # color_map[frame[i, j]], opacity=1
-                    )
-                    # self.squares[i][j].animate.set_fill(color_map[0], opacity=1)
-                    # self.squares[i][j].animate.set_fill(
-                    #     color_map[self.fire_states[0, i, j]], opacity=1
-                    # )
-                )
+        rgb_image = cells_to_image(self.data.states[0], landcover=landcover)
+
+        anims = self.grid.recolor(
+            np.arange(self.H * self.W), np.asarray(rgb_image).reshape(-1, 3)
+        )
 
         # set all initially to unburned
         #
@@ -269,8 +230,7 @@ class FireSpreadModule:
             veg_items.append(item)
         legend = VGroup(*veg_items).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         # Place legend to the right of the grid, aligned at the top
-        sq_group = VGroup(*[sq for row in self.squares for sq in row])
-        legend.next_to(sq_group, RIGHT, buff=1).align_to(sq_group, UP)
+        legend.next_to(self.grid, RIGHT, buff=1).align_to(self.grid, UP)
         self.scene.play(
             AnimationGroup(*anims, lag_ratio=0.1),
             Create(legend),  # Add legend
@@ -280,12 +240,9 @@ class FireSpreadModule:
         self.scene.next_slide()
 
         # set the initial fire
-        burning_cells = np.where(self.data.fire_states[0] == 1)
+        burning_cells = self.data.states[0] == 1
         self.scene.play(
-            *[
-                self.squares[i][j].animate.set_fill(color_map[1], opacity=1)
-                for i, j in zip(*burning_cells)
-            ],
+            *self.grid.recolor(burning_cells, palette[1]),
             run_time=0.5,
         )
         self.scene.wait(0.5)
@@ -326,31 +283,14 @@ class FireSpreadModule:
         self.scene.next_slide()
         self.reward_text = None  # Initialize reward text
         self.cumulative_reward = 0.0
-        for t in range(self.T):
+        # stream() yields the cells each step changed (read from the stored deltas)
+        for t, frame, changed in self.data.states.stream(1):
             print(t)
-            frame = self.data.fire_states[t]
-
-            if previous_frame is None:
-                # Initialize previous_frame on the first iteration
-                previous_frame = frame.copy()
-
-            # Check which states changed
-            # This is a simple optimization to avoid unnecessary animation
-
-            if previous_frame is not None and np.array_equal(frame, previous_frame):
+            if not changed.size:
                 # If the frame is the same as the previous one, skip animation
                 continue
 
-            i_idxs, j_idxs = np.where(previous_frame != frame)
-
-            previous_frame = frame.copy()
-
             self.scene.play(
-                *[
-                    self.squares[i][j].animate.set_fill(
-                        color_map[frame[i, j]], opacity=1
-                    )
-                    for i, j in zip(i_idxs, j_idxs)
-                ],
+                *self.grid.recolor(changed, palette[frame.reshape(-1)[changed]]),
                 run_time=0.1,
             )
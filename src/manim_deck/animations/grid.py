@@ -0,0 +1,333 @@
+"""Grids of square cells addressed by flat index, drawn to suit their size on screen.
+
+Grid modules (`FireSpreadModule`, `AirtankerModule`) used to keep their
+cells as ``list[list[Square]]`` and look them up one ``[i][j]`` at a time.
+A `CellGrid` is a single `VGroup` whose submobjects are the cells in
+row-major order, so the cells of a NumPy selection are addressed at once::
+
+    grid = CellGrid(80, 80, cell_size=0.05)
+    changed = np.flatnonzero(previous != current)     # flat indices
+    scene.play(*grid.recolor(changed, palette[current.reshape(-1)[changed]]))
+
+Vector cells only pay off while they are large on screen.  `cell_grid`
+measures a cell's footprint in pixels (`cell_pixels`, from the camera's
+``frame_width`` and the render quality's ``pixel_width``) and returns:
+
+- a `CellGrid` of vector squares when cells are at least
+  `VECTOR_MIN_PIXELS` wide, with the default stroke dropped when it would
+  be thinner than a pixel;
+- otherwise a `CellRaster`, one image with a pixel per cell, or per
+  2^k × 2^k block of cells (level *k* of a pyramid of averaged colours)
+  when cells are smaller than a pixel.
+
+Both have the same `recolor` / `fill` interface, so a module does not need
+to know which one it got.
+
+`recolor` only animates what changed: the changed squares of a `CellGrid`,
+or the tiles of a `CellRaster` that hold a changed cell.  Pinned to the
+scene's static background layer (`TemplateSlide.pin_to_background`), the
+rest of the grid is then rasterized once per ``play()``, and each frame
+only redraws those dirty cells or tiles, so its cost follows the number of
+changed cells rather than the grid area.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from manim import (
+    BLACK,
+    ORIGIN,
+    RESAMPLING_ALGORITHMS,
+    Group,
+    ImageMobject,
+    ManimColor,
+    Square,
+    UpdateFromAlphaFunc,
+    VGroup,
+    config,
+)
+
+from manim_deck.render.culling import STROKE_UNIT
+
+# cells narrower than this many pixels are drawn as a raster
+VECTOR_MIN_PIXELS = 8
+
+# side of a raster tile in image pixels: recolor() redraws only the tiles it touches
+RASTER_TILE = 32
+
+
+def _pixels_per_unit(camera=None) -> float:
+    if camera is None:
+        return config.pixel_width / config.frame_width
+    return camera.pixel_width / camera.frame_width
+
+
+def cell_pixels(cell_size: float, camera=None) -> float:
+    """Width in pixels of a cell of *cell_size* scene units (*camera* or the global config)."""
+    return cell_size * _pixels_per_unit(camera)
+
+
+def stroke_pixels(stroke_width: float, camera=None) -> float:
+    """Width in pixels of a stroke of *stroke_width*."""
+    return stroke_width * STROKE_UNIT * _pixels_per_unit(camera)
+
+
+def pyramid_level(pixels: float) -> int:
+    """Smallest level *k* at which a 2^k × 2^k block of *pixels*-wide cells covers a pixel."""
+    return 0 if pixels >= 1 else math.ceil(math.log2(1 / pixels))
+
+
+def to_rgba(colors, opacity: float = 1) -> np.ndarray:
+    """``(N, 4)`` float RGBA in 0–1 from colours, RGB(A) floats in 0–1 or ints in 0–255."""
+    array = np.asarray(colors)
+    if array.dtype.kind not in "fiu":
+        array = np.array([ManimColor(c).to_rgb() for c in np.ravel(colors)])
+    elif array.dtype.kind in "iu":
+        array = array / 255
+    array = np.atleast_2d(array).astype(np.float32)
+    if array.shape[-1] == 3:
+        alpha = np.full(array.shape[:-1] + (1,), opacity, dtype=np.float32)
+        array = np.concatenate([array, alpha], axis=-1)
+    return array.reshape(-1, 4)
+
+
+def downsample(rgba: np.ndarray, level: int) -> np.ndarray:
+    """Level *level* of the colour pyramid of a ``(rows, cols, 4)`` image.
+
+    Each level averages 2 × 2 blocks of the one below (alpha-weighted, edges
+    repeated to even size), so a block shows the mean colour of its cells.
+    """
+    premultiplied = np.concatenate([rgba[..., :3] * rgba[..., 3:], rgba[..., 3:]], axis=-1)
+    for _ in range(level):
+        rows, cols = premultiplied.shape[:2]
+        premultiplied = np.pad(premultiplied, ((0, rows % 2), (0, cols % 2), (0, 0)), "edge")
+        premultiplied = premultiplied.reshape(
+            premultiplied.shape[0] // 2, 2, premultiplied.shape[1] // 2, 2, 4
+        ).mean(axis=(1, 3))
+    rgb, alpha = premultiplied[..., :3], premultiplied[..., 3:]
+    rgb = np.divide(rgb, alpha, out=np.zeros_like(rgb), where=alpha > 0)
+    return np.concatenate([rgb, alpha], axis=-1)
+
+
+class _Cells:
+    """Indexing shared by the grid representations; cells are row-major."""
+
+    rows: int
+    cols: int
+    spacing: float
+
+    def positions(self) -> np.ndarray:
+        """``(rows * cols, 3)`` cell centres around the origin, row-major."""
+        i, j = np.divmod(np.arange(self.rows * self.cols), self.cols)
+        x = (j - (self.cols - 1) / 2) * self.spacing
+        y = ((self.rows - 1) / 2 - i) * self.spacing
+        return np.stack([x, y, np.zeros_like(x)], axis=1)
+
+    def flat_index(self, i, j) -> np.ndarray:
+        """Flat indices of the cells at rows *i* and columns *j* (arrays or ints)."""
+        return np.ravel_multi_index((i, j), (self.rows, self.cols))
+
+    def _flat(self, index) -> np.ndarray:
+        index = np.asarray(index)
+        if index.dtype == bool:
+            return np.flatnonzero(index)
+        return index.reshape(-1)
+
+
+class CellGrid(_Cells, VGroup):
+    """*rows* × *cols* squares of side *cell_size*, *spacing* apart, centred at *center*.
+
+    The default stroke (width 1) is dropped when it would be thinner than a
+    pixel on *camera* (the global config when None).  An explicit
+    *stroke_width* is kept, and widened to a pixel if it is thinner.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        cell_size: float,
+        *,
+        spacing: float | None = None,
+        stroke_color=BLACK,
+        stroke_width: float | None = None,
+        center=ORIGIN,
+        camera=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.rows, self.cols = rows, cols
+        self.cell_size = cell_size
+        self.spacing = cell_size if spacing is None else spacing
+        pixel = 1 / stroke_pixels(1, camera)  # stroke width of one pixel
+        if stroke_width is None:
+            stroke_width = 1 if pixel <= 1 else 0
+        elif stroke_width:
+            stroke_width = max(stroke_width, pixel)
+        template = Square(side_length=cell_size).set_stroke(stroke_color, width=stroke_width)
+        for position in self.positions() + np.asarray(center):
+            self.add(template.copy().move_to(position))
+
+    def cell(self, i: int, j: int) -> Square:
+        return self.submobjects[i * self.cols + j]
+
+    def cells(self, index) -> list[Square]:
+        """Cells at flat *index* (ints, a boolean ``(rows, cols)`` mask or flat indices)."""
+        return [self.submobjects[k] for k in self._flat(index)]
+
+    def window(self, i: int, j: int, radius: int) -> list[Square]:
+        """Cells within *radius* rows and columns of cell (*i*, *j*), clipped to the grid."""
+        rows = np.arange(max(0, i - radius), min(self.rows, i + radius + 1))
+        cols = np.arange(max(0, j - radius), min(self.cols, j + radius + 1))
+        return self.cells(self.flat_index(*np.meshgrid(rows, cols, indexing="ij")))
+
+    def recolor(self, index, colors, opacity: float = 1) -> list:
+        """Animations filling the cells at *index* with *colors* (one, or one per cell)."""
+        index = self._flat(index)
+        rgba = np.broadcast_to(to_rgba(colors, opacity), (len(index), 4))
+        return [
+            cell.animate.set_fill(ManimColor(c[:3]), opacity=float(c[3]))
+            for cell, c in zip(self.cells(index), rgba)
+        ]
+
+    def fill(self, colors, opacity: float = 1) -> CellGrid:
+        """Fill every cell with *colors* (one, or one per cell) at once."""
+        rgba = np.broadcast_to(to_rgba(colors, opacity), (len(self), 4))
+        for cell, c in zip(self.submobjects, rgba):
+            cell.set_fill(ManimColor(c[:3]), opacity=float(c[3]))
+        return self
+
+
+class CellRaster(_Cells, Group):
+    """*rows* × *cols* cells drawn as images with nearest-neighbour scaling.
+
+    At *level* k, each pixel of the image is the mean colour of a 2^k × 2^k
+    block of cells (see `downsample`).  With *tile*, the image is cut into
+    tiles of *tile* × *tile* pixels, and `recolor` only animates the tiles
+    that hold a changed cell.  Cells start transparent.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        cell_size: float,
+        *,
+        spacing: float | None = None,
+        level: int = 0,
+        tile: int | None = None,
+        center=ORIGIN,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.rows, self.cols = rows, cols
+        self.cell_size = cell_size
+        self.spacing = cell_size if spacing is None else spacing
+        self.level = level
+        self.colors = np.zeros((rows, cols, 4), dtype=np.float32)
+        # cells along one side of a tile
+        self.tile_cells = max(rows, cols) if tile is None else tile << level
+        self.tile_cols = -(-cols // self.tile_cells)
+        width = (cols - 1) * self.spacing + cell_size
+        height = (rows - 1) * self.spacing + cell_size
+        unit = np.array([width / cols, height / rows])
+        corner = np.asarray(center)[:2] + np.array([-width, height]) / 2
+        self._blocks = []
+        for r0 in range(0, rows, self.tile_cells):
+            for c0 in range(0, cols, self.tile_cells):
+                r1, c1 = min(rows, r0 + self.tile_cells), min(cols, c0 + self.tile_cells)
+                image = ImageMobject(
+                    self._pixels(r0, r1, c0, c1), scale_to_resolution=config.pixel_height
+                )
+                image.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+                image.stretch_to_fit_width((c1 - c0) * unit[0])
+                image.stretch_to_fit_height((r1 - r0) * unit[1])
+                x, y = corner + np.array([(c0 + c1) / 2, -(r0 + r1) / 2]) * unit
+                image.move_to([x, y, 0])
+                self.add(image)
+                self._blocks.append((r0, r1, c0, c1))
+
+    @property
+    def tiles(self) -> list[ImageMobject]:
+        return self.submobjects
+
+    def _pixels(self, r0: int, r1: int, c0: int, c1: int) -> np.ndarray:
+        rgba = self.colors[r0:r1, c0:c1]
+        if self.level:
+            rgba = downsample(rgba, self.level)
+        return np.round(rgba * 255).astype(np.uint8)
+
+    def _refresh(self, k: int, rows: np.ndarray, cols: np.ndarray) -> None:
+        r0, r1, c0, c1 = self._blocks[k]
+        image = self.submobjects[k]
+        if self.level:
+            image.pixel_array = self._pixels(r0, r1, c0, c1)
+        else:
+            rgba = self.colors[rows, cols]
+            image.pixel_array[rows - r0, cols - c0] = np.round(rgba * 255).astype(np.uint8)
+
+    def dirty_tiles(self, index) -> np.ndarray:
+        """Tile of each cell at flat *index* (positions in `tiles`)."""
+        rows, cols = np.divmod(self._flat(index), self.cols)
+        return rows // self.tile_cells * self.tile_cols + cols // self.tile_cells
+
+    def recolor(self, index, colors, opacity: float = 1) -> list:
+        """One animation per dirty tile, blending the cells at *index* to *colors*."""
+        index = self._flat(index)
+        target = np.broadcast_to(to_rgba(colors, opacity), (len(index), 4))
+        tiles = self.dirty_tiles(index)
+        order = np.argsort(tiles, kind="stable")
+        bounds = np.flatnonzero(np.diff(tiles[order])) + 1
+        return [
+            self._blend(int(tiles[part[0]]), index[part], target[part])
+            for part in np.split(order, bounds)
+            if len(part)
+        ]
+
+    def _blend(self, k: int, index: np.ndarray, target: np.ndarray):
+        rows, cols = np.divmod(index, self.cols)
+        start = None
+
+        def update(image, alpha):
+            nonlocal start
+            if start is None:
+                start = self.colors[rows, cols].copy()
+            self.colors[rows, cols] = start + (target - start) * alpha
+            self._refresh(k, rows, cols)
+
+        return UpdateFromAlphaFunc(self.submobjects[k], update)
+
+    def fill(self, colors, opacity: float = 1) -> CellRaster:
+        """Fill every cell with *colors* (one, or one per cell) at once."""
+        rgba = np.broadcast_to(to_rgba(colors, opacity), (self.rows * self.cols, 4))
+        self.colors[:] = rgba.reshape(self.colors.shape)
+        for image, block in zip(self.submobjects, self._blocks):
+            image.pixel_array = self._pixels(*block)
+        return self
+
+
+def cell_grid(
+    rows: int,
+    cols: int,
+    cell_size: float,
+    *,
+    lod: str = "auto",
+    camera=None,
+    tile: int | None = RASTER_TILE,
+    **kwargs,
+) -> CellGrid | CellRaster:
+    """A `CellGrid` or `CellRaster`, whichever suits the cells' size on *camera*.
+
+    *lod* is ``"auto"``, ``"vector"`` or ``"raster"``.  Stroke keywords only
+    apply to vector cells, *tile* only to rasters.
+    """
+    pixels = cell_pixels(cell_size, camera)
+    if lod not in ("auto", "vector", "raster"):
+        raise ValueError(f"lod must be 'auto', 'vector' or 'raster', got {lod!r}")
+    if lod == "vector" or (lod == "auto" and pixels >= VECTOR_MIN_PIXELS):
+        return CellGrid(rows, cols, cell_size, camera=camera, **kwargs)
+    kwargs.pop("stroke_color", None)
+    kwargs.pop("stroke_width", None)
+    return CellRaster(rows, cols, cell_size, level=pyramid_level(pixels), tile=tile, **kwargs)
@@ -0,0 +1,391 @@
+"""Compact storage for grid simulation rollouts.
+
+A rollout of a grid simulation (e.g. the wildfire model played back by
+`FireSpreadModule`) is a stack of ``(T, H, W)`` cell states plus per-cell
+fields such as wind or vegetation.  Kept as full-precision arrays, a
+1000-step 512×512 rollout takes gigabytes.  `SimulationHistory` stores it as
+a struct of arrays with narrow dtypes instead:
+
+- cell states as ``uint8``, optionally bit-packed (`PackedStates`, 2 bits
+  per cell), run-length encoded per step (`RunLengthStates`), or as a
+  keyframe every K steps plus the cells each step changes (`DeltaStates`);
+- continuous fields as ``float16``, categorical ones as ``uint8``;
+- fields that do not change over time (or space) collapsed to a single step
+  (or cell) that broadcasts against ``(T, H, W)``.
+
+Every encoding gives random access to a step: ``history.states[t]`` decodes
+step *t* only.  ``history.states.stream()`` walks the steps in order and
+yields the cells each step changed, which is what playback animates.  This
+module only needs NumPy.
+
+Usage
+-----
+>>> history = SimulationHistory.from_arrays(fire_states, encoding="rle", wind_speed=speed)
+>>> history.save("data/rollout.npz")
+>>> history = SimulationHistory.load("data/rollout.npz")
+>>> history.states[10]          # (H, W) uint8 states of step 10
+>>> for t, frame, changed in history.states.stream(1):
+...     recolor(changed, frame.reshape(-1)[changed])
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+ENCODINGS = ("raw", "packed", "rle", "delta")
+
+# steps between two keyframes of `DeltaStates`
+KEYFRAME_INTERVAL = 32
+
+
+class _States:
+    """Shared interface of the state encodings: ``len``, ``[t]`` and `stream`."""
+
+    shape: tuple[int, int, int]
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def stream(self, start: int = 0):
+        """Yield ``(t, frame, changed)`` for steps *start* … T - 1 in order.
+
+        *changed* holds the flat indices of the cells that differ from step
+        ``t - 1`` (every cell for step 0).  *frame* may be a buffer that the
+        next step overwrites; copy it to keep it.
+        """
+        previous = self[start - 1] if start else None
+        for t in range(start, len(self)):
+            frame = self[t]
+            if previous is None:
+                changed = np.arange(frame.size)
+            else:
+                changed = np.flatnonzero(previous != frame)
+            previous = frame
+            yield t, frame, changed
+
+
+class RawStates(_States):
+    """``(T, H, W)`` uint8 states, one byte per cell."""
+
+    encoding = "raw"
+
+    def __init__(self, states: np.ndarray):
+        self.data = np.ascontiguousarray(states, dtype=np.uint8)
+        self.shape = self.data.shape
+
+    def __getitem__(self, t: int) -> np.ndarray:
+        return self.data[t]
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        return {"data": self.data}
+
+    @classmethod
+    def from_arrays(cls, shape, arrays: dict) -> RawStates:
+        return cls(arrays["data"].reshape(shape))
+
+
+class PackedStates(_States):
+    """States below 4 packed 2 bits per cell: a quarter of `RawStates`."""
+
+    encoding = "packed"
+
+    def __init__(self, states: np.ndarray):
+        states = np.asarray(states)
+        if states.size and states.max() > 3:
+            raise ValueError("PackedStates holds states 0-3 only; use RawStates")
+        self.shape = states.shape
+        flat = states.reshape(len(states), -1).astype(np.uint8)
+        pad = -flat.shape[1] % 4
+        flat = np.pad(flat, ((0, 0), (0, pad)))
+        self.data = flat[:, 0::4] | flat[:, 1::4] << 2 | flat[:, 2::4] << 4 | flat[:, 3::4] << 6
+
+    def __getitem__(self, t: int) -> np.ndarray:
+        packed = self.data[t]
+        cells = np.stack([(packed >> shift) & 3 for shift in (0, 2, 4, 6)], axis=-1)
+        return cells.reshape(-1)[: self.shape[1] * self.shape[2]].reshape(self.shape[1:])
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        return {"data": self.data}
+
+    @classmethod
+    def from_arrays(cls, shape, arrays: dict) -> PackedStates:
+        states = cls.__new__(cls)
+        states.shape, states.data = tuple(shape), arrays["data"]
+        return states
+
+
+class RunLengthStates(_States):
+    """Each step stored as runs of equal states along the row-major cells.
+
+    Attributes:
+        values:  uint8 state of every run, all steps concatenated.
+        lengths: uint32 length of every run.
+        offsets: int64 index of the first run of each step (T + 1 entries).
+    """
+
+    encoding = "rle"
+
+    def __init__(self, states: np.ndarray):
+        states = np.asarray(states, dtype=np.uint8)
+        self.shape = states.shape
+        T = len(states)
+        flat = states.reshape(T, -1)
+        n = flat.shape[1]
+        # a run starts at every cell that differs from its left neighbour, and every row start
+        starts = np.ones(flat.shape, dtype=bool)
+        starts[:, 1:] = flat[:, 1:] != flat[:, :-1]
+        rows, cols = np.nonzero(starts)
+        ends = np.append(cols[1:], n)
+        ends[np.append(rows[1:] != rows[:-1], True)] = n
+        self.values = flat[rows, cols]
+        self.lengths = (ends - cols).astype(np.uint32)
+        self.offsets = np.searchsorted(rows, np.arange(T + 1)).astype(np.int64)
+
+    def __getitem__(self, t: int) -> np.ndarray:
+        t = range(len(self))[t]
+        a, b = self.offsets[t], self.offsets[t + 1]
+        return np.repeat(self.values[a:b], self.lengths[a:b]).reshape(self.shape[1:])
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes + self.lengths.nbytes + self.offsets.nbytes
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        return {"values": self.values, "lengths": self.lengths, "offsets": self.offsets}
+
+    @classmethod
+    def from_arrays(cls, shape, arrays: dict) -> RunLengthStates:
+        states = cls.__new__(cls)
+        states.shape = tuple(shape)
+        states.values, states.lengths, states.offsets = (
+            arrays["values"],
+            arrays["lengths"],
+            arrays["offsets"],
+        )
+        return states
+
+
+class DeltaStates(_States):
+    """A keyframe every *interval* steps, plus the cells every step changed.
+
+    Seeking to step *t* copies the keyframe before it and applies at most
+    *interval* steps of deltas, whatever the length of the rollout.
+
+    Attributes:
+        keyframes: ``(ceil(T / interval), H * W)`` uint8 states of steps
+                   0, interval, 2 × interval, ….
+        index:     uint32 flat index of every changed cell, all steps concatenated.
+        values:    uint8 new state of every changed cell.
+        offsets:   int64 index of the first change of each step (T + 1 entries;
+                   step 0 has none).
+        interval:  Steps between two keyframes.
+    """
+
+    encoding = "delta"
+
+    def __init__(self, states: np.ndarray, interval: int = KEYFRAME_INTERVAL):
+        if interval < 1:
+            raise ValueError(f"interval must be at least 1, got {interval}")
+        states = np.asarray(states, dtype=np.uint8)
+        self.shape = states.shape
+        self.interval = interval
+        flat = states.reshape(len(states), -1)
+        self.keyframes = flat[::interval].copy()
+        steps, cells = np.nonzero(flat[1:] != flat[:-1])
+        self.index = cells.astype(np.uint32)
+        self.values = flat[1:][steps, cells]
+        self.offsets = np.searchsorted(steps + 1, np.arange(len(states) + 1)).astype(np.int64)
+
+    def changes(self, t: int) -> tuple[np.ndarray, np.ndarray]:
+        """Flat indices and new states of the cells step *t* changed."""
+        a, b = self.offsets[t], self.offsets[t + 1]
+        return self.index[a:b], self.values[a:b]
+
+    def __getitem__(self, t: int) -> np.ndarray:
+        t = range(len(self))[t]
+        key = t // self.interval
+        frame = self.keyframes[key].copy()
+        a, b = self.offsets[key * self.interval + 1], self.offsets[t + 1]
+        if b > a:
+            # a cell may change several times since the keyframe: keep its last state
+            cells, last = np.unique(self.index[a:b][::-1], return_index=True)
+            frame[cells] = self.values[a:b][::-1][last]
+        return frame.reshape(self.shape[1:])
+
+    def stream(self, start: int = 0):
+        """Like `_States.stream`, but reads the stored deltas instead of diffing steps."""
+        if start >= len(self):
+            return
+        frame = self[start].reshape(-1)
+        changed = self.changes(start)[0] if start else np.arange(frame.size)
+        yield start, frame.reshape(self.shape[1:]), changed
+        for t in range(start + 1, len(self)):
+            changed, values = self.changes(t)
+            frame[changed] = values
+            yield t, frame.reshape(self.shape[1:]), changed
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self.arrays().values())
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        return {
+            "keyframes": self.keyframes,
+            "index": self.index,
+            "values": self.values,
+            "offsets": self.offsets,
+            "interval": np.array(self.interval),
+        }
+
+    @classmethod
+    def from_arrays(cls, shape, arrays: dict) -> DeltaStates:
+        states = cls.__new__(cls)
+        states.shape = tuple(shape)
+        states.interval = int(arrays["interval"])
+        states.keyframes, states.index, states.values, states.offsets = (
+            arrays["keyframes"],
+            arrays["index"],
+            arrays["values"],
+            arrays["offsets"],
+        )
+        return states
+
+
+_STATE_CLASSES = {
+    cls.encoding: cls for cls in (RawStates, PackedStates, RunLengthStates, DeltaStates)
+}
+
+
+def encode_states(states: np.ndarray, encoding: str = "raw", **options):
+    """Encode ``(T, H, W)`` cell states (see `ENCODINGS`).
+
+    *options* go to the encoding's class, e.g. ``interval`` for ``"delta"``.
+    """
+    try:
+        cls = _STATE_CLASSES[encoding]
+    except KeyError:
+        raise ValueError(f"encoding must be one of {ENCODINGS}, got {encoding!r}") from None
+    return cls(states, **options)
+
+
+def compact_field(values, shape: tuple[int, int, int], dtype) -> np.ndarray:
+    """*values* as *dtype*, with axes that are constant collapsed to length 1.
+
+    The result broadcasts against *shape* (``(T, H, W)``), so ``field[t]``
+    and ``np.broadcast_to(field, shape)`` keep working.
+    """
+    array = np.asarray(values)
+    array = array.reshape(array.shape + (1,) * (3 - array.ndim)) if array.ndim < 3 else array
+    np.broadcast_shapes(array.shape, shape)  # raises on a mismatch
+    for axis in range(3):
+        if array.shape[axis] > 1:
+            first = np.take(array, [0], axis=axis)
+            if np.array_equal(array, np.broadcast_to(first, array.shape)):
+                array = first
+    return np.ascontiguousarray(array, dtype=dtype)
+
+
+# field name → storage dtype
+FIELD_DTYPES = {
+    "wind_direction": np.float16,
+    "wind_speed": np.float16,
+    "landcover": np.uint8,
+    "vegetation_canopy": np.float16,
+    "vegetation_density": np.float16,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationHistory:
+    """A rollout of a grid simulation as a struct of compact arrays.
+
+    Attributes:
+        states: Encoded ``(T, H, W)`` cell states; ``states[t]`` is one step.
+        fields: Per-cell fields by name, each broadcasting against ``(T, H, W)``
+                (see `compact_field`).
+    """
+
+    states: RawStates | PackedStates | RunLengthStates | DeltaStates
+    fields: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        states: np.ndarray,
+        *,
+        encoding: str = "raw",
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+        **fields,
+    ) -> SimulationHistory:
+        """Compact full-size arrays; *fields* use the dtypes in `FIELD_DTYPES`.
+
+        *keyframe_interval* only applies to the ``"delta"`` encoding.
+        """
+        states = np.asarray(states)
+        shape = states.shape
+        options = {"interval": keyframe_interval} if encoding == "delta" else {}
+        return cls(
+            encode_states(states, encoding, **options),
+            {
+                name: compact_field(values, shape, FIELD_DTYPES.get(name, np.float16))
+                for name, values in fields.items()
+                if values is not None
+            },
+        )
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return tuple(self.states.shape)
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        if name == "fields":  # not set yet (e.g. while unpickling)
+            raise AttributeError(name)
+        try:
+            return self.fields[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    @property
+    def nbytes(self) -> int:
+        return self.states.nbytes + sum(a.nbytes for a in self.fields.values())
+
+    def save(self, path: str | Path) -> None:
+        arrays = {f"states_{k}": v for k, v in self.states.arrays().items()}
+        arrays.update({f"field_{k}": v for k, v in self.fields.items()})
+        np.savez(
+            path,
+            encoding=np.array(self.states.encoding),
+            shape=np.array(self.shape),
+            **arrays,
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> SimulationHistory:
+        with np.load(path) as data:
+            encoding = str(data["encoding"])
+            arrays = {
+                key.removeprefix("states_"): data[key]
+                for key in data.files
+                if key.startswith("states_")
+            }
+            fields = {
+                key.removeprefix("field_"): data[key]
+                for key in data.files
+                if key.startswith("field_")
+            }
+            states = _STATE_CLASSES[encoding].from_arrays(tuple(data["shape"]), arrays)
+        return cls(states, fields)
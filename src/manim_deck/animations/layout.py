@@ -0,0 +1,214 @@
+"""Layered (Sugiyama-style) layout for DAG diagrams.
+
+`layered_layout` places the nodes of a directed acyclic graph in layers from
+left to right:
+
+1. Longest-path layering: every edge points to a later layer.
+2. Edges spanning several layers are split by dummy nodes, which later become
+   the bends of the edge.
+3. Crossing minimisation: alternating down/up barycenter sweeps reorder every
+   layer by the mean position of its neighbours in the previous layer.
+4. Coordinates: each node is pulled towards the barycenter of its parents,
+   keeping at least one slot between nodes of the same layer.
+
+Sweeps sort each layer, so a layout costs O((V + E) log V) per sweep for
+V nodes (dummies included) and E edges; a 100-node diagram lays out in a few
+milliseconds.  Layouts depend only on the graph structure, not on labels,
+sizes or colours, and are cached in memory and optionally on disk
+(``<cache_dir>/<key>.json``), so re-renders and theme changes reuse them.
+
+Usage
+-----
+>>> from manim_deck.animations.layout import cached_layout
+>>> layout = cached_layout(4, [(0, 1), (0, 2), (1, 3), (2, 3)])
+>>> layout.layers, layout.slots
+([0, 1, 1, 2], [0.0, -0.5, 0.5, 0.0])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+LAYOUT_VERSION = 1
+MEMORY_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class Layout:
+    """Layer and in-layer position of every node, in grid units.
+
+    Attributes:
+        layers: Layer (column) of each node.
+        slots:  Position of each node within its layer, centred on 0.
+        routes: For edges spanning several layers, the (layer, slot) points of
+                their bends, keyed by ``"from-to"``.
+    """
+
+    layers: list[int]
+    slots: list[float]
+    routes: dict[str, list[tuple[int, float]]] = field(default_factory=dict)
+
+    def route(self, a: int, b: int) -> list[tuple[int, float]]:
+        return self.routes.get(f"{a}-{b}", [])
+
+    def to_dict(self) -> dict:
+        return {
+            "version": LAYOUT_VERSION,
+            "layers": self.layers,
+            "slots": self.slots,
+            "routes": {k: [list(p) for p in v] for k, v in self.routes.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Layout:
+        return cls(
+            layers=list(data["layers"]),
+            slots=list(data["slots"]),
+            routes={k: [tuple(p) for p in v] for k, v in data["routes"].items()},
+        )
+
+
+def graph_key(n: int, edges) -> str:
+    """Hash of the graph structure (node count and edge set)."""
+    data = json.dumps([LAYOUT_VERSION, n, sorted({(int(a), int(b)) for a, b in edges})])
+    return hashlib.sha1(data.encode()).hexdigest()[:20]
+
+
+def _longest_path_layers(n: int, edges: list[tuple[int, int]]) -> list[int]:
+    children: list[list[int]] = [[] for _ in range(n)]
+    indegree = [0] * n
+    for a, b in edges:
+        children[a].append(b)
+        indegree[b] += 1
+    layer = [0] * n
+    queue = [i for i in range(n) if indegree[i] == 0]
+    seen = 0
+    while queue:
+        node = queue.pop()
+        seen += 1
+        for child in children[node]:
+            layer[child] = max(layer[child], layer[node] + 1)
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                queue.append(child)
+    if seen != n:
+        raise ValueError("layered layout needs an acyclic graph")
+    return layer
+
+
+def _barycenter_sweeps(
+    ranks: list[list[int]], up: list[list[int]], down: list[list[int]], sweeps: int
+) -> None:
+    """Reorder *ranks* in place to reduce crossings."""
+    pos = {node: i for rank in ranks for i, node in enumerate(rank)}
+    for sweep in range(sweeps):
+        forward = sweep % 2 == 0
+        order = range(1, len(ranks)) if forward else range(len(ranks) - 2, -1, -1)
+        neighbours = up if forward else down
+        for r in order:
+            rank = ranks[r]
+
+            def barycenter(node: int) -> float:
+                adj = neighbours[node]
+                return sum(pos[m] for m in adj) / len(adj) if adj else pos[node]
+
+            rank.sort(key=lambda node: (barycenter(node), pos[node]))
+            for i, node in enumerate(rank):
+                pos[node] = i
+
+
+def _assign_slots(ranks: list[list[int]], up: list[list[int]], total: int) -> list[float]:
+    """In-layer coordinates: near the parents' mean, at least 1 apart, centred."""
+    slot = [0.0] * total
+    for r, rank in enumerate(ranks):
+        if r == 0:
+            desired = [float(i) for i in range(len(rank))]
+        else:
+            desired = [
+                sum(slot[p] for p in up[node]) / len(up[node]) if up[node] else float(i)
+                for i, node in enumerate(rank)
+            ]
+        placed: list[float] = []
+        for want in desired:
+            placed.append(max(want, placed[-1] + 1) if placed else want)
+        # pull back so the layer sits on its desired positions on average
+        shift = (sum(desired) - sum(placed)) / len(placed)
+        for node, y in zip(rank, placed):
+            slot[node] = y + shift
+    return slot
+
+
+def layered_layout(n: int, edges, *, sweeps: int = 4) -> Layout:
+    """Compute a layered layout of the DAG with *n* nodes and *edges* (uncached)."""
+    edges = sorted({(int(a), int(b)) for a, b in edges})
+    layer = _longest_path_layers(n, edges)
+
+    # split long edges into chains through dummy nodes
+    layer_of = list(layer)
+    up: list[list[int]] = [[] for _ in range(n)]
+    down: list[list[int]] = [[] for _ in range(n)]
+    chains: dict[str, list[int]] = {}
+    for a, b in edges:
+        prev = a
+        chain = []
+        for rank in range(layer[a] + 1, layer[b]):
+            dummy = len(layer_of)
+            layer_of.append(rank)
+            up.append([prev])
+            down.append([])
+            down[prev].append(dummy)
+            chain.append(dummy)
+            prev = dummy
+        up[b].append(prev)
+        down[prev].append(b)
+        if chain:
+            chains[f"{a}-{b}"] = chain
+
+    ranks: list[list[int]] = [[] for _ in range(max(layer_of, default=-1) + 1)]
+    for node, rank in enumerate(layer_of):
+        ranks[rank].append(node)
+    _barycenter_sweeps(ranks, up, down, sweeps)
+    slot = _assign_slots(ranks, up, len(layer_of))
+
+    centre = (min(slot, default=0.0) + max(slot, default=0.0)) / 2
+    slot = [round(y - centre, 6) for y in slot]
+    return Layout(
+        layers=layer,
+        slots=slot[:n],
+        routes={key: [(layer_of[d], slot[d]) for d in chain] for key, chain in chains.items()},
+    )
+
+
+_memory: OrderedDict[str, Layout] = OrderedDict()
+
+
+def cached_layout(n: int, edges, cache_dir: str | Path | None = None) -> Layout:
+    """`layered_layout`, cached in memory and (if given) in *cache_dir*."""
+    key = graph_key(n, edges)
+    if key in _memory:
+        _memory.move_to_end(key)
+        return _memory[key]
+
+    layout = None
+    path = Path(cache_dir) / f"{key}.json" if cache_dir is not None else None
+    if path is not None and path.is_file():
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == LAYOUT_VERSION:
+                layout = Layout.from_dict(data)
+        except (OSError, ValueError, KeyError):
+            layout = None
+    if layout is None:
+        layout = layered_layout(n, edges)
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(layout.to_dict()), encoding="utf-8")
+
+    _memory[key] = layout
+    if len(_memory) > MEMORY_CACHE_SIZE:
+        _memory.popitem(last=False)
+    return layout
@@ -1,21 +1,85 @@
 """Pipeline diagram animation module.
 
-Draws a horizontal pipeline of labelled boxes connected by arrows, then
-optionally pulses through them one-by-one to illustrate data flow.
+Draws a pipeline of labelled boxes connected by arrows, then optionally
+pulses through them one-by-one to illustrate data flow.  Long pipelines can
+be wrapped into several rows, and ``edges`` turns the chain into a branching
+DAG, laid out in layers by `manim_deck.animations.layout` (cached by graph
+structure, so re-renders and theme changes skip the layout).
+
+Box and label geometry is built once and copied for every step, so
+pipelines with dozens of stages stay cheap to construct.  With
+``pulse="travel"`` the pulse is a single highlight that travels along the
+pipeline in one animation, instead of two animations and a slide per step.
 
 Usage
 -----
 >>> from manim_deck.animations.pipeline import PipelineModule
 >>> PipelineModule(slide, steps=["Data", "Model", "Train", "Evaluate"]).run()
+>>> PipelineModule(slide, steps=[f"Stage {i}" for i in range(60)], rows=5,
+...                pulse="travel").run()
+>>> PipelineModule(slide, steps=["Load", "Clean", "Augment", "Train"],
+...                edges=[(0, 1), (0, 2), (1, 3), (2, 3)]).run()
 """
 
 from __future__ import annotations
 
-from manim import *
+import math
+
+import numpy as np
+from manim import (
+    BLUE,
+    GREEN,
+    LEFT,
+    ORANGE,
+    RED,
+    RIGHT,
+    TEAL,
+    UP,
+    WHITE,
+    YELLOW,
+    Arrow,
+    Create,
+    FadeIn,
+    FadeOut,
+    GrowArrow,
+    LaggedStart,
+    Mobject,
+    RoundedRectangle,
+    Text,
+    VGroup,
+    VMobject,
+    ValueTracker,
+    interpolate,
+    linear,
+    normalize,
+    smooth,
+)
+
+from manim_deck.animations.layout import cached_layout
+
+PULSE_MODES = (False, True, "travel")
+LAYOUTS = ("auto", "grid", "layered")
+PALETTE = [BLUE, GREEN, YELLOW, RED, TEAL, ORANGE]
 
 
 class PipelineModule:
-    """Animated left-to-right pipeline."""
+    """Animated pipeline: a left-to-right chain, wrapped rows or a DAG.
+
+    Args:
+        steps:      Box labels.
+        colors:     One colour per step (default: cycles through `PALETTE`).
+        box_width:  Width of every box.
+        box_height: Height of every box.
+        pulse:      False, True (highlight each box on its own slide) or
+                    "travel" (one highlight travelling through all boxes).
+        rows:       Wrap the boxes into this many rows (snaking left/right).
+        edges:      (from, to) step indices; defaults to a chain.
+        layout:     "grid" (rows of boxes), "layered" (DAG layers from left to
+                    right) or "auto" (layered when `edges` is given).
+        font_size:  Label font size.
+        buff:       Gap between neighbouring boxes.
+        step_time:  Time the travelling highlight spends per box.
+    """
 
     def __init__(
         self,
@@ -25,53 +89,185 @@ class PipelineModule:
         colors: list[str] | None = None,
         box_width: float = 1.8,
         box_height: float = 1.0,
-        pulse: bool = True,
+        pulse: bool | str = True,
+        rows: int = 1,
+        edges: list[tuple[int, int]] | None = None,
+        layout: str = "auto",
+        font_size: float = 22,
+        buff: float = 1.0,
+        step_time: float = 0.5,
     ):
+        if pulse not in PULSE_MODES:
+            raise ValueError(f"pulse must be one of {PULSE_MODES}, got {pulse!r}")
+        if layout not in LAYOUTS:
+            raise ValueError(f"layout must be one of {LAYOUTS}, got {layout!r}")
         self.slide = slide
         self.steps = steps
-        self.colors = colors or [BLUE, GREEN, YELLOW, RED, TEAL, ORANGE][: len(steps)]
+        self.colors = colors or [PALETTE[i % len(PALETTE)] for i in range(len(steps))]
         self.box_width = box_width
         self.box_height = box_height
         self.pulse = pulse
+        self.rows = max(1, min(rows, len(steps)))
+        self.edges = (
+            [(i, i + 1) for i in range(len(steps) - 1)]
+            if edges is None
+            else [(int(a), int(b)) for a, b in edges]
+        )
+        for a, b in self.edges:
+            if not (0 <= a < len(steps) and 0 <= b < len(steps)) or a == b:
+                raise ValueError(f"invalid edge ({a}, {b}) for {len(steps)} steps")
+        if layout == "auto":
+            layout = "grid" if edges is None else "layered"
+        self.layout = layout
+        self.font_size = font_size
+        self.buff = buff
+        self.step_time = step_time
 
-    def run(self):
-        s = self.slide
+    # ── layout
+
+    def order(self) -> list[int]:
+        """Steps in topological order (ties broken by index)."""
+        n = len(self.steps)
+        indegree = [0] * n
+        children: list[list[int]] = [[] for _ in range(n)]
+        for a, b in self.edges:
+            children[a].append(b)
+            indegree[b] += 1
+        ready = [i for i in range(n) if indegree[i] == 0]
+        order = []
+        while ready:
+            ready.sort(reverse=True)
+            node = ready.pop()
+            order.append(node)
+            for child in children[node]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+        if len(order) != n:
+            raise ValueError("pipeline edges must not contain cycles")
+        return order
+
+    def positions(self) -> tuple[np.ndarray, dict[tuple[int, int], list[np.ndarray]]]:
+        """Box centres and the bend points of edges that skip layers."""
+        if self.layout == "layered":
+            return self._layered_positions()
+        return self._grid_positions(), {}
+
+    def _layered_positions(self):
+        config = getattr(self.slide, "deck_config", None)
+        cache_dir = config.cache_path("layouts") if config is not None else None
+        layout = cached_layout(len(self.steps), self.edges, cache_dir)
+        dx = self.box_width + self.buff
+        dy = self.box_height + self.buff / 2
+
+        def point(layer: int, slot: float) -> np.ndarray:
+            return np.array([layer * dx, -slot * dy, 0.0])
+
+        centres = np.array([point(*p) for p in zip(layout.layers, layout.slots)])
+        offset = (centres.min(axis=0) + centres.max(axis=0)) / 2
+        bends = {
+            (a, b): [point(*p) - offset for p in layout.route(a, b)] for a, b in self.edges
+        }
+        return centres - offset, bends
+
+    def _grid_positions(self) -> np.ndarray:
+        """Box centres, row by row, every other row right-to-left."""
+        n = len(self.steps)
+        cols = math.ceil(n / self.rows)
+        centres = np.zeros((n, 3))
+        for i in range(n):
+            row, col = divmod(i, cols)
+            if row % 2:
+                col = cols - 1 - col
+            centres[i, 0] = col * (self.box_width + self.buff)
+            centres[i, 1] = -row * (self.box_height + self.buff)
+        return centres - (centres.min(axis=0) + centres.max(axis=0)) / 2
+
+    @staticmethod
+    def _edge_points(a: Mobject, b: Mobject, buff: float = 0.1):
+        """Points on the facing sides of boxes *a* and *b*, pulled in by *buff*."""
+        dx, dy, _ = b.get_center() - a.get_center()
+        if abs(dx) * a.height >= abs(dy) * a.width:
+            start, end = (a.get_right(), b.get_left()) if dx > 0 else (a.get_left(), b.get_right())
+        else:
+            start, end = (a.get_bottom(), b.get_top()) if dy < 0 else (a.get_top(), b.get_bottom())
+        direction = normalize(end - start)
+        return start + direction * buff, end - direction * buff
+
+    def build(self) -> VGroup:
+        """Create the boxes and arrows (without adding them to the scene)."""
+        template = RoundedRectangle(
+            width=self.box_width,
+            height=self.box_height,
+            corner_radius=0.15,
+            fill_opacity=0.2,
+        )
+        labels = {
+            label: Text(label, font_size=self.font_size, color=WHITE)
+            for label in dict.fromkeys(self.steps)
+        }
+
+        centres, bends = self.positions()
         boxes = VGroup()
-        for label, col in zip(self.steps, self.colors):
-            box = RoundedRectangle(
-                width=self.box_width,
-                height=self.box_height,
-                corner_radius=0.15,
-                fill_color=col,
-                fill_opacity=0.2,
-                stroke_color=col,
-            )
-            txt = Text(label, font_size=22, color=WHITE)
+        for label, col, centre in zip(self.steps, self.colors, centres):
+            box = template.copy().set_fill(col, opacity=0.2).set_stroke(col).move_to(centre)
+            txt = labels[label].copy().move_to(centre)
             boxes.add(VGroup(box, txt))
-        boxes.arrange(RIGHT, buff=1.0)
+
+        def arrow(start, end):
+            # built per edge: Arrow scales its tip to its own length
+            return Arrow(start, end, color=WHITE, buff=0, stroke_width=2)
 
         arrows = VGroup()
-        for i in range(len(boxes) - 1):
-            arr = Arrow(
-                boxes[i][0].get_right(),
-                boxes[i + 1][0].get_left(),
-                color=WHITE,
-                buff=0.1,
-                stroke_width=2,
-            )
-            arrows.add(arr)
+        for a, b in self.edges:
+            route = bends.get((a, b))
+            if not route:
+                start, end = self._edge_points(boxes[a][0], boxes[b][0])
+                arrows.add(arrow(start, end))
+                continue
+            start = boxes[a][0].get_right() + RIGHT * 0.1
+            end = boxes[b][0].get_left() + LEFT * 0.1
+            path = VMobject(stroke_color=WHITE, stroke_width=2)
+            path.set_points_as_corners([start, *route])
+            arrows.add(VGroup(path, arrow(route[-1], end)))
+
+        diagram = VGroup(boxes, arrows)
+        frame = self.slide.camera
+        if diagram.width > frame.frame_width - 1:
+            diagram.scale_to_fit_width(frame.frame_width - 1)
+        if diagram.height > frame.frame_height - 2:
+            diagram.scale_to_fit_height(frame.frame_height - 2)
+
+        self.boxes = boxes
+        self.arrows = arrows
+        self.mobject = diagram
+        return diagram
+
+    # ── animation
+
+    def run(self):
+        s = self.slide
+        self.build()
+        boxes, arrows = self.boxes, self.arrows
 
         s.play(
             LaggedStart(*[FadeIn(b, shift=UP * 0.3) for b in boxes], lag_ratio=0.15),
             run_time=1.0,
         )
-        s.play(
-            LaggedStart(*[GrowArrow(a) for a in arrows], lag_ratio=0.15),
-            run_time=0.6,
-        )
+        if len(arrows):
+            s.play(
+                LaggedStart(
+                    *[GrowArrow(a) if isinstance(a, Arrow) else Create(a) for a in arrows],
+                    lag_ratio=0.15,
+                ),
+                run_time=0.6,
+            )
 
-        if self.pulse:
-            for box in boxes:
+        if self.pulse == "travel":
+            self._travel()
+        elif self.pulse:
+            for i in self.order():
+                box = boxes[i]
                 s.play(
                     box[0].animate.set_fill(opacity=0.6).set_stroke(width=4),
                     run_time=0.25,
@@ -81,3 +277,33 @@ class PipelineModule:
                     box[0].animate.set_fill(opacity=0.2).set_stroke(width=2),
                     run_time=0.25,
                 )
+
+    def _travel(self):
+        """Move one highlight through the boxes in topological order."""
+        s = self.slide
+        order = self.order()
+        frames = [self.boxes[i][0] for i in order]
+        centres = np.array([f.get_center() for f in frames])
+        highlight = frames[0].copy().set_fill(opacity=0.6).set_stroke(width=4)
+        tracker = ValueTracker(0)
+        last = len(order) - 1
+
+        def follow(mob: Mobject):
+            x = tracker.get_value()
+            i = min(int(x), max(last - 1, 0))
+            # rest on each box for the first half of its time, then glide on
+            alpha = smooth(np.clip((x - i) * 2 - 1, 0, 1)) if last else 0
+            mob.move_to(interpolate(centres[i], centres[min(i + 1, last)], alpha))
+            current = frames[min(round(x), last)]
+            mob.set_fill(current.get_fill_color(), opacity=0.6)
+            mob.set_stroke(current.get_stroke_color(), width=4)
+
+        s.play(FadeIn(highlight), run_time=0.25)
+        highlight.add_updater(follow)
+        s.play(
+            tracker.animate.set_value(last + 0.5),
+            run_time=self.step_time * len(order),
+            rate_func=linear,
+        )
+        highlight.clear_updaters()
+        s.play(FadeOut(highlight), run_time=0.25)
@@ -0,0 +1,231 @@
+"""`TiledMap`: maps far larger than the frame, loaded tile by tile as the camera moves.
+
+A landscape-scale map (e.g. a 10 000 × 10 000 ESA landcover tile) has too
+many cells for a `CellGrid` or even a single `CellRaster` image.  A
+`TiledMap` keeps the cells where they are, usually a memory-mapped ``.npy``
+file, and only builds the tiles the camera currently sees:
+
+- the pyramid level follows the cells' size on screen (`grid.pyramid_level`):
+  at level *k* a tile samples every 2^k-th cell, so a zoomed-out view reads
+  no more pixels than it shows;
+- zoomed in past one pixel per cell, tiles cover fewer cells instead
+  (negative levels: 2^-k cells per tile side), so a tile is never drawn
+  more than about twice its pixel size on screen and each frame resamples
+  no more than the view;
+- tiles outside the camera view are not added to the scene;
+- built tiles are kept in an LRU cache bounded by *cache_bytes*, so panning
+  back and forth does not rebuild them, and memory stays bounded however far
+  the camera travels.
+
+Cells are either RGB(A) already, categorical codes with a *palette*, or
+anything a *colorize* function (e.g. ``cells_to_image``) turns into RGB.
+
+Usage
+-----
+>>> class Landscape(MovingCameraScene, TemplateSlide):
+...     def construct(self):
+...         world = TiledMap.from_npy("data/landcover.npy", cell_size=0.01, palette=LANDCOVER)
+...         self.add(world.follow(self.camera))
+...         self.play(self.camera.frame.animate.scale(0.05).move_to(world.cell_point(4000, 7000)))
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+from manim import ORIGIN, RESAMPLING_ALGORITHMS, Group, ImageMobject, config
+
+from manim_deck.animations.grid import cell_pixels, pyramid_level
+
+
+class TilePyramid:
+    """RGBA tiles of a 2-D map at every pyramid level, built on demand.
+
+    Attributes:
+        cells:       ``(H, W)`` codes or ``(H, W, 3|4)`` colours; may be an
+                     `np.memmap`, only the cells of requested tiles are read.
+        tile:        Side of a tile in image pixels.
+        cache_bytes: Upper bound of the RGBA bytes kept in the LRU cache.
+    """
+
+    def __init__(
+        self,
+        cells,
+        *,
+        tile: int = 256,
+        palette=None,
+        colorize=None,
+        cache_bytes: int = 256 * 2**20,
+    ):
+        self.cells = cells
+        self.rows, self.cols = cells.shape[:2]
+        self.tile = tile
+        self.palette = None if palette is None else self._lut(palette)
+        self.colorize = colorize
+        self.cache_bytes = cache_bytes
+        self.cached_bytes = 0
+        self._cache: OrderedDict[tuple[int, int, int], np.ndarray] = OrderedDict()
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def _lut(palette) -> np.ndarray:
+        lut = np.asarray(palette)
+        if lut.dtype.kind == "f":
+            lut = np.round(lut * 255)
+        lut = lut.astype(np.uint8)
+        if lut.shape[1] == 3:
+            lut = np.concatenate([lut, np.full((len(lut), 1), 255, np.uint8)], axis=1)
+        return lut
+
+    @property
+    def max_level(self) -> int:
+        """Level at which the whole map fits in one tile."""
+        side = max(self.rows, self.cols)
+        return max(0, int(np.ceil(np.log2(side / self.tile)))) if side > self.tile else 0
+
+    @property
+    def min_level(self) -> int:
+        """Most zoomed-in level: tiles of a single cell."""
+        return -int(np.log2(self.tile))
+
+    def span(self, level: int) -> int:
+        """Cells along one side of a tile at *level* (below 0, tiles cover fewer cells)."""
+        return self.tile << level if level >= 0 else max(1, self.tile >> -level)
+
+    def bounds(self, level: int, a: int, b: int) -> tuple[int, int, int, int]:
+        """Cell rows ``r0:r1`` and columns ``c0:c1`` of tile (*a*, *b*) at *level*."""
+        span = self.span(level)
+        r0, c0 = a * span, b * span
+        return r0, min(self.rows, r0 + span), c0, min(self.cols, c0 + span)
+
+    def tiles_in(self, level: int, rows: tuple[int, int], cols: tuple[int, int]) -> list:
+        """Tiles at *level* that overlap cell rows ``rows[0]:rows[1]`` and columns *cols*."""
+        span = self.span(level)
+        r0, r1 = max(0, rows[0]), min(self.rows, rows[1])
+        c0, c1 = max(0, cols[0]), min(self.cols, cols[1])
+        if r0 >= r1 or c0 >= c1:
+            return []
+        return [
+            (level, a, b)
+            for a in range(r0 // span, (r1 - 1) // span + 1)
+            for b in range(c0 // span, (c1 - 1) // span + 1)
+        ]
+
+    def _rgba(self, block: np.ndarray) -> np.ndarray:
+        if self.colorize is not None:
+            block = np.asarray(self.colorize(block))
+        elif self.palette is not None:
+            return self.palette[block]
+        if block.dtype.kind == "f":
+            block = np.round(block * 255)
+        block = block.astype(np.uint8)
+        if block.shape[-1] == 3:
+            alpha = np.full(block.shape[:-1] + (1,), 255, np.uint8)
+            block = np.concatenate([block, alpha], axis=-1)
+        return block
+
+    def get(self, key: tuple[int, int, int]) -> np.ndarray:
+        """``(h, w, 4)`` uint8 pixels of tile *key* = (level, row, column)."""
+        pixels = self._cache.get(key)
+        if pixels is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return pixels
+        self.misses += 1
+        level = key[0]
+        r0, r1, c0, c1 = self.bounds(*key)
+        step = 1 << max(0, level)
+        # every 2^level-th cell: categorical codes cannot be averaged, and
+        # strided reads touch only the rows of a memory map that are shown
+        pixels = np.ascontiguousarray(self._rgba(np.asarray(self.cells[r0:r1:step, c0:c1:step])))
+        self._cache[key] = pixels
+        self.cached_bytes += pixels.nbytes
+        while self.cached_bytes > self.cache_bytes and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self.cached_bytes -= evicted.nbytes
+        return pixels
+
+
+class TiledMap(Group):
+    """A map of *rows* × *cols* cells of *cell_size*, centred at *center*, drawn in tiles.
+
+    Call `sync` with a camera to show the tiles it sees, or `follow` to do
+    so on every frame.  Pan and zoom by moving the camera, not the map.
+    """
+
+    def __init__(
+        self,
+        cells,
+        cell_size: float,
+        *,
+        center=ORIGIN,
+        tile: int = 256,
+        palette=None,
+        colorize=None,
+        cache_bytes: int = 256 * 2**20,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.pyramid = TilePyramid(
+            cells, tile=tile, palette=palette, colorize=colorize, cache_bytes=cache_bytes
+        )
+        self.cell_size = cell_size
+        self.rows, self.cols = self.pyramid.rows, self.pyramid.cols
+        self.width_units = self.cols * cell_size
+        self.height_units = self.rows * cell_size
+        center = np.asarray(center, dtype=float)
+        self.corner = center[:2] + np.array([-self.width_units, self.height_units]) / 2
+        self._shown: dict[tuple[int, int, int], ImageMobject] = {}
+
+    @classmethod
+    def from_npy(cls, path: str | Path, cell_size: float, **kwargs) -> TiledMap:
+        """A map over the ``.npy`` file at *path*, memory-mapped rather than loaded."""
+        return cls(np.load(path, mmap_mode="r"), cell_size, **kwargs)
+
+    def cell_point(self, i: float, j: float) -> np.ndarray:
+        """Scene point at the centre of cell (*i*, *j*)."""
+        x, y = self.corner + np.array([j + 0.5, -(i + 0.5)]) * self.cell_size
+        return np.array([x, y, 0.0])
+
+    def _image(self, key: tuple[int, int, int]) -> ImageMobject:
+        r0, r1, c0, c1 = self.pyramid.bounds(*key)
+        image = ImageMobject(self.pyramid.get(key), scale_to_resolution=config.pixel_height)
+        image.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        image.stretch_to_fit_width((c1 - c0) * self.cell_size)
+        image.stretch_to_fit_height((r1 - r0) * self.cell_size)
+        x, y = self.corner + np.array([(c0 + c1) / 2, -(r0 + r1) / 2]) * self.cell_size
+        return image.move_to([x, y, 0])
+
+    def visible_tiles(self, camera) -> list[tuple[int, int, int]]:
+        """Tiles, at the level that suits *camera*'s zoom, inside its view."""
+        pixels = cell_pixels(self.cell_size, camera)
+        if pixels > 2:
+            # zoomed in: shrink tiles so each stays under 2 * tile pixels on screen
+            level = max(-int(np.log2(pixels)), self.pyramid.min_level)
+        else:
+            level = min(pyramid_level(pixels), self.pyramid.max_level)
+        cx, cy = np.asarray(camera.frame_center, dtype=float)[:2]
+        hw, hh = camera.frame_width / 2, camera.frame_height / 2
+        # view edges in cells from the map's top-left corner
+        left, right = (np.array([cx - hw, cx + hw]) - self.corner[0]) / self.cell_size
+        top, bottom = (self.corner[1] - np.array([cy + hh, cy - hh])) / self.cell_size
+        rows = (int(np.floor(top)), int(np.ceil(bottom)))
+        cols = (int(np.floor(left)), int(np.ceil(right)))
+        return self.pyramid.tiles_in(level, rows, cols)
+
+    def sync(self, camera) -> TiledMap:
+        """Show exactly the tiles *camera* sees, building the missing ones."""
+        keys = self.visible_tiles(camera)
+        if keys != list(self._shown):
+            shown = self._shown
+            self._shown = {key: shown[key] if key in shown else self._image(key) for key in keys}
+            self.submobjects = list(self._shown.values())
+        return self
+
+    def follow(self, camera) -> TiledMap:
+        """Keep the map in sync with *camera* on every frame (e.g. a `MovingCamera`)."""
+        self.sync(camera)
+        self.add_updater(lambda world: world.sync(camera))
+        return self
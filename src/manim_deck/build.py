@@ -0,0 +1,363 @@
+"""Batch-build every talk under ``talks/``.
+
+`discover_jobs` finds each `TemplateSlide` subclass in the talk folders by
+parsing the sources (nothing is imported), `run_build` renders them with
+``manim-slides render`` in a bounded pool of worker processes and writes a
+JSON summary.  A talk is skipped when neither its folder nor the installed
+`manim_deck` changed since its last successful build.
+
+Build state, per-job logs and the summary live in ``<root>/.manim-deck-build/``.
+
+Usage
+-----
+>>> from manim_deck.build import discover_jobs, run_build
+>>> jobs = discover_jobs(Path("talks"))
+>>> summary = run_build(jobs, Path("talks/.manim-deck-build"), workers=4)
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+
+from manim_deck.config import find_config
+
+BUILD_DIR = ".manim-deck-build"
+BASE_CLASSES = ("TemplateSlide", "DeckSlide")
+
+# Folders inside a talk that hold render output, not sources.
+_OUTPUT_DIRS = {"media", "slides", "__pycache__", BUILD_DIR}
+# `manim-slides convert` writes <name>.html next to a <name>_assets/ folder.
+_OUTPUT_SUFFIX = ".html"
+_ASSETS_SUFFIX = "_assets"
+
+
+@dataclass(frozen=True)
+class TalkJob:
+    """One scene to render."""
+
+    talk: Path
+    source: Path
+    scene: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.talk.name}:{self.scene}"
+
+    @property
+    def log_name(self) -> str:
+        return f"{self.talk.name}__{self.scene}.log"
+
+
+@dataclass
+class JobResult:
+    """Outcome of one job, as written to the build summary."""
+
+    name: str
+    talk: str
+    scene: str
+    status: str  # "built", "skipped" or "failed"
+    seconds: float = 0.0
+    returncode: int | None = None
+    log: str = ""
+    predicted: float | None = None
+
+
+# ── discovery
+
+
+def _base_names(node: ast.ClassDef) -> list[str]:
+    names = []
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            names.append(base.attr)
+    return names
+
+
+def find_scenes(source: Path) -> list[str]:
+    """Names of the `TemplateSlide` (or `DeckSlide`) subclasses defined in *source*.
+
+    Subclasses of other classes in the same file are followed, so a talk can
+    define its own intermediate base class.
+    """
+    tree = ast.parse(source.read_text(encoding="utf-8"), filename=str(source))
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    slide_classes = set(BASE_CLASSES)
+    changed = True
+    while changed:
+        changed = False
+        for node in classes:
+            if node.name not in slide_classes and slide_classes & set(_base_names(node)):
+                slide_classes.add(node.name)
+                changed = True
+    return [node.name for node in classes if node.name in slide_classes]
+
+
+def _is_source(rel: Path) -> bool:
+    folders = rel.parts[:-1]
+    if set(folders) & _OUTPUT_DIRS or any(f.endswith(_ASSETS_SUFFIX) for f in folders):
+        return False
+    if any(part.startswith(".") for part in rel.parts):
+        return False
+    return rel.suffix != _OUTPUT_SUFFIX
+
+
+def _talk_files(talk: Path) -> list[Path]:
+    """Source files of *talk* (scripts, images, data), without render output."""
+    return [
+        path
+        for path in sorted(talk.rglob("*"))
+        if path.is_file() and _is_source(path.relative_to(talk))
+    ]
+
+
+def discover_jobs(root: Path) -> list[TalkJob]:
+    """Every `TemplateSlide` subclass in the ``*.py`` files of the talks under *root*."""
+    jobs = []
+    talks = sorted(p for p in root.iterdir() if p.is_dir() and not p.name.startswith("."))
+    for talk in talks:
+        for source in _talk_files(talk):
+            if source.suffix != ".py":
+                continue
+            for scene in find_scenes(source):
+                jobs.append(TalkJob(talk=talk, source=source, scene=scene))
+    return jobs
+
+
+# ── fingerprints
+
+
+def package_fingerprint() -> str:
+    """Version and source hash of the installed `manim_deck` package."""
+    try:
+        version = metadata.version("manim-deck")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    digest = hashlib.sha256(version.encode())
+    package = Path(__file__).resolve().parent
+    for path in sorted(package.rglob("*")):
+        if path.is_file() and "__pycache__" not in path.parts:
+            digest.update(str(path.relative_to(package)).encode())
+            digest.update(path.read_bytes())
+    return f"{version}+{digest.hexdigest()[:16]}"
+
+
+def job_fingerprint(job: TalkJob, package: str, quality: str) -> str:
+    """Hash of everything that affects the output of *job*.
+
+    Includes the manim_deck.toml the talk picks up, which may live above it.
+    """
+    digest = hashlib.sha256(f"{package}\0{job.scene}\0{quality}".encode())
+    config = find_config(job.source)
+    if config is not None:
+        digest.update(config.read_bytes())
+    for path in _talk_files(job.talk):
+        digest.update(str(path.relative_to(job.talk)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+# ── running
+
+
+def default_workers() -> int:
+    return max(1, os.cpu_count() or 1)
+
+
+def render_command(job: TalkJob, quality: str) -> list[str]:
+    return [
+        sys.executable,
+        "-m",
+        "manim_slides",
+        "-S",
+        "render",
+        f"-q{quality}",
+        str(job.source.relative_to(job.talk)),
+        job.scene,
+    ]
+
+
+def predict_seconds(job: TalkJob, quality: str) -> float | None:
+    """Render time of *job* predicted from a dry-run outline (None if that fails).
+
+    The outline runs in a fresh interpreter, like the render itself, so the
+    talk's imports stay out of the build process.  It writes its JSON to a
+    file, since the talk may print to stdout and Manim logs there.
+    """
+    with tempfile.TemporaryDirectory(prefix="manim-deck-outline-") as tmp:
+        result = Path(tmp) / "outline.json"
+        command = [
+            sys.executable,
+            "-m",
+            "manim_deck.outline",
+            str(job.source.relative_to(job.talk)),
+            job.scene,
+            str(result),
+            quality,
+        ]
+        completed = subprocess.run(command, cwd=job.talk, capture_output=True, text=True)
+        if completed.returncode != 0:
+            return None
+        try:
+            return float(json.loads(result.read_text(encoding="utf-8"))["cost"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+_SLIDE_CALLS = {"play", "wait", "next_slide"}
+
+
+def static_estimate(job: TalkJob) -> int:
+    """Cheap size of *job*, read from its source without importing it.
+
+    It is the number of slide-type, ``play``, ``wait`` and ``next_slide`` calls
+    in the scene's class, or the source size in kilobytes if the class is not
+    found at the top level.
+    """
+    tree = ast.parse(job.source.read_text(encoding="utf-8"), filename=str(job.source))
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == job.scene:
+            return sum(
+                isinstance(call, ast.Call)
+                and isinstance(call.func, ast.Attribute)
+                and (call.func.attr in _SLIDE_CALLS or call.func.attr.endswith("_slide"))
+                for call in ast.walk(node)
+            )
+    return job.source.stat().st_size // 1024
+
+
+def _run_job(job: TalkJob, quality: str, log_dir: Path) -> JobResult:
+    log = log_dir / job.log_name
+    start = time.perf_counter()
+    with log.open("w", encoding="utf-8") as fh:
+        command = render_command(job, quality)
+        fh.write(f"$ {' '.join(command)}\n\n")
+        fh.flush()
+        completed = subprocess.run(
+            command, cwd=job.talk, stdout=fh, stderr=subprocess.STDOUT, check=False
+        )
+    return JobResult(
+        name=job.name,
+        talk=str(job.talk),
+        scene=job.scene,
+        status="built" if completed.returncode == 0 else "failed",
+        seconds=round(time.perf_counter() - start, 3),
+        returncode=completed.returncode,
+        log=str(log),
+    )
+
+
+def _load_state(path: Path) -> dict:
+    if not path.is_file():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+
+
+def run_build(
+    jobs: list[TalkJob],
+    build_dir: Path,
+    *,
+    workers: int | None = None,
+    quality: str = "h",
+    force: bool = False,
+    predict: bool = False,
+    echo=print,
+) -> dict:
+    """Render *jobs* in parallel, skipping unchanged ones, and return the summary.
+
+    Jobs are started longest-first so a single slow talk does not end up
+    alone at the tail of the queue.  A job's length is its last recorded
+    render time.  A job never built before is sized by `static_estimate`,
+    scaled to seconds by the jobs that have a recorded time; with *predict*
+    its time is predicted by the cost model instead (see `predict_seconds`
+    and `manim_deck.render.cost`), which costs one dry run per such job.
+    """
+    log_dir = build_dir / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    state_path = build_dir / "state.json"
+    state = _load_state(state_path)
+    package = package_fingerprint()
+
+    results: list[JobResult] = []
+    pending: list[tuple[TalkJob, str]] = []
+    for job in jobs:
+        fingerprint = job_fingerprint(job, package, quality)
+        previous = state.get(job.name, {})
+        if not force and previous.get("fingerprint") == fingerprint:
+            results.append(
+                JobResult(
+                    job.name, str(job.talk), job.scene, "skipped", log=previous.get("log", "")
+                )
+            )
+            echo(f"skip   {job.name} (unchanged)")
+        else:
+            pending.append((job, fingerprint))
+
+    workers = max(1, min(workers or default_workers(), len(pending) or 1))
+    predicted: dict[str, float | None] = {}
+    seconds = {job.name: state.get(job.name, {}).get("seconds") for job, _ in pending}
+    unknown = [job for job, _ in pending if seconds[job.name] is None]
+    if workers > 1 and len(pending) > 1 and unknown:
+        if predict:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                values = pool.map(lambda job: predict_seconds(job, quality), unknown)
+                predicted = {job.name: value for job, value in zip(unknown, values)}
+        sizes = {job.name: static_estimate(job) for job, _ in pending}
+        known = [name for name, value in seconds.items() if value is not None]
+        known_size = sum(sizes[name] for name in known)
+        rate = sum(seconds[name] for name in known) / known_size if known_size else 1.0
+        for job in unknown:
+            seconds[job.name] = predicted.get(job.name) or sizes[job.name] * rate
+    pending.sort(key=lambda item: seconds[item[0].name] or 0.0, reverse=True)
+
+    started = datetime.now(timezone.utc)
+    wall = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_run_job, job, quality, log_dir): (job, fingerprint)
+            for job, fingerprint in pending
+        }
+        for future in as_completed(futures):
+            job, fingerprint = futures[future]
+            result = future.result()
+            result.predicted = predicted.get(job.name)
+            results.append(result)
+            echo(f"{result.status:<6} {job.name} ({result.seconds:.1f}s, log: {result.log})")
+            if result.status == "built":
+                state[job.name] = {
+                    "fingerprint": fingerprint,
+                    "seconds": result.seconds,
+                    "log": result.log,
+                }
+                state_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+
+    summary = {
+        "started": started.isoformat(),
+        "seconds": round(time.perf_counter() - wall, 3),
+        "workers": workers,
+        "quality": quality,
+        "manim_deck": package,
+        "counts": {
+            status: sum(r.status == status for r in results)
+            for status in ("built", "skipped", "failed")
+        },
+        "jobs": [asdict(r) for r in results],
+    }
+    (build_dir / "summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    return summary
@@ -0,0 +1,267 @@
+"""Command-line entry point: ``manim-deck``.
+
+Subcommands
+-----------
+build   Render every talk under ``talks/`` in parallel, skipping unchanged ones.
+deck    Inspect declarative decks: ``deck plan`` and ``deck diff``.
+preview Serve per-slide thumbnails of a talk and refresh them on every edit.
+outline List the slides of a talk without rendering it.
+calibrate     Measure the render-cost model on this machine.
+cache-server  Serve a shared segment cache over HTTP.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def _cmd_build(args: argparse.Namespace) -> int:
+    from manim_deck.build import BUILD_DIR, discover_jobs, run_build
+    from manim_deck.config import ConfigError, load_config
+
+    root = Path(args.root)
+    if not root.is_dir():
+        print(f"manim-deck build: {root} is not a directory", file=sys.stderr)
+        return 2
+    try:
+        render = load_config(start=root).render
+    except ConfigError as exc:
+        print(f"manim-deck build: {exc}", file=sys.stderr)
+        return 2
+    jobs = discover_jobs(root)
+    if args.only:
+        jobs = [job for job in jobs if job.talk.name in args.only or job.scene in args.only]
+    if not jobs:
+        print(f"manim-deck build: no TemplateSlide subclasses found under {root}")
+        return 0
+    if args.list:
+        for job in jobs:
+            print(f"{job.name}  ({job.source})")
+        return 0
+
+    build_dir = Path(args.build_dir) if args.build_dir else root / BUILD_DIR
+    summary = run_build(
+        jobs,
+        build_dir,
+        workers=args.jobs or render.workers,
+        quality=args.quality or render.quality,
+        force=args.force,
+        predict=args.predict,
+    )
+    counts = summary["counts"]
+    print(
+        f"{counts['built']} built, {counts['skipped']} skipped, {counts['failed']} failed "
+        f"in {summary['seconds']:.1f}s — summary: {build_dir / 'summary.json'}"
+    )
+    return 1 if counts["failed"] else 0
+
+
+def _cmd_deck_plan(args: argparse.Namespace) -> int:
+    from manim_deck.deck import DeckError, compile_deck, load_deck
+
+    try:
+        plan = compile_deck(load_deck(args.deck))
+    except DeckError as exc:
+        print(f"manim-deck deck: {exc}", file=sys.stderr)
+        return 2
+    if args.json:
+        data = plan.to_dict()
+        data["schedule"] = plan.schedule(args.jobs)
+        print(json.dumps(data, indent=2))
+        return 0
+    for slide in plan.slides:
+        print(
+            f"{slide.index:>3}  {slide.spec.type:<14} section {slide.section}  "
+            f"cost {slide.cost:>4.0f}  {slide.key[:10]}"
+        )
+    print(f"{len(plan.slides)} slides, {len(plan.texts())} unique texts, cost {plan.cost:.0f}")
+    for start, stop in plan.schedule(args.jobs):
+        print(f"chunk slides = ({start}, {stop})")
+    return 0
+
+
+def _cmd_deck_diff(args: argparse.Namespace) -> int:
+    from manim_deck.deck import DeckError, compile_deck, load_deck
+
+    try:
+        old, new = (compile_deck(load_deck(path)) for path in (args.old, args.new))
+    except DeckError as exc:
+        print(f"manim-deck deck: {exc}", file=sys.stderr)
+        return 2
+    changed = new.diff(old)
+    for index in changed:
+        print(f"{index:>3}  {new.slides[index].spec.type}")
+    removed = len(old.slides) - len(new.slides)
+    if removed > 0:
+        print(f"{removed} slide(s) removed at the end")
+    return 1 if changed or removed > 0 else 0
+
+
+def _cmd_preview(args: argparse.Namespace) -> int:
+    from manim_deck.preview import watch
+
+    source = Path(args.file)
+    if not source.is_file():
+        print(f"manim-deck preview: {source} is not a file", file=sys.stderr)
+        return 2
+    watch(source, args.scene, out_dir=Path(args.out) if args.out else None, port=args.port)
+    return 0
+
+
+def _cmd_outline(args: argparse.Namespace) -> int:
+    from manim_deck.outline import outline_file
+
+    source = Path(args.file)
+    if not source.is_file():
+        print(f"manim-deck outline: {source} is not a file", file=sys.stderr)
+        return 2
+    outline = outline_file(source, args.scene, quality=args.quality)
+    if args.json:
+        print(json.dumps(outline.to_dict(), indent=2))
+        return 0
+    for slide in outline.slides:
+        kind = slide.type or "-"
+        if slide.part:
+            kind += f" +{slide.part}"
+        modules = f"  {', '.join(slide.modules)}" if slide.modules else ""
+        print(
+            f"{slide.index:>3}  {kind:<14} section {slide.section}  plays {slide.plays:>3}  "
+            f"frames {slide.frames + slide.wait_frames:>5}  {slide.cost:>7.2f}s  "
+            f"{slide.memory / 2**20:>6.0f} MB{modules}"
+        )
+    model = f"calibrated {outline.model}" if outline.model else "built-in cost model"
+    print(
+        f"{len(outline.slides)} slides, {len(outline.sections)} sections, "
+        f"{outline.cost:.1f}s and {outline.memory / 2**20:.0f} MB predicted ({model}) "
+        f"— outlined in {outline.seconds * 1000:.0f} ms"
+    )
+    return 0
+
+
+def _cmd_calibrate(args: argparse.Namespace) -> int:
+    from manim_deck.config import ConfigError, load_config
+    from manim_deck.render.cost import calibrate, model_path
+
+    try:
+        deck_config = load_config(start=Path(args.root))
+    except ConfigError as exc:
+        print(f"manim-deck calibrate: {exc}", file=sys.stderr)
+        return 2
+    model = calibrate(args.quality or deck_config.render.quality)
+    print(f"Cost model written to {model.save(model_path(deck_config))}")
+    return 0
+
+
+def _cmd_cache_server(args: argparse.Namespace) -> int:
+    from manim_deck.render.segment_cache import serve
+
+    server = serve(args.root, host=args.host, port=args.port)
+    print(f"Serving segment cache {args.root} at http://{args.host}:{server.server_port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="manim-deck", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="render every talk under a folder")
+    build.add_argument("root", nargs="?", default="talks", help="folder holding the talks")
+    build.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="worker processes (default: [render] workers, else one per core)",
+    )
+    build.add_argument(
+        "-q",
+        "--quality",
+        default=None,
+        choices=list("lmhpk"),
+        help='manim quality flag (default: [render] quality, else "h")',
+    )
+    build.add_argument("-f", "--force", action="store_true", help="rebuild unchanged talks too")
+    build.add_argument(
+        "--predict",
+        action="store_true",
+        help="order never-built talks by a dry-run outline (one extra interpreter each)",
+    )
+    build.add_argument(
+        "--only", nargs="+", metavar="NAME", help="talk folders or scene names to build"
+    )
+    build.add_argument("--list", action="store_true", help="list the discovered scenes and exit")
+    build.add_argument("--build-dir", help="state and log folder (default: <root>/.manim-deck-build)")
+    build.set_defaults(func=_cmd_build)
+
+    deck = sub.add_parser("deck", help="inspect declarative decks")
+    deck_sub = deck.add_subparsers(dest="deck_command", required=True)
+    plan = deck_sub.add_parser("plan", help="validate a deck and print its compiled plan")
+    plan.add_argument("deck", help="deck TOML file")
+    plan.add_argument("-j", "--jobs", type=int, default=1, help="number of chunks to schedule")
+    plan.add_argument("--json", action="store_true", help="print the plan as JSON")
+    plan.set_defaults(func=_cmd_deck_plan)
+    diff = deck_sub.add_parser("diff", help="list the slides that differ between two decks")
+    diff.add_argument("old", help="previous deck TOML file")
+    diff.add_argument("new", help="current deck TOML file")
+    diff.set_defaults(func=_cmd_deck_diff)
+
+    preview = sub.add_parser("preview", help="serve slide thumbnails, re-rendered on change")
+    preview.add_argument("file", help="talk file")
+    preview.add_argument("scene", help="scene class to preview")
+    preview.add_argument("-p", "--port", type=int, default=8765, help="HTTP port (default: 8765)")
+    preview.add_argument(
+        "--out", help="thumbnail folder (default: <talk>/.manim-deck-preview/<scene>)"
+    )
+    preview.set_defaults(func=_cmd_preview)
+
+    outline = sub.add_parser("outline", help="list the slides of a talk without rendering")
+    outline.add_argument("file", help="talk file")
+    outline.add_argument("scene", help="scene class to outline")
+    outline.add_argument(
+        "-q",
+        "--quality",
+        default=None,
+        choices=list("lmhpk"),
+        help="manim quality flag whose frame rate frames are counted at (default: manim's)",
+    )
+    outline.add_argument("--json", action="store_true", help="print the outline as JSON")
+    outline.set_defaults(func=_cmd_outline)
+
+    calibrate = sub.add_parser("calibrate", help="measure the render-cost model on this machine")
+    calibrate.add_argument(
+        "root", nargs="?", default=".", help="folder whose manim_deck.toml cache dir to use"
+    )
+    calibrate.add_argument(
+        "-q",
+        "--quality",
+        default=None,
+        choices=list("lmhpk"),
+        help='manim quality flag to measure at (default: [render] quality, else "h")',
+    )
+    calibrate.set_defaults(func=_cmd_calibrate)
+
+    cache = sub.add_parser("cache-server", help="serve a shared segment cache over HTTP")
+    cache.add_argument("root", help="folder holding the cached segments")
+    cache.add_argument("--host", default="127.0.0.1", help="address to bind (default: 127.0.0.1)")
+    cache.add_argument("-p", "--port", type=int, default=8766, help="HTTP port (default: 8766)")
+    cache.set_defaults(func=_cmd_cache_server)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,48 @@
-"""Configuration loader for manim_deck defaults."""
+"""Configuration loader for manim_deck.
+
+Settings live in a ``manim_deck.toml`` file.  It is looked up by walking up
+from the talk file (or any other start path) to the filesystem root, so a
+talk picks up the same file no matter which directory it is rendered from.
+Parsed files are cached per resolved path and modification time: every
+`TemplateSlide` and every build worker in a process parses a file only once.
+Malformed files raise `ConfigError` instead of silently falling back to the
+defaults.  A class attribute set on a talk always wins over the file.
+
+Example ``manim_deck.toml``::
+
+    [defaults]
+    author = "Your Name"
+    email = "you@example.com"
+
+    [render]
+    quality = "h"              # manim quality flag used by `manim-deck build`
+    workers = 8                # build workers (default: one per core)
+    cache_dir = ".manim-deck-cache"
+    scene_budget = false       # stage monitor, see manim_deck.render.budget
+    max_mobjects = 5000
+    max_points = 500000
+    prune = false
+    cache_static_background = false
+    hold_frames = false        # false, "trailing" or true
+    cull_offscreen = false     # skip drawing mobjects outside the camera frame
+    cull_overlay = false       # stamp the culled count onto every frame
+    prefetch_slides = 0        # slides built ahead on a worker thread (0: off)
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 import tomllib
 
+CONFIG_FILENAME = "manim_deck.toml"
+QUALITIES = ("l", "m", "h", "p", "k")
+
+
+class ConfigError(ValueError):
+    """Raised when a manim_deck.toml file cannot be parsed or holds invalid values."""
+
 
 @dataclass(frozen=True)
 class SlideDeckDefaults:
@@ -15,31 +52,160 @@ class SlideDeckDefaults:
     email: str = ""
 
 
-def load_defaults(config_path: Path | None = None) -> SlideDeckDefaults:
-    """Load defaults from manim_deck.toml in the current working directory."""
+@dataclass(frozen=True)
+class RenderSettings:
+    """The ``[render]`` section: render-performance knobs read across the package."""
+
+    quality: str = "h"
+    workers: int | None = None
+    cache_dir: str = ".manim-deck-cache"
+    scene_budget: bool = False
+    max_mobjects: int = 5000
+    max_points: int = 500_000
+    prune: bool = False
+    cache_static_background: bool = False
+    hold_frames: bool | str = False
+    encoder_threads: int = 0
+    encoder_processes: int = 0
+    frame_queue: int = 8
+    segment_cache: bool | str = False
+    cull_offscreen: bool = False
+    cull_overlay: bool = False
+    prefetch_slides: int = 0
+
 
-    if config_path is None:
-        config_path = Path.cwd() / "manim_deck.toml"
+@dataclass(frozen=True)
+class DeckConfig:
+    """Everything read from one manim_deck.toml (or the built-in defaults)."""
 
-    if not config_path.is_file():
-        return SlideDeckDefaults()
+    path: Path | None = None
+    defaults: SlideDeckDefaults = field(default_factory=SlideDeckDefaults)
+    render: RenderSettings = field(default_factory=RenderSettings)
 
-    try:
-        data = tomllib.loads(config_path.read_text(encoding="utf-8"))
-    except Exception:
-        return SlideDeckDefaults()
+    def cache_path(self, *parts: str) -> Path:
+        """Path inside the configured cache dir, relative to the config file."""
+        base = Path(self.render.cache_dir).expanduser()
+        if not base.is_absolute():
+            base = (self.path.parent if self.path else Path.cwd()) / base
+        return base.joinpath(*parts)
+
+
+_cache: dict[Path, tuple[int, int, DeckConfig]] = {}
+_lock = threading.Lock()
+
+
+def find_config(start: Path | None = None) -> Path | None:
+    """Return the nearest manim_deck.toml at or above *start* (default: cwd)."""
+    start = Path.cwd() if start is None else Path(start).resolve()
+    if start.is_file():
+        start = start.parent
+    for folder in (start, *start.parents):
+        candidate = folder / CONFIG_FILENAME
+        if candidate.is_file():
+            return candidate
+    return None
 
-    if not isinstance(data, dict):
-        return SlideDeckDefaults()
 
-    defaults = data.get("defaults", {})
-    if not isinstance(defaults, dict):
-        return SlideDeckDefaults()
+def _check(path: Path, section: str, key: str, value, allowed: tuple[type, ...]):
+    if not isinstance(value, allowed) or (isinstance(value, bool) and bool not in allowed):
+        names = " or ".join(t.__name__ for t in allowed)
+        raise ConfigError(f"{path}: [{section}] {key} must be {names}, got {value!r}")
+    return value
 
-    author = defaults.get("author")
-    email = defaults.get("email")
 
-    return SlideDeckDefaults(
-        author=str(author) if author is not None else "",
-        email=str(email) if email is not None else "",
+def _parse_defaults(path: Path, data: dict) -> SlideDeckDefaults:
+    values = {}
+    for key in ("author", "email"):
+        if key in data:
+            values[key] = _check(path, "defaults", key, data[key], (str,))
+    return SlideDeckDefaults(**values)
+
+
+_RENDER_TYPES: dict[str, tuple[type, ...]] = {
+    "quality": (str,),
+    "workers": (int,),
+    "cache_dir": (str,),
+    "scene_budget": (bool,),
+    "max_mobjects": (int,),
+    "max_points": (int,),
+    "prune": (bool,),
+    "cache_static_background": (bool,),
+    "hold_frames": (bool, str),
+    "encoder_threads": (int,),
+    "encoder_processes": (int,),
+    "frame_queue": (int,),
+    "segment_cache": (bool, str),
+    "cull_offscreen": (bool,),
+    "cull_overlay": (bool,),
+    "prefetch_slides": (int,),
+}
+
+
+def _parse_render(path: Path, data: dict) -> RenderSettings:
+    known = {f.name for f in fields(RenderSettings)}
+    unknown = sorted(set(data) - known)
+    if unknown:
+        raise ConfigError(
+            f"{path}: unknown [render] keys {unknown}; expected any of {sorted(known)}"
+        )
+    values = {key: _check(path, "render", key, v, _RENDER_TYPES[key]) for key, v in data.items()}
+    if values.get("quality", "h") not in QUALITIES:
+        raise ConfigError(f"{path}: [render] quality must be one of {QUALITIES}")
+    if values.get("hold_frames") not in (None, False, True, "trailing"):
+        raise ConfigError(f'{path}: [render] hold_frames must be false, true or "trailing"')
+    for key in ("workers", "max_mobjects", "max_points", "frame_queue"):
+        if key in values and values[key] < 1:
+            raise ConfigError(f"{path}: [render] {key} must be positive")
+    for key in ("encoder_threads", "encoder_processes", "prefetch_slides"):
+        if values.get(key, 0) < 0:
+            raise ConfigError(f"{path}: [render] {key} must not be negative")
+    return RenderSettings(**values)
+
+
+def _parse(path: Path) -> DeckConfig:
+    try:
+        data = tomllib.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError) as exc:
+        raise ConfigError(f"{path}: {exc}") from exc
+
+    sections = {}
+    for name in ("defaults", "render"):
+        section = data.get(name, {})
+        if not isinstance(section, dict):
+            raise ConfigError(f"{path}: [{name}] must be a table")
+        sections[name] = section
+
+    return DeckConfig(
+        path=path,
+        defaults=_parse_defaults(path, sections["defaults"]),
+        render=_parse_render(path, sections["render"]),
     )
+
+
+def load_config(config_path: Path | None = None, *, start: Path | None = None) -> DeckConfig:
+    """Load (and cache) the config at *config_path*, or the one found from *start*.
+
+    Returns the built-in defaults when no file exists.  Raises `ConfigError`
+    when the file is malformed.
+    """
+    path = Path(config_path) if config_path is not None else find_config(start)
+    if path is None or not path.is_file():
+        return DeckConfig()
+
+    path = path.resolve()
+    stat = path.stat()
+    with _lock:
+        cached = _cache.get(path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+    config = _parse(path)
+    with _lock:
+        _cache[path] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
+
+
+def load_defaults(
+    config_path: Path | None = None, *, start: Path | None = None
+) -> SlideDeckDefaults:
+    """Load the ``[defaults]`` section (see `load_config`)."""
+    return load_config(config_path, start=start).defaults
@@ -0,0 +1,456 @@
+"""Declarative decks.
+
+A deck file lists slides as data instead of Python.  Each ``[[slides]]`` entry
+maps onto one `TemplateSlide` slide method; its keys are the method's
+arguments.  Content-only talks can then be validated, diffed and rendered
+without running talk code.
+
+Example ``deck.toml``::
+
+    [deck]
+    name = "ExampleDeck"
+    theme = "dark"                       # "dark" or "light"
+    section_titles = ["Introduction", "Method"]
+
+    [[slides]]
+    type = "title"
+    title_text = "My Research Talk"
+    occasion = "Lab Meeting"
+
+    [[slides]]
+    type = "section"
+    number = 1
+    text = "Introduction"
+
+    [[slides]]
+    type = "list"
+    title_text = "Motivation"
+    items = ["Existing methods fail", "We propose a new framework"]
+
+    [[slides]]
+    type = "module"                      # update_canvas(), Module(...).run(), next_slide()
+    module = "pipeline"
+    steps = ["Environment", "Agent", "Policy"]
+
+`compile_deck` turns a deck into a `DeckPlan`.  The plan holds:
+
+- the slide counter and section each slide starts with, so any range of slides
+  can be rendered on its own;
+- a content hash per slide, used by `DeckPlan.diff`;
+- the unique (text, role) pairs of the deck.  `DeckSlide` lays these out once
+  before the first slide, and `TemplateSlide.styled_text` reuses them;
+- a rough per-slide cost, used by `DeckPlan.schedule` to split the deck into
+  contiguous chunks for parallel workers.
+
+Parsing and planning are pure Python and do not import Manim.  `DeckSlide`
+and `deck_scene` live in `manim_deck.templates.deck_slide` and are loaded
+from there on first access.
+
+Usage
+-----
+>>> from manim_deck.deck import DeckSlide
+>>> class ExampleDeck(DeckSlide):
+...     deck = "deck.toml"                # relative to the talk file
+>>> class ExampleDeckPart2(ExampleDeck):
+...     slides = (6, 12)                  # render slides 6..11 only
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+import tomllib
+
+from manim_deck.templates.theme import DARK_THEME, LIGHT_THEME
+
+THEMES = {"dark": DARK_THEME, "light": LIGHT_THEME}
+TEXT_ANIMATIONS = ("FadeIn", "Write", "AddTextLetterByLetter", "DrawBorderThenFill", "Create")
+MODULES = {
+    "pipeline": "manim_deck.animations.pipeline:PipelineModule",
+    "callout": "manim_deck.animations.callout:CalloutModule",
+}
+
+
+class DeckError(ValueError):
+    """Raised when a deck file is malformed."""
+
+
+@dataclass(frozen=True)
+class SlideType:
+    """How a ``type = "..."`` entry maps onto a `TemplateSlide` method.
+
+    Attributes:
+        method:     Name of the slide method.
+        args:       Required arguments, passed positionally.
+        options:    Optional keyword arguments.
+        new_canvas: True if the method starts with `update_canvas` (bumps the counter).
+        counter:    True if the new canvas shows the slide number.
+    """
+
+    method: str
+    args: tuple[str, ...] = ()
+    options: tuple[str, ...] = ()
+    new_canvas: bool = True
+    counter: bool = True
+
+
+_COMMON = ("run_time", "text_anim")
+
+SLIDE_TYPES = {
+    "title": SlideType(
+        "title_slide",
+        ("title_text",),
+        ("logos", "occasion", "scale_title", "scale_occasion", *_COMMON),
+        new_canvas=False,
+    ),
+    "section": SlideType(
+        "section_slide", ("number", "text"), ("write_num", *_COMMON), counter=False
+    ),
+    "statement": SlideType("statement_slide", ("statement_text",), ("add_footer", *_COMMON)),
+    "fade_statement": SlideType("fade_statement", (), ("run_time",), new_canvas=False),
+    "text": SlideType("text_slide", ("title_text", "body_lines"), ("add_footer", *_COMMON)),
+    "list": SlideType(
+        "list_slide",
+        ("title_text", "items"),
+        ("add_footer", "lagged_start", "reveal", *_COMMON),
+    ),
+    "image": SlideType(
+        "image_slide",
+        ("title_text", "image_path"),
+        ("image_height", "caption", "add_footer", *_COMMON),
+    ),
+    "code": SlideType("code_slide", ("title_text", "code"), ("language", "font_size", *_COMMON)),
+    "module": SlideType("run", ("module",), ()),
+}
+
+
+# parameter → (check, description) of the values the slide methods accept
+_VALUE_TYPES = {
+    "str": (lambda v: isinstance(v, str), "a string"),
+    "int": (lambda v: isinstance(v, int) and not isinstance(v, bool), "an integer"),
+    "number": (lambda v: isinstance(v, (int, float)) and not isinstance(v, bool), "a number"),
+    "bool": (lambda v: isinstance(v, bool), "true or false"),
+    "strings": (
+        lambda v: isinstance(v, list) and all(isinstance(item, str) for item in v),
+        "a list of strings",
+    ),
+}
+
+PARAM_TYPES = {
+    "title_text": "str",
+    "occasion": "str",
+    "logos": "strings",
+    "scale_title": "number",
+    "scale_occasion": "number",
+    "number": "int",
+    "text": "str",
+    "write_num": "bool",
+    "statement_text": "str",
+    "add_footer": "bool",
+    "body_lines": "strings",
+    "items": "strings",
+    "lagged_start": "bool",
+    "reveal": "str",
+    "image_path": "str",
+    "image_height": "number",
+    "caption": "str",
+    "code": "str",
+    "language": "str",
+    "font_size": "int",
+    "run_time": "number",
+    "text_anim": "str",
+    "module": "str",
+}
+
+
+# ── specs
+
+
+@dataclass(frozen=True)
+class SlideSpec:
+    """One ``[[slides]]`` entry."""
+
+    type: str
+    params: dict = field(default_factory=dict)
+
+    def key(self) -> str:
+        data = json.dumps({"type": self.type, "params": self.params}, sort_keys=True)
+        return hashlib.sha1(data.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class DeckSpec:
+    """A whole deck: the ``[deck]`` table plus its slides."""
+
+    name: str
+    slides: tuple[SlideSpec, ...]
+    section_titles: tuple[str, ...] = ()
+    theme: str = "dark"
+    author: str = ""
+    email: str = ""
+
+
+def _slide_spec(index: int, data: dict, source: str) -> SlideSpec:
+    where = f"{source}: slide {index}"
+    data = dict(data)
+    kind = data.pop("type", None)
+    if kind not in SLIDE_TYPES:
+        raise DeckError(f"{where}: type must be one of {sorted(SLIDE_TYPES)}, got {kind!r}")
+    spec = SLIDE_TYPES[kind]
+    missing = [name for name in spec.args if name not in data]
+    if missing:
+        raise DeckError(f"{where} ({kind}): missing {missing}")
+    for key, value in data.items():
+        if key in PARAM_TYPES and (kind != "module" or key == "module"):
+            check, description = _VALUE_TYPES[PARAM_TYPES[key]]
+            if not check(value):
+                raise DeckError(f"{where} ({kind}): {key} must be {description}, got {value!r}")
+    if kind == "module":
+        module = data["module"]
+        if module not in MODULES and not module.startswith("manim_deck."):
+            raise DeckError(
+                f"{where}: unknown module {module!r}; expected one of {sorted(MODULES)}"
+            )
+    else:
+        unknown = sorted(set(data) - set(spec.args) - set(spec.options))
+        if unknown:
+            raise DeckError(f"{where} ({kind}): unknown keys {unknown}")
+    if data.get("text_anim", "FadeIn") not in TEXT_ANIMATIONS:
+        raise DeckError(f"{where}: text_anim must be one of {TEXT_ANIMATIONS}")
+    return SlideSpec(kind, data)
+
+
+def _check(source: str, key: str, value, kind: type, what: str):
+    if not isinstance(value, kind):
+        raise DeckError(f"{source}: [deck] {key} must be {what}, got {value!r}")
+    return value
+
+
+def parse_deck(data: dict, source: str = "<deck>") -> DeckSpec:
+    """Validate a parsed deck file and return its `DeckSpec`."""
+    meta = data.get("deck", {})
+    slides = data.get("slides", [])
+    if not isinstance(meta, dict) or not isinstance(slides, list):
+        raise DeckError(f"{source}: expected a [deck] table and [[slides]] entries")
+    name = meta.get("name", "")
+    if not isinstance(name, str) or not name.isidentifier():
+        raise DeckError(f"{source}: [deck] name must be a valid class name, got {name!r}")
+    theme = meta.get("theme", "dark")
+    if not isinstance(theme, str) or theme not in THEMES:
+        raise DeckError(f"{source}: [deck] theme must be one of {sorted(THEMES)}")
+    titles = _check(source, "section_titles", meta.get("section_titles", []), list, "a list")
+    for title in titles:
+        _check(source, "section_titles", title, str, "a list of strings")
+    for index, entry in enumerate(slides):
+        if not isinstance(entry, dict):
+            raise DeckError(f"{source}: slide {index} must be a table, got {entry!r}")
+    return DeckSpec(
+        name=name,
+        slides=tuple(_slide_spec(i, s, source) for i, s in enumerate(slides)),
+        section_titles=tuple(titles),
+        theme=theme,
+        author=_check(source, "author", meta.get("author", ""), str, "a string"),
+        email=_check(source, "email", meta.get("email", ""), str, "a string"),
+    )
+
+
+def load_deck(path: str | Path) -> DeckSpec:
+    """Read and validate a TOML deck file."""
+    path = Path(path)
+    try:
+        data = tomllib.loads(path.read_text(encoding="utf-8"))
+    except (OSError, tomllib.TOMLDecodeError) as exc:
+        raise DeckError(f"{path}: {exc}") from exc
+    return parse_deck(data, str(path))
+
+
+# ── plan
+
+
+@dataclass(frozen=True)
+class PlannedSlide:
+    """A slide together with the state it starts from.
+
+    Attributes:
+        index:   Position in the deck.
+        spec:    The slide entry.
+        section: `TemplateSlide.current_section` when the slide starts.
+        counter: `TemplateSlide.slide_counter` when the slide starts.
+        cost:    Estimated number of animations.
+        key:     Hash of the entry and its starting state.
+        texts:   (text, role) pairs the slide lays out, see `TemplateSlide.text_styles`.
+    """
+
+    index: int
+    spec: SlideSpec
+    section: int
+    counter: int
+    cost: float
+    key: str
+    texts: tuple[tuple[str, str], ...]
+
+
+def balanced_chunks(costs: list[float], workers: int) -> list[tuple[int, int]]:
+    """Split ``range(len(costs))`` into at most *workers* contiguous chunks of similar cost."""
+    n = len(costs)
+    workers = max(1, min(workers, n))
+    prefix = [0.0]
+    for cost in costs:
+        prefix.append(prefix[-1] + cost)
+    # cut where the running cost is closest to k/workers of the total
+    bounds = [0]
+    for k in range(1, workers):
+        target = prefix[-1] * k / workers
+        cut = min(
+            range(bounds[-1] + 1, n - (workers - k) + 1),
+            key=lambda i: abs(prefix[i] - target),
+        )
+        bounds.append(cut)
+    bounds.append(n)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _estimate_cost(spec: SlideSpec, author: str) -> float:
+    p = spec.params
+    if spec.type == "title":
+        return 1 + bool(p.get("logos")) + bool(author or p.get("occasion"))
+    if spec.type == "list" and p.get("lagged_start", True):
+        return 1 + len(p["items"])
+    if spec.type == "module":
+        if p["module"] == "pipeline":
+            pulse = p.get("pulse", True)
+            return 2 + (3 if pulse == "travel" else 2 * len(p.get("steps", ())) if pulse else 0)
+        return 3
+    return 1
+
+
+def _slide_texts(spec: SlideSpec, counter: int, author: str) -> list[tuple[str, str]]:
+    p = spec.params
+    texts = []
+    kind = SLIDE_TYPES[spec.type]
+    if kind.new_canvas and kind.counter:
+        texts.append((str(counter), "counter"))
+    if spec.type == "title":
+        texts.append((p["title_text"], "title"))
+        footer = " — ".join(part for part in (author, p.get("occasion", "")) if part)
+        if footer:
+            texts.append((footer, "footer"))
+    elif spec.type == "section":
+        texts.append((p["text"], "section"))
+        if p.get("write_num"):
+            texts.append((str(p["number"]), "section_number"))
+    elif spec.type == "statement":
+        texts.append((p["statement_text"], "statement"))
+    elif spec.type == "text":
+        texts.append((p["title_text"], "header"))
+    elif spec.type in ("list", "image", "code"):
+        texts.append((p["title_text"], "heading"))
+        if p.get("caption"):
+            texts.append((p["caption"], "caption"))
+    return texts
+
+
+@dataclass
+class DeckPlan:
+    """A compiled deck (see `compile_deck`)."""
+
+    deck: DeckSpec
+    slides: list[PlannedSlide]
+
+    def texts(self, start: int = 0, stop: int | None = None) -> list[tuple[str, str]]:
+        """Unique (text, role) pairs of slides ``start..stop``, in first-use order."""
+        seen = {}
+        for slide in self.slides[start:stop]:
+            for text in slide.texts:
+                seen.setdefault(text, None)
+        return list(seen)
+
+    @property
+    def cost(self) -> float:
+        return sum(s.cost for s in self.slides)
+
+    def schedule(self, workers: int) -> list[tuple[int, int]]:
+        """Split the deck into at most *workers* contiguous chunks of similar cost."""
+        return balanced_chunks([s.cost for s in self.slides], workers)
+
+    def diff(self, old: DeckPlan) -> list[int]:
+        """Indices of slides that differ from *old* (content or starting state)."""
+        old_keys = [s.key for s in old.slides]
+        return [
+            s.index
+            for s in self.slides
+            if s.index >= len(old_keys) or old_keys[s.index] != s.key
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.deck.name,
+            "cost": self.cost,
+            "texts": len(self.texts()),
+            "slides": [
+                {
+                    "index": s.index,
+                    "type": s.spec.type,
+                    "section": s.section,
+                    "counter": s.counter,
+                    "cost": s.cost,
+                    "key": s.key,
+                }
+                for s in self.slides
+            ],
+        }
+
+
+def compile_deck(deck: DeckSpec, author: str | None = None) -> DeckPlan:
+    """Compute the starting state, cost, texts and key of every slide in *deck*.
+
+    *author* is the name the title slide footer shows; it defaults to the
+    deck's own ``author``.  `DeckSlide` passes the author it renders with,
+    which falls back to ``manim_deck.toml``.
+    """
+    if author is None:
+        author = deck.author
+    context = json.dumps([deck.theme, deck.section_titles, author])
+    section = counter = 0
+    slides = []
+    for index, spec in enumerate(deck.slides):
+        kind = SLIDE_TYPES[spec.type]
+        shown = counter + 1 if kind.new_canvas else counter
+        key = hashlib.sha1(f"{context}\0{section}\0{counter}\0{spec.key()}".encode()).hexdigest()
+        slides.append(
+            PlannedSlide(
+                index=index,
+                spec=spec,
+                section=section,
+                counter=counter,
+                cost=_estimate_cost(spec, author),
+                key=key,
+                texts=tuple(_slide_texts(spec, shown, author)),
+            )
+        )
+        counter = shown
+        if spec.type == "section":
+            section = spec.params["number"]
+    return DeckPlan(deck, slides)
+
+
+# ── rendering
+
+
+def load_module(name: str) -> type:
+    """Resolve a ``module = "..."`` entry to its animation module class."""
+    target = MODULES.get(name, name)
+    module_name, _, class_name = target.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def __getattr__(name: str):
+    # DeckSlide imports Manim; only load it when a talk asks for it
+    if name in ("DeckSlide", "deck_scene"):
+        from manim_deck.templates import deck_slide
+
+        return getattr(deck_slide, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
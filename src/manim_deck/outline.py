@@ -0,0 +1,465 @@
+"""Dry-run outlines: the slides of a talk, without rendering it.
+
+`outline_scene` runs a `TemplateSlide` subclass's ``construct()`` with its
+render hooks replaced by recorders:
+
+- ``play()`` begins and finishes the animations, so the stage ends up as it
+  would after rendering, but draws and encodes no frames;
+- ``wait()`` and ``next_slide()`` only count time and slide boundaries;
+- `Text`, `MarkupText`, `Paragraph`, `Tex`, `MathTex`, `BulletedList` and
+  `Code` are replaced by placeholder boxes of about the right size, so no
+  text is laid out by Pango or LaTeX.
+
+The result is an `Outline`: for every slide its section, the slide type and
+arguments that started it, the modules that animated it, and its size
+(plays, frames, mobjects, points, glyphs) together with the render time and
+memory predicted by a cost model (see `manim_deck.render.cost`).  Outlining
+a talk takes milliseconds, so build schedulers, incremental renderers and
+the progress bar can all ask for one.
+
+Usage
+-----
+>>> from manim_deck.outline import outline_file
+>>> outline = outline_file(Path("talks/example-talk/main.py"), "ExampleTalk")
+>>> [(s.index, s.type, s.cost) for s in outline.slides]
+
+or ``manim-deck outline talks/example-talk/main.py ExampleTalk``.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import math
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from manim_deck.deck import SLIDE_TYPES
+
+# slide-type methods of TemplateSlide and the outline type they record
+SLIDE_METHODS = {
+    **{kind.method: name for name, kind in SLIDE_TYPES.items() if kind.method != "run"},
+    "two_column_slide": "two_column",
+}
+
+# manim's -q flags
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+_TEX_KINDS = ("SingleStringMathTex", "MathTex", "Tex", "BulletedList")
+
+# a placeholder line has about as many points as the glyphs it stands for
+_POINTS_PER_GLYPH = 40
+
+
+@dataclass
+class SlideOutline:
+    """One slide of an `Outline`.
+
+    Attributes:
+        index:        Position of the slide in the rendered presentation.
+        section:      `TemplateSlide.current_section` when the slide starts.
+        counter:      `TemplateSlide.slide_counter` when the slide starts.
+        type:         Slide type that started the slide ("title", "list", ...), or
+                      None for content built in ``construct()`` itself.
+        args:         Arguments of that slide-type call (mobjects by class name).
+        part:         Slides a single slide-type call produced before this one
+                      (a list revealed bullet by bullet has parts 0, 1, ...).
+        modules:      Animation modules (classes with a ``run()``) that played on it.
+        plays:        Number of ``play()`` calls.
+        frames:       Frames of animation, at the outline's frame rate.
+        wait_frames:  Frames of ``wait()``.
+        mobjects:     Most mobjects with points on stage during a play.
+        points:       Most bezier points on stage during a play.
+        mobject_frames: Sum over plays of frames × mobjects on stage.
+        point_frames: Sum over plays of frames × points on stage.
+        glyphs:       Characters of text laid out with Pango.
+        tex_glyphs:   Characters of LaTeX typeset (`Tex`, `MathTex`, `BulletedList`).
+        cost:         Predicted render time in seconds.
+        memory:       Predicted peak memory in bytes.
+    """
+
+    index: int
+    section: int
+    counter: int
+    type: str | None = None
+    args: dict = field(default_factory=dict)
+    part: int = 0
+    modules: list[str] = field(default_factory=list)
+    plays: int = 0
+    frames: int = 0
+    wait_frames: int = 0
+    mobjects: int = 0
+    points: int = 0
+    mobject_frames: int = 0
+    point_frames: int = 0
+    glyphs: int = 0
+    tex_glyphs: int = 0
+    cost: float = 0.0
+    memory: int = 0
+
+    @property
+    def empty(self) -> bool:
+        return not (self.plays or self.wait_frames or self.glyphs or self.tex_glyphs)
+
+
+@dataclass
+class Outline:
+    """Slides of one scene, as recorded by `outline_scene`."""
+
+    scene: str
+    frame_rate: float
+    pixel_width: int
+    pixel_height: int
+    slides: list[SlideOutline]
+    seconds: float = 0.0
+    model: str = ""  # when the cost model was calibrated ("" = built-in)
+
+    @property
+    def cost(self) -> float:
+        return sum(s.cost for s in self.slides)
+
+    @property
+    def memory(self) -> int:
+        return max((s.memory for s in self.slides), default=0)
+
+    def schedule(self, workers: int) -> list[tuple[int, int]]:
+        """Split the slides into at most *workers* contiguous chunks of similar cost."""
+        from manim_deck.deck import balanced_chunks
+
+        return balanced_chunks([s.cost for s in self.slides], workers)
+
+    @property
+    def sections(self) -> list[int]:
+        """Section numbers in the order the slides reach them."""
+        return list(dict.fromkeys(s.section for s in self.slides))
+
+    def to_dict(self) -> dict:
+        return {
+            "scene": self.scene,
+            "frame_rate": self.frame_rate,
+            "resolution": [self.pixel_width, self.pixel_height],
+            "seconds": self.seconds,
+            "model": self.model,
+            "cost": self.cost,
+            "memory": self.memory,
+            "slides": [asdict(s) for s in self.slides],
+        }
+
+
+def _jsonable(value):
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    return f"<{getattr(value, '__name__', type(value).__name__)}>"
+
+
+class _Recorder:
+    """Collects `SlideOutline` records while a dry-run scene constructs."""
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.slides = [SlideOutline(0, scene.current_section, scene.slide_counter)]
+        self.call: tuple[str, dict] | None = None  # slide-type call in progress
+        self.parts = 0
+
+    @property
+    def current(self) -> SlideOutline:
+        return self.slides[-1]
+
+    def begin_call(self, method: str, args: dict) -> None:
+        self.call = (SLIDE_METHODS[method], args)
+        self.parts = 0
+        if self.current.empty:
+            self._label(self.current)
+
+    def end_call(self) -> None:
+        # a slide the call opened but left empty belongs to whatever comes next
+        if self.current.empty and self.parts:
+            self.current.type, self.current.args, self.current.part = None, {}, 0
+        self.call = None
+
+    def _label(self, slide: SlideOutline) -> None:
+        if self.call is not None:
+            slide.type, slide.args = self.call
+            slide.part = self.parts
+            self.parts += 1
+
+    def next_slide(self) -> None:
+        scene = self.scene
+        if self.current.empty:
+            self.current.section = scene.current_section
+            self.current.counter = scene.slide_counter
+            return
+        slide = SlideOutline(len(self.slides), scene.current_section, scene.slide_counter)
+        self._label(slide)
+        self.slides.append(slide)
+
+    def glyphs(self, count: int, *, tex: bool = False) -> None:
+        if tex:
+            self.current.tex_glyphs += count
+        else:
+            self.current.glyphs += count
+
+    def play(self, *args, **kwargs) -> None:
+        from manim_deck.render.budget import measure_stage
+
+        scene = self.scene
+        animations = scene.compile_animations(*args, **kwargs)
+        scene.add_mobjects_from_animations(animations)
+        for animation in animations:
+            animation._setup_scene(scene)
+            animation.begin()
+        mobjects, points = measure_stage(scene)
+        frames = math.ceil(scene.get_run_time(animations) * scene.camera.frame_rate)
+        for animation in animations:
+            animation.finish()
+            animation.clean_up_from_scene(scene)
+
+        slide = self.current
+        slide.plays += 1
+        slide.frames += frames
+        slide.mobjects = max(slide.mobjects, mobjects)
+        slide.points = max(slide.points, points)
+        slide.mobject_frames += frames * mobjects
+        slide.point_frames += frames * points
+        for module in self._modules():
+            if module not in slide.modules:
+                slide.modules.append(module)
+
+    def wait(self, duration: float) -> None:
+        self.current.wait_frames += math.ceil(duration * self.scene.camera.frame_rate)
+
+    def _modules(self) -> list[str]:
+        """Animation modules on the call stack, outermost first."""
+        modules = []
+        frame = inspect.currentframe()
+        while frame is not None:
+            owner = frame.f_locals.get("self")
+            if (
+                owner is not None
+                and owner is not self
+                and owner is not self.scene
+                and callable(getattr(type(owner), "run", None))
+                and self.scene in (getattr(owner, "slide", None), getattr(owner, "scene", None))
+            ):
+                modules.append(type(owner).__name__)
+            frame = frame.f_back
+        return modules[::-1]
+
+    def finish(self) -> list[SlideOutline]:
+        if len(self.slides) > 1 and self.current.empty:
+            self.slides.pop()
+        return self.slides
+
+
+class _DryRun:
+    """Mixin replacing the render hooks of a `TemplateSlide` with a `_Recorder`."""
+
+    _outline: _Recorder
+
+    def play(self, *args, **kwargs):
+        self._outline.play(*args, **kwargs)
+
+    def wait(self, duration=1.0, stop_condition=None, frozen_frame=None):
+        self._outline.wait(duration)
+
+    def next_slide(self, *args, **kwargs):
+        self._outline.next_slide()
+
+    def play_steps(self, *steps):
+        for i, step in enumerate(steps):
+            if i:
+                self.next_slide()
+            self.play(step)
+
+
+def _recorded(method_name: str, method):
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        arguments = {k: _jsonable(v) for k, v in list(bound.arguments.items())[1:]}
+        self._outline.begin_call(method_name, arguments)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._outline.end_call()
+
+    return wrapper
+
+
+# render settings a throwaway run (an outline or a preview) must not act on
+_THROWAWAY_SETTINGS = {
+    # nothing is written
+    "replay_dir": None,
+    "hold_frames": False,
+    "cache_static_background": False,
+    "scene_budget": None,
+    "segment_cache": False,
+    # slide methods must build their mobjects themselves to be recorded
+    "prefetch_slides": 0,
+}
+
+
+def _throwaway_class(cls: type, *mixins: type, **namespace) -> type:
+    """Subclass of *cls* (after *mixins*) with `_THROWAWAY_SETTINGS` and *namespace* set."""
+    namespace = {"__module__": cls.__module__, **_THROWAWAY_SETTINGS, **namespace}
+    return type(cls.__name__, (*mixins, cls), namespace)
+
+
+def _dry_run_class(cls: type) -> type:
+    recorded = {
+        name: _recorded(name, getattr(cls, name)) for name in SLIDE_METHODS if hasattr(cls, name)
+    }
+    return _throwaway_class(cls, _DryRun, **recorded)
+
+
+# ── placeholder text
+
+
+def _text_parts(kind: str, args: tuple, kwargs: dict) -> list[str]:
+    if kind in ("Text", "MarkupText"):
+        text = args[0] if args else kwargs.get("text", "")
+        return str(text).split("\n")
+    if kind == "SingleStringMathTex":
+        return [str(args[0] if args else kwargs.get("tex_string", ""))]
+    if kind == "Code":
+        code = kwargs.get("code_string", args[1] if len(args) > 1 else None)
+        code_file = kwargs.get("code_file", args[0] if args else None)
+        if code is None and code_file is not None:
+            code = Path(code_file).read_text(encoding="utf-8")
+        return (code or "").split("\n")
+    # Paragraph, MathTex, Tex, BulletedList: one part per argument
+    return [str(part) for part in args]
+
+
+def _font_size(kind: str, kwargs: dict) -> float:
+    if kind == "Code":
+        return (kwargs.get("paragraph_config") or {}).get("font_size", 24)
+    return kwargs.get("font_size", 48)
+
+
+@contextmanager
+def placeholder_text(recorder: _Recorder):
+    """Replace the text mobjects' constructors with placeholder boxes."""
+    import manim
+    from manim import DOWN, LEFT, VMobject
+
+    def make_init(kind: str):
+        def __init__(self, *args, **kwargs):
+            parts = _text_parts(kind, args, kwargs)
+            size = _font_size(kind, kwargs)
+            VMobject.__init__(self)
+            for part in parts:
+                glyphs = len(part.replace(" ", ""))
+                width = max(0.1, 0.45 * size / 48 * len(part))
+                height = 0.6 * size / 48
+                line = VMobject()
+                steps = max(1, glyphs * _POINTS_PER_GLYPH // 4 - 3)
+                bottom = [[width * i / steps, 0, 0] for i in range(steps + 1)]
+                line.set_points_as_corners([*bottom, [width, height, 0], [0, height, 0], [0, 0, 0]])
+                self.add(line)
+                recorder.glyphs(glyphs, tex=kind in _TEX_KINDS)
+            if len(parts) > 1:
+                self.arrange(DOWN, aligned_edge=LEFT, buff=0.25 * size / 48)
+            if kwargs.get("color") is not None:
+                self.set_color(kwargs["color"])
+            self.text = self.original_text = self.tex_string = "\n".join(parts)
+            self._font_size = size
+            self.initial_height = self.height or 1.0
+
+        return __init__
+
+    kinds = (
+        "Text",
+        "MarkupText",
+        "Paragraph",
+        "SingleStringMathTex",
+        "MathTex",
+        "Tex",
+        "BulletedList",
+        "Code",
+    )
+    originals = {kind: getattr(manim, kind).__init__ for kind in kinds}
+    try:
+        for kind in kinds:
+            getattr(manim, kind).__init__ = make_init(kind)
+        yield
+    finally:
+        for kind, init in originals.items():
+            getattr(manim, kind).__init__ = init
+
+
+# ── entry points
+
+
+def outline_scene(cls: type, *, quality: str | None = None, model=None) -> Outline:
+    """Dry-run ``construct()`` of the `TemplateSlide` subclass *cls*.
+
+    *quality* is a ``-q`` flag ("l", "m", "h", "p" or "k"); frames are counted
+    at its frame rate.  By default the current Manim config is used.  Costs
+    are predicted with *model* (default: the talk's calibrated `CostModel`,
+    see `manim_deck.render.cost.load_model`).
+    """
+    from manim import tempconfig
+
+    from manim_deck.render.cost import load_model
+
+    start = time.perf_counter()
+    options = {"dry_run": True, "disable_caching": True}
+    if quality is not None:
+        options["quality"] = QUALITIES[quality]
+    with tempconfig(options):
+        scene = _dry_run_class(cls)()
+        recorder = scene._outline = _Recorder(scene)
+        with placeholder_text(recorder):
+            scene.setup()
+            scene.construct()
+        camera = scene.camera
+        model = model or load_model(scene.deck_config)
+        slides = recorder.finish()
+        for slide in slides:
+            estimate = model.predict(slide, camera.pixel_width * camera.pixel_height)
+            slide.cost, slide.memory = estimate.seconds, estimate.memory
+        return Outline(
+            scene=cls.__name__,
+            frame_rate=camera.frame_rate,
+            pixel_width=camera.pixel_width,
+            pixel_height=camera.pixel_height,
+            slides=slides,
+            seconds=time.perf_counter() - start,
+            model=model.calibrated,
+        )
+
+
+def outline_file(
+    source: Path, scene: str, *, quality: str | None = None, model=None
+) -> Outline:
+    """Outline the scene class *scene* defined in the talk file *source*."""
+    from manim_deck.preview import _load_scene
+
+    return outline_scene(_load_scene(Path(source), scene), quality=quality, model=model)
+
+
+if __name__ == "__main__":
+    # used by `manim_deck.build.predict_seconds`: file, scene, JSON output file and an
+    # optional -q flag; stdout is left to the talk's prints and Manim's logging
+    quality = sys.argv[4] if len(sys.argv) > 4 else None
+    outline = outline_file(Path(sys.argv[1]), sys.argv[2], quality=quality)
+    Path(sys.argv[3]).write_text(json.dumps(outline.to_dict()), encoding="utf-8")
@@ -0,0 +1,281 @@
+"""Layout previews: one PNG thumbnail per slide, served over local HTTP.
+
+``manim-deck preview talks/my-talk/main.py MyTalk`` runs the talk's
+``construct()`` at low quality with every animation skipped, and captures the
+final frame of each slide when it ends.  Each thumbnail is named after a hash
+of what is on stage (points, colours, pixel arrays and the background), so
+after an edit only the slides whose content changed are rasterized and
+written again; unchanged slides keep their PNG.
+
+The thumbnails and an ``index.html`` gallery are served from
+``<talk>/.manim-deck-preview/<Scene>/``.  The talk folder is watched, and
+every change re-runs the scene in a fresh process; the gallery reloads the
+slides that changed.
+
+Usage
+-----
+>>> from manim_deck.preview import watch
+>>> watch(Path("talks/my-talk/main.py"), "MyTalk", port=8765)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import subprocess
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from manim_deck.build import _talk_files
+from manim_deck.config import find_config
+from manim_deck.outline import _throwaway_class
+
+PREVIEW_DIR = ".manim-deck-preview"
+INDEX_FILE = "index.json"
+PREVIEW_VERSION = 1
+
+_PAGE = """<!doctype html>
+<meta charset="utf-8">
+<title>manim-deck preview</title>
+<style>
+  body { background: #111; color: #ddd; font: 14px sans-serif; margin: 1em; }
+  #slides { display: grid; grid-template-columns: repeat(auto-fill, minmax(320px, 1fr));
+            gap: 1em; }
+  figure { margin: 0; } img { width: 100%; display: block; }
+  figcaption { padding: .3em 0; } .changed figcaption { color: #fc6; }
+  #error { color: #f66; white-space: pre-wrap; }
+</style>
+<h1 id="title">manim-deck preview</h1>
+<pre id="error"></pre>
+<div id="slides"></div>
+<script>
+let shown = null;
+async function refresh() {
+  let index;
+  try { index = await (await fetch("index.json", {cache: "no-store"})).json(); }
+  catch (e) { return; }
+  document.getElementById("error").textContent = index.error || "";
+  const stamp = JSON.stringify([index.slides, index.error]);
+  if (stamp === shown) return;
+  shown = stamp;
+  document.getElementById("title").textContent =
+    `${index.scene} — ${index.slides.length} slides (${index.seconds.toFixed(1)}s)`;
+  document.getElementById("slides").innerHTML = index.slides.map(s =>
+    `<figure class="${s.changed ? "changed" : ""}"><img src="${s.file}" loading="lazy">` +
+    `<figcaption>${s.index + 1}</figcaption></figure>`).join("");
+}
+refresh();
+setInterval(refresh, 1000);
+</script>
+"""
+
+
+def preview_dir(source: Path, scene: str) -> Path:
+    return source.parent / PREVIEW_DIR / scene
+
+
+def _write_json(path: Path, data: dict) -> None:
+    temp = path.with_suffix(".tmp")
+    temp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    temp.replace(path)
+
+
+def _read_index(out_dir: Path) -> dict:
+    try:
+        data = json.loads((out_dir / INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if data.get("version") == PREVIEW_VERSION else {}
+
+
+class PreviewRecorder:
+    """Captures the last frame of every slide of a `TemplateSlide` as a PNG.
+
+    `TemplateSlide` calls `capture` at each slide boundary while its
+    ``_preview`` attribute holds a recorder.
+    """
+
+    def __init__(self, out_dir: Path):
+        self.out_dir = Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.known = {s["key"] for s in _read_index(self.out_dir).get("slides", [])}
+        self.slides: list[dict] = []
+        self.rendered = 0
+
+    def stage_key(self, scene) -> str:
+        """Hash of everything visible on *scene*."""
+        from manim_deck.render.replay import _state_key, serialize_mobject, stage_mobjects
+
+        camera = scene.camera
+        digest = hashlib.sha1()
+        digest.update(str(camera.background_color).encode())
+        digest.update(f"{camera.pixel_width}x{camera.pixel_height}".encode())
+        for mob in stage_mobjects(scene):
+            state = serialize_mobject(mob) or {"points": mob.points}
+            digest.update(type(mob).__name__.encode())
+            digest.update(_state_key(state).encode())
+        return digest.hexdigest()[:20]
+
+    def capture(self, scene) -> None:
+        """Record the slide that ends now, rasterizing it only if it is new."""
+        from PIL import Image
+
+        key = self.stage_key(scene)
+        path = self.out_dir / f"{key}.png"
+        if not path.is_file():
+            renderer = scene.renderer
+            renderer.static_image = None  # draw every mobject, not just the moving ones
+            renderer.update_frame(scene, ignore_skipping=True)
+            Image.fromarray(renderer.get_frame()).save(path)
+            self.rendered += 1
+        self.slides.append(
+            {
+                "index": len(self.slides),
+                "key": key,
+                "file": path.name,
+                "changed": key not in self.known,
+            }
+        )
+
+    def save(self, scene: str, seconds: float) -> None:
+        """Write ``index.json`` and ``index.html`` and drop stale thumbnails."""
+        _write_json(
+            self.out_dir / INDEX_FILE,
+            {
+                "version": PREVIEW_VERSION,
+                "scene": scene,
+                "seconds": seconds,
+                "rendered": self.rendered,
+                "slides": self.slides,
+            },
+        )
+        (self.out_dir / "index.html").write_text(_PAGE, encoding="utf-8")
+        used = {slide["file"] for slide in self.slides}
+        for png in self.out_dir.glob("*.png"):
+            if png.name not in used:
+                png.unlink(missing_ok=True)
+
+
+def _load_scene(source: Path, scene: str) -> type:
+    spec = importlib.util.spec_from_file_location(source.stem, source)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    sys.path.insert(0, str(source.parent))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(source.parent))
+    try:
+        return getattr(module, scene)
+    except AttributeError:
+        raise ValueError(f"{source} defines no scene named {scene!r}") from None
+
+
+def render_preview(source: Path, scene: str, out_dir: Path) -> PreviewRecorder:
+    """Run *scene* from *source* with animations skipped and record its thumbnails."""
+    from manim import Scene, tempconfig
+
+    start = time.perf_counter()
+    cls = _load_scene(source, scene)
+    # the same settings as a dry-run outline, and no culling overlay in the thumbnails
+    preview_cls = _throwaway_class(cls, cull_overlay=False)
+    recorder = PreviewRecorder(out_dir)
+    options = {
+        "quality": "low_quality",
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "disable_caching": True,
+        "media_dir": str(out_dir / "media"),
+    }
+    with tempconfig(options):
+        slide = preview_cls(skip_animations=True)
+        slide._preview = recorder
+        # Scene.render, not Slide.render: there are no movie files to collect
+        Scene.render(slide)
+    recorder.save(scene, time.perf_counter() - start)
+    return recorder
+
+
+def _snapshot(talk: Path) -> dict[Path, int]:
+    files = _talk_files(talk)
+    config = find_config(talk)
+    if config is not None:
+        files.append(config)
+    return {path: path.stat().st_mtime_ns for path in files if path.is_file()}
+
+
+def _render_child(source: Path, scene: str, out_dir: Path) -> bool:
+    """Render in a fresh interpreter, so edits to the talk are picked up."""
+    cmd = [sys.executable, "-m", "manim_deck.preview", str(source), scene, str(out_dir)]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode == 0:
+        index = _read_index(out_dir)
+        changed = sum(slide["changed"] for slide in index.get("slides", []))
+        print(
+            f"{len(index.get('slides', []))} slides, {changed} changed, "
+            f"{index.get('rendered', 0)} rendered in {index.get('seconds', 0):.1f}s"
+        )
+        return True
+    error = (result.stderr or result.stdout).strip().splitlines()[-20:]
+    print("\n".join(error), file=sys.stderr)
+    index = _read_index(out_dir) or {
+        "version": PREVIEW_VERSION,
+        "scene": scene,
+        "seconds": 0.0,
+        "slides": [],
+    }
+    index["error"] = "\n".join(error)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    _write_json(out_dir / INDEX_FILE, index)
+    (out_dir / "index.html").write_text(_PAGE, encoding="utf-8")
+    return False
+
+
+def serve(out_dir: Path, port: int) -> ThreadingHTTPServer:
+    """Serve *out_dir* on localhost:*port* from a background thread."""
+
+    class Handler(SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), partial(Handler, directory=str(out_dir)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def watch(
+    source: Path,
+    scene: str,
+    *,
+    out_dir: Path | None = None,
+    port: int = 8765,
+    interval: float = 0.5,
+) -> None:
+    """Render previews of *scene*, serve them and re-render whenever the talk changes."""
+    source = Path(source).resolve()
+    out_dir = Path(out_dir) if out_dir else preview_dir(source, scene)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    server = serve(out_dir, port)
+    print(f"Serving previews of {scene} at http://127.0.0.1:{server.server_port}/")
+    seen = _snapshot(source.parent)
+    _render_child(source, scene, out_dir)
+    try:
+        while True:
+            time.sleep(interval)
+            current = _snapshot(source.parent)
+            if current != seen:
+                seen = current
+                _render_child(source, scene, out_dir)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    render_preview(Path(sys.argv[1]), sys.argv[2], Path(sys.argv[3]))
@@ -0,0 +1,12 @@
+"""Render-performance helpers for TemplateSlide decks.
+
+These modules hook into the Manim render path of a `TemplateSlide` (recording,
+caching, frame handling).  They are switched on through class attributes on
+your slide subclass, so a talk that does not opt in renders exactly as before.
+
+Example
+-------
+>>> from manim_deck import TemplateSlide
+>>> class MyTalk(TemplateSlide):
+...     replay_dir = "replays"
+"""
@@ -0,0 +1,230 @@
+"""Scene-graph size budget and pruning of invisible mobjects.
+
+Per-frame render cost grows with the number of mobjects (and their points)
+on stage.  `StageMonitor` measures the stage at the start of every
+`play()` / `wait()` of a `TemplateSlide`, keeps per-segment statistics and
+warns once per slide when a `SceneBudget` is exceeded.  With
+``SceneBudget(prune=True)`` top-level mobjects that are fully transparent, or
+fully hidden under an opaque rectangle drawn on top of them, are left out of
+the segment's moving and static draw lists (`exclude_hidden`).  They stay on
+stage, in their place in the z-order, and are drawn again as soon as a later
+`play()` uncovers or fades them in.
+
+Usage
+-----
+>>> from manim_deck.render.budget import SceneBudget
+>>> class MyTalk(TemplateSlide):
+...     scene_budget = SceneBudget(max_mobjects=3000, prune=True)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+from manim import ImageMobject, Mobject, Rectangle, RoundedRectangle, VMobject, logger
+from manim.utils.family import extract_mobject_family_members
+
+from manim_deck.render.culling import stroke_margin
+
+
+@dataclass(frozen=True)
+class SceneBudget:
+    """Limits for the number of mobjects and points on stage.
+
+    Attributes:
+        max_mobjects: Warn when more mobjects with points are on stage (None = no limit).
+        max_points:   Warn when the stage holds more bezier points (None = no limit).
+        prune:        Skip drawing fully transparent / fully covered top-level mobjects.
+    """
+
+    max_mobjects: int | None = 5000
+    max_points: int | None = 500_000
+    prune: bool = False
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """Size of the stage during one rendered segment."""
+
+    slide: int
+    mobjects: int
+    points: int
+    frames: int
+
+
+def measure_stage(scene, hidden: Iterable[Mobject] = ()) -> tuple[int, int]:
+    """Return ``(mobjects, points)`` drawn from *scene*, leaving out the *hidden* ones."""
+    family = extract_mobject_family_members(
+        [*scene.mobjects, *scene.foreground_mobjects], only_those_with_points=True
+    )
+    if hidden:
+        skipped = set(extract_mobject_family_members(list(hidden)))
+        family = [mob for mob in family if mob not in skipped]
+    return len(family), sum(len(mob.points) for mob in family)
+
+
+# ── pruning
+
+
+def is_invisible(mob: Mobject) -> bool:
+    """True if nothing of *mob* (or its submobjects) would be drawn."""
+    for sub in mob.family_members_with_points():
+        if isinstance(sub, VMobject):
+            if np.any(sub.get_fill_opacities() > 0):
+                return False
+            if sub.get_stroke_width() > 0 and np.any(sub.get_stroke_opacities() > 0):
+                return False
+            if sub.get_stroke_width(background=True) > 0 and np.any(
+                sub.get_stroke_opacities(background=True) > 0
+            ):
+                return False
+        elif isinstance(sub, ImageMobject):
+            if sub.get_pixel_array()[:, :, 3].any():
+                return False
+        else:
+            return False
+    return True
+
+
+def _opaque_box(mob: Mobject) -> np.ndarray | None:
+    """Bounding box ``[xmin, ymin, xmax, ymax]`` if *mob* is an opaque axis-aligned rectangle."""
+    if not isinstance(mob, Rectangle) or isinstance(mob, RoundedRectangle):
+        return None
+    if len(mob.family_members_with_points()) != 1:
+        return None
+    if not np.all(mob.get_fill_opacities() >= 1):
+        return None
+    vertices = mob.get_vertices()[:, :2]
+    lo, hi = vertices.min(axis=0), vertices.max(axis=0)
+    on_corner = np.isclose(vertices, lo) | np.isclose(vertices, hi)
+    if not on_corner.all():
+        return None  # rotated
+    return np.concatenate([lo, hi])
+
+
+def _bounds(mob: Mobject) -> np.ndarray:
+    points = mob.get_all_points()
+    margin = max(stroke_margin(sub) for sub in mob.family_members_with_points())
+    lo = points[:, :2].min(axis=0) - margin
+    hi = points[:, :2].max(axis=0) + margin
+    return np.concatenate([lo, hi])
+
+
+def prunable_mobjects(scene, keep: set[Mobject] = frozenset()) -> list[Mobject]:
+    """Top-level mobjects of *scene* that are invisible or fully covered.
+
+    Mobjects in *keep* (e.g. those about to be animated) and mobjects with
+    updaters are never returned.
+    """
+    stage = list(scene.mobjects)
+    if scene.camera.use_z_index:
+        stage = sorted(stage, key=lambda m: m.z_index)
+
+    def untouched(mob):
+        return keep.isdisjoint(mob.get_family())
+
+    def candidate(mob):
+        return (
+            untouched(mob)
+            and not mob.get_family_updaters()
+            and mob.get_all_points().size > 0
+        )
+
+    pruned = [mob for mob in stage if candidate(mob) and is_invisible(mob)]
+
+    covers = [
+        (i, box)
+        for i, mob in enumerate(stage)
+        if untouched(mob) and (box := _opaque_box(mob)) is not None
+    ]
+    if not covers:
+        return pruned
+    cover_idx = np.array([i for i, _ in covers])
+    cover_box = np.array([box for _, box in covers])
+
+    gone = set(pruned)
+    for i, mob in enumerate(stage):
+        if mob in gone or not candidate(mob):
+            continue
+        b = _bounds(mob)
+        above = cover_idx > i
+        inside = (
+            above
+            & (cover_box[:, 0] <= b[0])
+            & (cover_box[:, 1] <= b[1])
+            & (cover_box[:, 2] >= b[2])
+            & (cover_box[:, 3] >= b[3])
+        )
+        if inside.any():
+            pruned.append(mob)
+    return pruned
+
+
+def exclude_hidden(scene, hidden: list[Mobject]) -> None:
+    """Leave *hidden* out of the moving and static mobjects of the current `play()`.
+
+    Call after ``Scene.begin_animations``; ``scene.mobjects`` is not touched.
+    """
+    skipped = set(extract_mobject_family_members(hidden))
+    moving = [mob for mob in scene.moving_mobjects if mob not in skipped]
+    if scene.moving_mobjects and not moving:
+        return  # the renderer draws the whole stage for an empty moving list
+    scene.moving_mobjects = moving
+    scene.static_mobjects = scene.get_restructured_mobject_list(scene.static_mobjects, hidden)
+
+
+# ── monitoring
+
+
+class StageMonitor:
+    """Track stage size per rendered segment and enforce a `SceneBudget`."""
+
+    def __init__(self, budget: SceneBudget):
+        self.budget = budget
+        self.stats: list[StageStats] = []
+        self.pruned = 0
+        self._warned_slides: set[int] = set()
+
+    def prune(self, scene, animations) -> list[Mobject]:
+        """Top-level mobjects of *scene* not to draw while *animations* play."""
+        keep = set(
+            extract_mobject_family_members([anim.mobject for anim in animations])
+        )
+        hidden = prunable_mobjects(scene, keep)
+        self.pruned += len(hidden)
+        return hidden
+
+    def record(self, scene, slide: int, hidden: list[Mobject] = ()) -> StageStats:
+        mobjects, points = measure_stage(scene, hidden)
+        frames = max(1, int(round(scene.duration * scene.camera.frame_rate)))
+        stats = StageStats(slide=slide, mobjects=mobjects, points=points, frames=frames)
+        self.stats.append(stats)
+
+        over = []
+        if self.budget.max_mobjects is not None and mobjects > self.budget.max_mobjects:
+            over.append(f"{mobjects} mobjects > {self.budget.max_mobjects}")
+        if self.budget.max_points is not None and points > self.budget.max_points:
+            over.append(f"{points} points > {self.budget.max_points}")
+        if over and slide not in self._warned_slides:
+            self._warned_slides.add(slide)
+            logger.warning(
+                "Slide %(slide)s exceeds the scene budget (%(over)s); "
+                "every frame of this slide pays for it.",
+                {"slide": slide, "over": ", ".join(over)},
+            )
+        return stats
+
+    def summary(self) -> dict:
+        """Peak and frame-weighted totals over all recorded segments."""
+        if not self.stats:
+            return {"segments": 0}
+        return {
+            "segments": len(self.stats),
+            "peak_mobjects": max(s.mobjects for s in self.stats),
+            "peak_points": max(s.points for s in self.stats),
+            "mobject_frames": sum(s.mobjects * s.frames for s in self.stats),
+            "point_frames": sum(s.points * s.frames for s in self.stats),
+            "pruned": self.pruned,
+        }
@@ -0,0 +1,267 @@
+"""Render-cost model: predicted render time and memory of each slide.
+
+A `CostModel` turns the size of a slide, as measured by a dry run (see
+`manim_deck.outline`), into seconds and bytes:
+
+    seconds = plays × play
+            + wait_frames × frame × pixels / reference pixels
+            + frames × (frame × pixels / reference pixels
+                        + mobjects × mobject_frame + points × point_frame)
+            + glyphs × glyph + tex_glyphs × tex_glyph
+
+    memory  = base + frame_buffers × frame size
+            + mobjects × mobject_bytes + points × point_bytes
+
+The built-in `DEFAULT_MODEL` holds rough numbers for a laptop.  `calibrate`
+measures the coefficients on this machine with a few micro-benchmarks
+(about half a minute); ``manim-deck calibrate`` stores the result in the
+cache dir, where `load_model` picks it up for outlines and builds.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, fields, replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+MODEL_FILE = "cost-model.json"
+MODEL_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Estimate:
+    """Predicted render time (seconds) and peak memory (bytes)."""
+
+    seconds: float
+    memory: int
+
+
+@dataclass(frozen=True)
+class CostModel:
+    """Per-unit costs of rendering, measured at *pixels* (width × height).
+
+    Attributes:
+        play:          Seconds of fixed overhead per ``play()`` (partial movie file).
+        frame:         Seconds to clear, composite and encode one frame.
+        mobject_frame: Seconds to draw one mobject in one frame.
+        point_frame:   Seconds to rasterize one bezier point in one frame.
+        glyph:         Seconds to lay out one character with Pango.
+        tex_glyph:     Seconds to typeset one character of LaTeX.
+        base:          Bytes in use before the scene builds anything.
+        frame_buffers: Frame-sized buffers alive while rendering (camera,
+                       background layer, encoder queue).
+        mobject_bytes: Bytes per mobject on stage, animation copies included.
+        point_bytes:   Bytes per bezier point on stage, animation copies included.
+        pixels:        Resolution the frame costs were measured at.
+        calibrated:    When `calibrate` measured the model ("" = built-in).
+    """
+
+    play: float = 0.03
+    frame: float = 4e-3
+    mobject_frame: float = 2e-5
+    point_frame: float = 1.5e-7
+    glyph: float = 2e-3
+    tex_glyph: float = 1.5e-2
+    base: int = 250_000_000
+    frame_buffers: int = 12
+    mobject_bytes: int = 6_000
+    point_bytes: int = 100
+    pixels: int = 1920 * 1080
+    calibrated: str = ""
+
+    def predict(self, slide, pixels: int) -> Estimate:
+        """Estimate for one `SlideOutline` rendered at *pixels* (width × height)."""
+        frame = self.frame * pixels / self.pixels
+        seconds = (
+            slide.plays * self.play
+            + (slide.frames + slide.wait_frames) * frame
+            + slide.mobject_frames * self.mobject_frame
+            + slide.point_frames * self.point_frame
+            + slide.glyphs * self.glyph
+            + slide.tex_glyphs * self.tex_glyph
+        )
+        memory = (
+            self.base
+            + self.frame_buffers * pixels * 4
+            + slide.mobjects * self.mobject_bytes
+            + slide.points * self.point_bytes
+        )
+        return Estimate(seconds, int(memory))
+
+    def save(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": MODEL_VERSION, **asdict(self)}
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> CostModel | None:
+        """The model saved at *path*, or None if it is missing or outdated."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.pop("version", None) != MODEL_VERSION:
+            return None
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+DEFAULT_MODEL = CostModel()
+
+
+def model_path(deck_config) -> Path:
+    return deck_config.cache_path(MODEL_FILE)
+
+
+def load_model(deck_config) -> CostModel:
+    """The calibrated model in *deck_config*'s cache dir, else `DEFAULT_MODEL`."""
+    return CostModel.load(model_path(deck_config)) or DEFAULT_MODEL
+
+
+# ── calibration
+
+
+def _max_rss() -> int:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return DEFAULT_MODEL.base
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _render(construct, frame_rate: float) -> tuple[float, int]:
+    """Seconds to render a throwaway scene running *construct*, and its frames."""
+    from manim import Scene
+
+    class Probe(Scene):
+        def construct(self):
+            construct(self)
+
+    scene = Probe()
+    start = time.perf_counter()
+    scene.render()
+    return time.perf_counter() - start, round(scene.time * frame_rate)
+
+
+def _grid(rows: int, cols: int, points_per_mobject: int):
+    from manim import VGroup, VMobject
+
+    steps = max(1, points_per_mobject // 4)
+    corners = [[i / steps, (i % 2) / 4, 0] for i in range(steps + 1)]
+    cells = [VMobject().set_points_as_corners(corners) for _ in range(rows * cols)]
+    group = VGroup(*cells).arrange_in_grid(rows, cols, buff=0.05)
+    return group.set_width(12).set_stroke(width=1).set_fill(opacity=0.5)
+
+
+def _allocated(build) -> int:
+    """Bytes still allocated by the objects *build* returns."""
+    tracemalloc.start()
+    try:
+        objects = build()
+        size = tracemalloc.get_traced_memory()[0]
+        del objects
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def calibrate(quality: str = "h", *, echo=print) -> CostModel:
+    """Measure a `CostModel` on this machine at the ``-q`` *quality*."""
+    import numpy as np
+    from manim import FadeIn, Rotate, Tex, Text, tempconfig
+
+    from manim_deck.outline import QUALITIES
+
+    base = _max_rss()
+    with tempfile.TemporaryDirectory() as media, tempconfig(
+        {
+            "quality": QUALITIES[quality],
+            "media_dir": media,
+            "disable_caching": True,
+            "verbosity": "WARNING",
+            "progress_bar": "none",
+        }
+    ):
+        from manim import config
+
+        fps = config.frame_rate
+        pixels = config.pixel_width * config.pixel_height
+
+        seconds, frames = _render(lambda s: (s.add(_grid(1, 1, 8)), s.wait(4)), fps)
+        frame = seconds / frames
+        echo(f"frame          {frame * 1000:8.2f} ms")
+
+        def short_plays(scene):
+            dot = _grid(1, 1, 8)
+            for _ in range(20):
+                scene.play(FadeIn(dot), run_time=1 / fps)
+
+        seconds, frames = _render(short_plays, fps)
+        play = max(0.0, (seconds - frames * frame) / 20)
+        echo(f"play           {play * 1000:8.2f} ms")
+
+        # many small mobjects vs. few large ones: solve for both per-frame costs
+        shapes = [(40, 40, 8), (4, 4, 4000)]
+        rows, rhs = [], []
+        for r, c, p in shapes:
+            group = _grid(r, c, p)
+            seconds, frames = _render(lambda s: s.play(Rotate(group, 0.2), run_time=2), fps)
+            mobjects = r * c
+            points = sum(len(m.points) for m in group.family_members_with_points())
+            rows.append([mobjects, points])
+            rhs.append(max(0.0, (seconds - play) / frames - frame))
+        mobject_frame, point_frame = np.clip(np.linalg.lstsq(rows, rhs, rcond=None)[0], 0, None)
+        echo(f"mobject frame  {mobject_frame * 1e6:8.2f} µs")
+        echo(f"point frame    {point_frame * 1e9:8.2f} ns")
+
+        words = [f"calibration {i} {time.time_ns()}" for i in range(20)]
+        start = time.perf_counter()
+        for word in words:
+            Text(word)
+        glyph = (time.perf_counter() - start) / sum(len(w.replace(" ", "")) for w in words)
+        echo(f"glyph          {glyph * 1000:8.2f} ms")
+
+        try:
+            start = time.perf_counter()
+            Tex(words[0])
+            tex_glyph = (time.perf_counter() - start) / len(words[0].replace(" ", ""))
+            echo(f"tex glyph      {tex_glyph * 1000:8.2f} ms")
+        except (OSError, ValueError, RuntimeError):
+            tex_glyph = DEFAULT_MODEL.tex_glyph
+            echo("tex glyph      (LaTeX not available, default kept)")
+
+        def animated(r, c, p):
+            group = _grid(r, c, p)
+            animation = FadeIn(group)
+            animation.begin()
+            return group, animation
+
+        rows = [[r * c, r * c * len(_grid(1, 1, p)[0].points)] for r, c, p in shapes]
+        allocated = [_allocated(lambda: animated(*shape)) for shape in shapes]
+        mobject_bytes, point_bytes = np.clip(
+            np.linalg.lstsq(rows, allocated, rcond=None)[0], 0, None
+        )
+        echo(f"mobject bytes  {mobject_bytes:8.0f}")
+        echo(f"point bytes    {point_bytes:8.0f}")
+
+    return replace(
+        DEFAULT_MODEL,
+        play=float(play),
+        frame=float(frame),
+        mobject_frame=float(mobject_frame),
+        point_frame=float(point_frame),
+        glyph=float(glyph),
+        tex_glyph=float(tex_glyph),
+        base=int(base),
+        mobject_bytes=int(mobject_bytes),
+        point_bytes=int(point_bytes),
+        pixels=pixels,
+        calibrated=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    )
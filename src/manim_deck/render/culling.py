@@ -0,0 +1,101 @@
+"""Off-screen culling for TemplateSlide.
+
+Manim's Cairo camera rasterizes every mobject on stage in every frame,
+including the ones that lie entirely outside the frame: a sector grid laid
+out below a pipeline, a legend next to a wide grid, a map zoomed in on by a
+`MovingCamera`.  With `TemplateSlide.cull_offscreen`, `DeckRenderer` drops
+every mobject (family member) whose bounding box, widened by its stroke,
+misses the camera frame before handing the rest to the camera, so
+off-screen content costs one bounding-box test per frame.
+
+Culling only skips drawing; the mobjects stay on stage and keep updating.
+3-D cameras are never culled (their frame is not a rectangle in scene
+coordinates).  `cull_overlay` stamps the count of culled mobjects onto each
+frame, for checking what a slide hides.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from manim import Text, ThreeDCamera, VMobject, config
+
+# stroke width 1 is this many scene units wide (Manim's Cairo line width multiple)
+STROKE_UNIT = 0.01
+
+
+def frame_box(camera) -> np.ndarray | None:
+    """``[x0, y0, x1, y1]`` of *camera*'s frame in scene units (None for 3-D cameras)."""
+    if isinstance(camera, ThreeDCamera):
+        return None
+    cx, cy = np.asarray(camera.frame_center, dtype=float)[:2]
+    hw, hh = camera.frame_width / 2, camera.frame_height / 2
+    return np.array([cx - hw, cy - hh, cx + hw, cy + hh])
+
+
+def stroke_margin(mob) -> float:
+    """Scene units *mob*'s stroke reaches beyond its points (0 for non-vector mobjects)."""
+    if not isinstance(mob, VMobject):
+        return 0.0
+    width = max(mob.get_stroke_width(), mob.get_stroke_width(background=True))
+    return width * STROKE_UNIT
+
+
+def cull(mobjects, box: np.ndarray) -> list:
+    """The *mobjects* (without submobjects) whose bounding box touches *box*."""
+    kept = []
+    for mob in mobjects:
+        points = mob.points
+        if not len(points):
+            continue
+        margin = stroke_margin(mob)
+        low = points[:, :2].min(axis=0) - margin
+        high = points[:, :2].max(axis=0) + margin
+        if low[0] <= box[2] and high[0] >= box[0] and low[1] <= box[3] and high[1] >= box[1]:
+            kept.append(mob)
+    return kept
+
+
+@dataclass
+class CullStats:
+    """Mobject draws per frame, with and without culling."""
+
+    frames: int = 0
+    drawn: int = 0
+    culled: int = 0
+
+    def record(self, drawn: int, culled: int) -> None:
+        self.frames += 1
+        self.drawn += drawn
+        self.culled += culled
+
+    def summary(self) -> str:
+        total = self.drawn + self.culled
+        share = self.culled / total if total else 0.0
+        return (
+            f"culled {self.culled} of {total} mobject draws ({share:.0%}) "
+            f"in {self.frames} frame updates"
+        )
+
+
+class CullOverlay:
+    """Text in the frame's bottom-right corner with the number of culled mobjects."""
+
+    def __init__(self, font_size: float = 20, color: str = "#FF5555"):
+        self.font_size = font_size
+        self.color = color
+        self._labels: dict[str, Text] = {}
+
+    def label(self, camera, culled: int, total: int) -> Text:
+        text = f"culled {culled} / {total}"
+        if text not in self._labels:
+            if len(self._labels) > 256:
+                self._labels.clear()
+            self._labels[text] = Text(text, font_size=self.font_size, color=self.color)
+        x0, y0, x1, _ = frame_box(camera)
+        # keep the same size on screen when a moving camera zooms
+        zoom = (x1 - x0) / config.frame_width
+        label = self._labels[text].copy().scale(zoom)
+        pad = 0.15 * zoom
+        return label.move_to([x1 - label.width / 2 - pad, y0 + label.height / 2 + pad, 0])
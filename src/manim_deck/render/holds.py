@@ -0,0 +1,58 @@
+"""Single-frame holds for static waits.
+
+A `wait()` where nothing changes already rasterizes only one frame in Manim,
+but that frame is still converted and encoded ``duration * fps`` times.
+
+Modes (`TemplateSlide.hold_frames`):
+
+- ``False``       — render waits as usual.
+- ``"trailing"``  — waits that end a slide emit a single frame: the pause
+                    manim-slides inserts before each slide boundary and the
+                    hold at the end of `title_slide`.  The presenter stays on
+                    the last frame of a slide anyway, so the presentation
+                    looks the same.  Slides that loop or advance on their own
+                    (``loop=True``, ``auto_next=True``) keep their waits.
+- ``True``        — as ``"trailing"``, and every other static wait keeps its
+                    full length but is written by `DeckFileWriter`, which
+                    converts the held frame to the codec's pixel format once
+                    and encodes copies of it (`manim_deck.render.writer`).
+
+Nothing outside the movie files is needed to play the result.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+HOLD_MODES = (False, "trailing", True)
+
+
+@dataclass(frozen=True)
+class Hold:
+    """One wait shortened to a single frame.
+
+    Attributes:
+        animation: Index of the wait among the scene's animations.
+        slide:     Index of the slide the wait ends.
+        requested: Duration asked for by the deck, in seconds.
+        emitted:   Duration actually encoded, in seconds.
+    """
+
+    animation: int
+    slide: int
+    requested: float
+    emitted: float
+
+
+class HoldLog:
+    """The shortened waits of one scene, for the end-of-render summary."""
+
+    def __init__(self):
+        self.holds: list[Hold] = []
+
+    def add(self, hold: Hold) -> None:
+        self.holds.append(hold)
+
+    @property
+    def saved_seconds(self) -> float:
+        return sum(h.requested - h.emitted for h in self.holds)
@@ -0,0 +1,121 @@
+"""Static background layer for TemplateSlide.
+
+For every `play()` the Cairo renderer rasterizes the "static" mobjects once
+into a background image and only redraws the "moving" ones per frame.  Out
+of the box Manim treats *everything after the first animated mobject* in the
+z-order as moving, so a pulsing box at the start of a pipeline makes every
+later box, label and arrow — and the footer added after it — redraw on every
+frame.
+
+`split_moving` narrows that list down.  A mobject is moved into the cached
+background layer when it is
+
+- pinned by the caller (`TemplateSlide.pin_to_background`), or
+- in auto mode, outside the region swept by the animations of this `play()`.
+
+The background layer is composited *under* the moving mobjects, so a pinned
+mobject that overlaps an animated one will be drawn below it.  Auto mode only
+moves mobjects that do not overlap any animated region, so the frame looks
+exactly the same.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+from manim import Animation, AnimationGroup, Mobject, MoveAlongPath
+from manim.utils.family import extract_mobject_family_members
+
+from manim_deck.render.culling import stroke_margin
+
+# Extra space around the swept region, in scene units, to cover strokes.
+ZONE_MARGIN = 0.1
+
+
+def _bbox(mobjects: Iterable[Mobject]) -> np.ndarray | None:
+    points = [m.get_all_points() for m in mobjects if m is not None]
+    points = [p for p in points if p.size]
+    if not points:
+        return None
+    pts = np.concatenate(points)[:, :2]
+    return np.concatenate([pts.min(axis=0), pts.max(axis=0)])
+
+
+def _leaf_animations(animations: Iterable[Animation]) -> Iterable[Animation]:
+    for anim in animations:
+        if isinstance(anim, AnimationGroup):
+            yield from _leaf_animations(anim.animations)
+        else:
+            yield anim
+
+
+def swept_zones(animations: Iterable[Animation]) -> list[np.ndarray]:
+    """Bounding boxes covering where each animation's mobject starts, travels and ends."""
+    zones = []
+    for anim in _leaf_animations(animations):
+        parts = [anim.mobject, getattr(anim, "target_mobject", None)]
+        if isinstance(anim, MoveAlongPath):
+            parts.append(anim.path)
+        box = _bbox(parts)
+        if box is not None:
+            zones.append(box + np.array([-1, -1, 1, 1]) * ZONE_MARGIN)
+    return zones
+
+
+def _overlaps(box: np.ndarray, zones: np.ndarray) -> bool:
+    if not len(zones):
+        return False
+    return bool(
+        np.any(
+            (box[0] <= zones[:, 2])
+            & (box[2] >= zones[:, 0])
+            & (box[1] <= zones[:, 3])
+            & (box[3] >= zones[:, 1])
+        )
+    )
+
+
+def split_moving(
+    scene,
+    moving: list[Mobject],
+    animations: Iterable[Animation],
+    pinned: Iterable[Mobject] = (),
+    auto: bool = False,
+) -> list[Mobject]:
+    """Filter Manim's *moving* list down to the mobjects that really change.
+
+    Everything removed from the returned list ends up in the static layer that
+    the renderer draws once per `play()`.
+    """
+    animations = list(animations)
+    hot = set(
+        extract_mobject_family_members(
+            [
+                *(anim.mobject for anim in _leaf_animations(animations)),
+                *scene.foreground_mobjects,
+                *(m for m in scene.get_mobject_family_members() if m.updaters),
+            ]
+        )
+    )
+    pinned = set(extract_mobject_family_members(list(pinned)))
+    zones = np.array(swept_zones(animations)) if auto else np.empty((0, 4))
+
+    kept = []
+    for mob in moving:
+        if mob in hot:
+            kept.append(mob)
+        elif not mob.has_points():
+            # Groups are represented by their members, which appear in *moving* too.
+            continue
+        elif mob in pinned:
+            continue
+        elif auto:
+            margin = stroke_margin(mob)
+            box = _bbox([mob]) + np.array([-1, -1, 1, 1]) * margin
+            if not _overlaps(box, zones):
+                continue
+            kept.append(mob)
+        else:
+            kept.append(mob)
+    return kept
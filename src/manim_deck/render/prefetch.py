@@ -0,0 +1,160 @@
+"""Build the mobjects of upcoming slides while the current one renders.
+
+Laying out a slide (Pango for `Text`, LaTeX for `BulletedList`, Pygments
+for `Code`) and rasterizing and encoding the previous one normally happen
+one after the other on the main thread.  A `Prefetcher` runs a worker
+thread that walks the slides ahead of the renderer and builds their
+mobjects; the slide methods then take the finished mobjects instead of
+building them (`TemplateSlide._prebuilt`).
+
+The worker stays at most *lookahead* slides ahead of the one being
+rendered: it waits for the renderer to finish a slide (`advance`) before
+starting another, which bounds the memory held by finished but unused
+mobjects.  A build the renderer asks for before the worker got
+to it is done by the renderer itself and skipped by the worker; a build
+that fails in the worker is simply done again by the renderer, so errors
+surface where they would without prefetching.
+
+Building is never concurrent with the renderer's own mobject code.  Manim
+writes laid-out text to an SVG cache keyed without colour, and Pango is not
+guaranteed to be thread-safe, so both threads share `build_lock`: the worker
+holds it for each build, the renderer holds it from `start` to `close` and
+lets go of it only while frames are rasterized and encoded (`rendering`).
+That is where the overlap comes from: Cairo drawing and the encoder threads
+run outside the GIL while the worker lays out the next slides.
+
+Usage
+-----
+>>> prefetcher = Prefetcher(lambda name, *args: getattr(slide, name)(*args), lookahead=2)
+>>> prefetcher.start([[("_build_text", ("Intro", "heading"))], ...])  # jobs per slide
+>>> mob = prefetcher.take(("_build_text", ("Intro", "heading")))      # None if not queued
+>>> with prefetcher.rendering():                                     # around play() / wait()
+...     scene.play(FadeIn(mob))
+>>> prefetcher.advance()                                             # after each slide
+>>> prefetcher.close()
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+from manim import logger
+
+# a job: (builder name, arguments); also the key it is taken by
+Job = tuple[str, tuple]
+
+
+class Prefetcher:
+    """Runs *build(name, *args)* for the jobs of upcoming slides on a worker thread."""
+
+    def __init__(self, build: Callable[..., object], lookahead: int = 2):
+        if lookahead < 1:
+            raise ValueError(f"lookahead must be at least 1, got {lookahead}")
+        self.build = build
+        self.lookahead = lookahead
+        # the slide being rendered plus *lookahead* more
+        self._slots = threading.Semaphore(lookahead + 1)
+        self._lock = threading.Lock()
+        # held by the worker while it builds, by the renderer outside `rendering`
+        self.build_lock = threading.Lock()
+        self._rendering = False
+        self._futures: dict[Hashable, Future] = {}
+        self._claimed: set[Hashable] = set()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.built = self.hits = self.misses = 0
+        self.waited = 0.0
+
+    def start(self, slides: Iterable[Iterable[Job]]) -> Prefetcher:
+        """Start building the jobs of *slides*, one list of jobs per slide, in order.
+
+        Call from the render thread: it holds `build_lock` until `close`.
+        """
+        self.build_lock.acquire()
+        self._thread = threading.Thread(
+            target=self._run, args=(list(slides),), name="manim-deck-prefetch", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def _run(self, slides: list[list[Job]]) -> None:
+        for jobs in slides:
+            self._slots.acquire()
+            if self._closed:
+                return
+            for name, args in jobs:
+                key = (name, args)
+                with self._lock:
+                    if key in self._claimed or key in self._futures:
+                        continue
+                    future = self._futures[key] = Future()
+                try:
+                    with self.build_lock:
+                        result = self.build(name, *args)
+                except Exception as exc:  # the renderer builds it again
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+                    self.built += 1
+
+    def take(self, key: Hashable):
+        """The prefetched result for *key*, waiting if it is being built; None if not queued."""
+        with self._lock:
+            future = self._futures.pop(key, None)
+            if future is None:
+                self._claimed.add(key)
+                self.misses += 1
+                return None
+        start = time.perf_counter()
+        try:
+            if not future.done():
+                # the worker needs the build lock to finish it
+                with self.rendering():
+                    future.result()
+            result = future.result()
+        except Exception as exc:
+            logger.debug("Prefetch of %(key)s failed: %(exc)s", {"key": key, "exc": exc})
+            return None
+        finally:
+            self.waited += time.perf_counter() - start
+        self.hits += 1
+        return result
+
+    @contextmanager
+    def rendering(self):
+        """Let the worker build while the render thread does not touch mobject code."""
+        if self._rendering:  # nested, e.g. Scene.wait() calling play()
+            yield
+            return
+        self._rendering = True
+        self.build_lock.release()
+        try:
+            yield
+        finally:
+            self.build_lock.acquire()
+            self._rendering = False
+
+    def advance(self) -> None:
+        """The renderer finished a slide: let the worker start one more."""
+        self._slots.release()
+
+    def close(self) -> None:
+        """Stop the worker after its current build and drop unused results."""
+        self._closed = True
+        self._slots.release()
+        if self._thread is not None:
+            with self.rendering():  # a build in progress may be waiting for the lock
+                self._thread.join()
+            self.build_lock.release()
+        with self._lock:
+            self._futures.clear()
+
+    def summary(self) -> str:
+        return (
+            f"{self.hits} prefetched builds used, {self.misses} built on the main thread, "
+            f"{self.waited:.2f}s waiting for the worker"
+        )
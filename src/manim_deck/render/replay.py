@@ -0,0 +1,373 @@
+"""Replay log of a rendered deck.
+
+While a `TemplateSlide` renders, a `ReplayLog` records the slide boundaries,
+every `play()` / `wait()` call and the serialized state of each mobject on
+stage before and after it.  The log can be turned back into a scene with
+`replay_scene()`, which re-creates the deck from raw points, colours and
+pixel arrays — no `Text` layout, no simulations, no module code.
+
+Replayed animations go from the recorded start state to the recorded end
+state: mobjects that appear are faded in, mobjects that leave are faded out
+and mobjects that change are transformed.  The timing, the slide sequence
+and every keyframe are identical to the original render; only the in-between
+easing of effects such as `Write` is approximated.
+
+The log also records which mobjects are drawn in which colour role of the
+deck's theme (``bg``, ``panel``, ``accent``, ``text``; see
+`TemplateSlide.set_color_role`).  ``replay_scene(..., theme=LIGHT_THEME)``
+re-colours every recorded state for another theme on the fly, so a light
+projector version of a dark deck is a replay, not a second run of the deck.
+
+Usage
+-----
+>>> class MyTalk(TemplateSlide):
+...     replay_dir = "replays"          # record on the first render
+>>> # replay.py — render with `manim-slides render replay.py MyTalkReplay`
+>>> MyTalkReplay = replay_scene("replays/MyTalk")
+>>> MyTalkLight = replay_scene("replays/MyTalk", theme=LIGHT_THEME)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+from manim import (
+    FadeIn,
+    FadeOut,
+    ImageMobject,
+    Mobject,
+    Transform,
+    VMobject,
+    Wait,
+)
+from manim.mobject.types.image_mobject import AbstractImageMobject
+from manim.utils.color import ManimColor
+from manim.utils.family import extract_mobject_family_members
+from manim_slides import Slide
+
+from manim_deck.templates.theme import Theme
+
+LOG_VERSION = 1
+LOG_FILE = "log.json"
+STATES_FILE = "states.npz"
+
+# next_slide() keyword arguments that survive a round-trip through JSON.
+_SLIDE_KWARGS = ("loop", "auto_next", "playback_rate", "reversed_playback_rate", "notes")
+# Colour arrays of a serialized VMobject that can carry a theme colour role.
+_COLOR_CHANNELS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+
+def stage_mobjects(scene) -> list[Mobject]:
+    """Return the mobjects on *scene* that have points, in render order."""
+    return extract_mobject_family_members(
+        [*scene.mobjects, *scene.foreground_mobjects],
+        use_z_index=scene.camera.use_z_index,
+        only_those_with_points=True,
+    )
+
+
+def serialize_mobject(mob: Mobject) -> dict[str, np.ndarray] | None:
+    """Return the arrays needed to redraw *mob*, or None if it is not supported."""
+    if isinstance(mob, VMobject):
+        return {
+            "kind": np.array(0),
+            "points": np.asarray(mob.points, dtype=np.float64),
+            "fill_rgbas": np.asarray(mob.get_fill_rgbas(), dtype=np.float64),
+            "stroke_rgbas": np.asarray(mob.get_stroke_rgbas(), dtype=np.float64),
+            "background_stroke_rgbas": np.asarray(
+                mob.get_stroke_rgbas(background=True), dtype=np.float64
+            ),
+            "widths": np.array(
+                [mob.stroke_width, mob.background_stroke_width, mob.z_index],
+                dtype=np.float64,
+            ),
+        }
+    if isinstance(mob, AbstractImageMobject):
+        return {
+            "kind": np.array(1),
+            "points": np.asarray(mob.points, dtype=np.float64),
+            "pixel_array": np.asarray(mob.get_pixel_array()),
+            "widths": np.array([0.0, 0.0, mob.z_index], dtype=np.float64),
+        }
+    return None
+
+
+def deserialize_mobject(state: dict[str, np.ndarray]) -> Mobject:
+    """Build a fresh mobject from the arrays returned by `serialize_mobject`."""
+    if int(state["kind"]) == 1:
+        mob = ImageMobject(state["pixel_array"])
+        mob.points = state["points"].copy()
+    else:
+        mob = VMobject()
+        mob.set_points(state["points"].copy())
+        mob.fill_rgbas = state["fill_rgbas"].copy()
+        mob.stroke_rgbas = state["stroke_rgbas"].copy()
+        mob.background_stroke_rgbas = state["background_stroke_rgbas"].copy()
+        mob.stroke_width = float(state["widths"][0])
+        mob.background_stroke_width = float(state["widths"][1])
+    mob.z_index = float(state["widths"][2])
+    return mob
+
+
+def color_roles(mob: Mobject, state: dict[str, np.ndarray], palette: dict[str, str]):
+    """Theme colour role of each colour channel of *state*, where it has one.
+
+    A channel has a role if all of its colours are that role's colour in
+    *palette*; the mobject's ``color_role`` tag picks between roles that
+    share a colour.
+    """
+    tag = getattr(mob, "color_role", None)
+    roles = {}
+    for channel in _COLOR_CHANNELS:
+        rgbas = state.get(channel)
+        if rgbas is None or not len(rgbas):
+            continue
+        rgb = np.unique(np.round(rgbas[:, :3] * 255).astype(int), axis=0)
+        if len(rgb) != 1:
+            continue
+        color = "#{:02X}{:02X}{:02X}".format(*rgb[0])
+        matches = [role for role, value in palette.items() if value == color]
+        if matches:
+            roles[channel] = tag if tag in matches else matches[0]
+    return roles
+
+
+def recolor_state(state: dict[str, np.ndarray], roles: dict[str, str], palette: dict[str, str]):
+    """Copy of *state* with each channel in *roles* set to its colour in *palette*."""
+    state = dict(state)
+    for channel, role in roles.items():
+        rgbas = state[channel].copy()
+        rgbas[:, :3] = ManimColor(palette[role]).to_rgb()
+        state[channel] = rgbas
+    return state
+
+
+def _state_key(state: dict[str, np.ndarray]) -> str:
+    digest = hashlib.sha1()
+    for name in sorted(state):
+        arr = np.ascontiguousarray(state[name])
+        digest.update(name.encode())
+        digest.update(str(arr.dtype).encode())
+        digest.update(str(arr.shape).encode())
+        digest.update(arr.tobytes())
+    return digest.hexdigest()[:20]
+
+
+class ReplayLog:
+    """Compact, deduplicated record of everything a deck put on screen.
+
+    Each mobject gets a stable integer handle; each distinct mobject state is
+    stored once, no matter how many events reference it.
+    """
+
+    def __init__(self, scene_name: str = "", theme: Theme | None = None):
+        self.scene_name = scene_name
+        self.frame: dict = {}
+        self.events: list[dict] = []
+        self.states: dict[str, dict[str, np.ndarray]] = {}
+        self.palette: dict[str, str] = theme.palette() if theme is not None else {}
+        self.roles: dict[str, dict[str, str]] = {}
+        self._handles: dict[int, int] = {}
+        # Keep recorded mobjects alive so their id() is never reused.
+        self._pinned: list[Mobject] = []
+
+    # ── recording
+
+    def _handle(self, mob: Mobject) -> int:
+        handle = self._handles.get(id(mob))
+        if handle is None:
+            handle = len(self._pinned)
+            self._handles[id(mob)] = handle
+            self._pinned.append(mob)
+        return handle
+
+    def snapshot(self, scene) -> list[list]:
+        """Return the current stage as a list of ``[handle, state_key]`` pairs."""
+        stage = []
+        for mob in stage_mobjects(scene):
+            state = serialize_mobject(mob)
+            if state is None:
+                continue
+            key = _state_key(state)
+            if key not in self.states:
+                self.states[key] = state
+                roles = color_roles(mob, state, self.palette) if self.palette else {}
+                if roles:
+                    self.roles[key] = roles
+            stage.append([self._handle(mob), key])
+        return stage
+
+    def record_frame(self, scene) -> None:
+        camera = scene.camera
+        self.frame = {
+            "width": float(camera.frame_width),
+            "height": float(camera.frame_height),
+            "background": ManimColor(camera.background_color).to_hex(),
+        }
+
+    def record_play(self, scene, start: list[list]) -> None:
+        animations = scene.animations or []
+        is_wait = len(animations) == 1 and isinstance(animations[0], Wait)
+        self.events.append(
+            {
+                "op": "wait" if is_wait else "play",
+                "run_time": float(scene.duration),
+                "animations": [type(anim).__name__ for anim in animations],
+                "start": start,
+                "end": self.snapshot(scene),
+            }
+        )
+
+    def record_next_slide(self, kwargs: dict) -> None:
+        self.events.append(
+            {
+                "op": "next_slide",
+                "kwargs": {k: kwargs[k] for k in _SLIDE_KWARGS if k in kwargs},
+            }
+        )
+
+    # ── persistence
+
+    def save(self, directory: str | Path) -> Path:
+        """Write ``log.json`` and ``states.npz`` into *directory*."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "version": LOG_VERSION,
+            "scene": self.scene_name,
+            "frame": self.frame,
+            "events": self.events,
+            "palette": self.palette,
+            "roles": self.roles,
+        }
+        (directory / LOG_FILE).write_text(json.dumps(meta), encoding="utf-8")
+        arrays = {
+            f"{key}/{name}": arr
+            for key, state in self.states.items()
+            for name, arr in state.items()
+        }
+        np.savez_compressed(directory / STATES_FILE, **arrays)
+        return directory
+
+    @classmethod
+    def load(cls, directory: str | Path) -> ReplayLog:
+        directory = Path(directory)
+        meta = json.loads((directory / LOG_FILE).read_text(encoding="utf-8"))
+        if meta.get("version") != LOG_VERSION:
+            raise ValueError(
+                f"Unsupported replay log version {meta.get('version')!r} in {directory}"
+            )
+        log = cls(meta["scene"])
+        log.frame = meta["frame"]
+        log.events = meta["events"]
+        log.palette = meta.get("palette", {})
+        log.roles = meta.get("roles", {})
+        with np.load(directory / STATES_FILE) as data:
+            for name in data.files:
+                key, field = name.split("/", 1)
+                log.states.setdefault(key, {})[field] = data[name]
+        return log
+
+
+class ReplaySlide(Slide):
+    """Slide that re-plays a `ReplayLog` instead of running a deck's construct().
+
+    With `theme` set, every state with recorded colour roles is re-coloured
+    for that theme as it is built.
+    """
+
+    log_dir: str = ""
+    theme: Theme | None = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.log = ReplayLog.load(self.log_dir)
+        self.palette = self.theme.palette() if self.theme is not None else {}
+        if self.log.frame:
+            background = self.log.frame["background"].upper()
+            if self.palette and background == self.log.palette.get("bg"):
+                background = self.palette["bg"]
+            self.camera.background_color = ManimColor(background)
+        # The recorded log already contains the waits manim-slides inserts
+        # between slides, so do not add them a second time.
+        self.wait_time_between_slides = 0.0
+        self._live: dict[int, Mobject] = {}
+        self._built: dict[int, str] = {}
+
+    def build_mobject(self, handle: int, key: str) -> Mobject:
+        """Return a fresh mobject for *key*.  Override to post-process states."""
+        state = self.log.states[key]
+        if self.palette and key in self.log.roles:
+            state = recolor_state(state, self.log.roles[key], self.palette)
+        return deserialize_mobject(state)
+
+    def _sync_stage(self, stage: list[list]) -> None:
+        """Instantly put the stage into the recorded *stage* state."""
+        order = []
+        for handle, key in stage:
+            mob = self._live.get(handle)
+            if mob is None or self._built.get(handle) != key:
+                new = self.build_mobject(handle, key)
+                if mob is not None:
+                    mob.become(new)
+                else:
+                    mob = new
+                self._live[handle] = mob
+                self._built[handle] = key
+            order.append(mob)
+        self.clear()
+        self.add(*order)
+
+    def _play_event(self, event: dict) -> None:
+        self._sync_stage(event["start"])
+        start = {handle: key for handle, key in event["start"]}
+        end = {handle: key for handle, key in event["end"]}
+
+        animations = []
+        for handle, key in event["end"]:
+            if handle not in start:
+                mob = self.build_mobject(handle, key)
+                self._live[handle] = mob
+                self._built[handle] = key
+                animations.append(FadeIn(mob))
+            elif start[handle] != key:
+                target = self.build_mobject(handle, key)
+                animations.append(Transform(self._live[handle], target))
+                self._built[handle] = key
+        for handle, _ in event["start"]:
+            if handle not in end:
+                animations.append(FadeOut(self._live.pop(handle)))
+                self._built.pop(handle, None)
+
+        run_time = event["run_time"]
+        if event["op"] == "wait" or not animations:
+            self.wait(run_time)
+        else:
+            self.play(*animations, run_time=run_time)
+        self._sync_stage(event["end"])
+
+    def construct(self):
+        for event in self.log.events:
+            if event["op"] == "next_slide":
+                self.next_slide(**event["kwargs"])
+            else:
+                self._play_event(event)
+
+
+def replay_scene(
+    log_dir: str | Path, name: str | None = None, *, theme: Theme | None = None
+) -> type[ReplaySlide]:
+    """Return a `ReplaySlide` subclass that renders the log stored in *log_dir*.
+
+    With *theme*, the deck is re-coloured for that theme; the default name
+    is then ``<Scene><Theme name>``, e.g. ``MyTalkLight``.
+    """
+    log_dir = Path(log_dir)
+    if name is None:
+        meta = json.loads((log_dir / LOG_FILE).read_text(encoding="utf-8"))
+        suffix = theme.name.title().replace(" ", "") if theme is not None else "Replay"
+        name = f"{meta['scene']}{suffix}"
+    return type(name, (ReplaySlide,), {"log_dir": str(log_dir), "theme": theme})
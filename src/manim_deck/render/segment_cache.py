@@ -0,0 +1,254 @@
+"""Rendered-segment cache shared across talks and machines.
+
+Manim names every partial movie file after a hash of the `play()` call that
+produced it: the camera, the animations and every mobject on stage.  Two
+talks that render an identical title slide, `section_slide` divider or
+`PipelineModule` diagram therefore produce partial movies with the same
+hash, but each talk keeps its own copy under its own media folder.
+
+With a segment cache, `DeckFileWriter` looks a missing partial movie up in a
+shared cache before rendering it, and publishes every partial movie it
+encodes.  Cache keys combine Manim's hash with the codec settings (so
+different qualities never mix), the Manim and manim_deck versions, and a
+full digest of every array on stage (`play_digest`): Manim's hash only keeps
+a few corner values of arrays over 1000 elements, so two images or large
+point sets that differ in the middle would otherwise share a segment.
+
+Backends (`TemplateSlide.segment_cache` or ``[render] segment_cache``):
+
+- ``True``             — ``<cache_dir>/segments`` next to manim_deck.toml.
+- ``"some/folder"``    — a directory, relative to manim_deck.toml.
+- ``"http://host:port"`` — a cache server speaking the protocol below,
+                         e.g. ``manim-deck cache-server`` on a render box.
+
+HTTP protocol: ``GET /segments/<key>`` returns the file or 404, and
+``PUT /segments/<key>`` stores the request body.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import os
+import re
+import shutil
+import tempfile
+import urllib.error
+import urllib.request
+from functools import cache, partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib import metadata
+from pathlib import Path
+
+import numpy as np
+
+CACHE_VERSION = 2
+_KEY = re.compile(r"^[0-9a-f]{40}$")
+
+# errors of a cache backend that should not abort the render
+CACHE_ERRORS = (OSError, http.client.HTTPException)
+
+
+@cache
+def _versions() -> dict[str, str]:
+    versions = {}
+    for package in ("manim", "manim-deck"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = "unknown"
+    return versions
+
+
+def array_digest(mobjects) -> str:
+    """Digest of every numeric array held by *mobjects* and their families."""
+    digest = hashlib.sha1()
+    seen: set[int] = set()
+    for mob in mobjects:
+        for member in mob.get_family():
+            if id(member) in seen:
+                continue
+            seen.add(id(member))
+            for name, value in sorted(vars(member).items(), key=lambda item: item[0]):
+                if isinstance(value, np.ndarray) and value.dtype != object:
+                    digest.update(f"{name}:{value.dtype}:{value.shape}".encode())
+                    digest.update(np.ascontiguousarray(value).data)
+    return digest.hexdigest()
+
+
+def _leaf_animations(animations):
+    for anim in animations:
+        yield anim
+        yield from _leaf_animations(getattr(anim, "animations", ()))
+
+
+def play_digest(scene) -> str:
+    """`array_digest` of the stage and the animations of the current `play()`."""
+    mobjects = [*scene.mobjects, *scene.foreground_mobjects]
+    for anim in _leaf_animations(scene.animations or ()):
+        for mob in (anim.mobject, getattr(anim, "target_mobject", None)):
+            if mob is not None:
+                mobjects.append(mob)
+    return array_digest(mobjects)
+
+
+def segment_key(play_hash: str, settings: dict, digest: str) -> str:
+    """Cache key of the partial movie for *play_hash* encoded with *settings*.
+
+    *digest* is the `play_digest` of the `play()` that produced it.
+    """
+    data = json.dumps(
+        [CACHE_VERSION, _versions(), play_hash, digest, settings], sort_keys=True, default=str
+    )
+    return hashlib.sha1(data.encode()).hexdigest()
+
+
+def _atomic_copy(source: Path, target: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(source, temp)
+        os.replace(temp, target)
+    except BaseException:
+        Path(temp).unlink(missing_ok=True)
+        raise
+
+
+class DirectoryCache:
+    """Segments stored as ``<root>/<key[:2]>/<key>`` files."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def fetch(self, key: str, target: Path) -> bool:
+        path = self.path(key)
+        if not path.is_file():
+            return False
+        _atomic_copy(path, target)
+        return True
+
+    def store(self, key: str, source: Path) -> None:
+        path = self.path(key)
+        if not path.is_file():
+            _atomic_copy(source, path)
+
+    def __repr__(self) -> str:
+        return f"DirectoryCache({str(self.root)!r})"
+
+
+class HttpCache:
+    """Segments stored on a cache server (see `serve`)."""
+
+    def __init__(self, url: str, timeout: float = 10.0):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def fetch(self, key: str, target: Path) -> bool:
+        try:
+            response = urllib.request.urlopen(f"{self.url}/segments/{key}", timeout=self.timeout)
+        except urllib.error.HTTPError as exc:
+            if exc.code == 404:
+                return False
+            raise
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with response, os.fdopen(fd, "wb") as out:
+                shutil.copyfileobj(response, out)
+            os.replace(temp, target)
+        except BaseException:
+            Path(temp).unlink(missing_ok=True)
+            raise
+        return True
+
+    def store(self, key: str, source: Path) -> None:
+        with open(source, "rb") as body:
+            request = urllib.request.Request(
+                f"{self.url}/segments/{key}",
+                data=body,
+                method="PUT",
+                headers={"Content-Length": str(source.stat().st_size)},
+            )
+            urllib.request.urlopen(request, timeout=self.timeout).close()
+
+    def __repr__(self) -> str:
+        return f"HttpCache({self.url!r})"
+
+
+def open_cache(setting: bool | str, deck_config) -> DirectoryCache | HttpCache | None:
+    """The backend for a ``segment_cache`` setting (None if caching is off)."""
+    if setting is False or setting == "":
+        return None
+    if setting is True:
+        return DirectoryCache(deck_config.cache_path("segments"))
+    if setting.startswith(("http://", "https://")):
+        return HttpCache(setting)
+    root = Path(setting).expanduser()
+    if not root.is_absolute() and deck_config.path is not None:
+        root = deck_config.path.parent / root
+    return DirectoryCache(root)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def __init__(self, *args, store: DirectoryCache, **kwargs):
+        self.store = store
+        super().__init__(*args, **kwargs)
+
+    def _key(self) -> str | None:
+        prefix, _, key = self.path.rpartition("/")
+        return key if prefix == "/segments" and _KEY.match(key) else None
+
+    def do_GET(self):
+        key = self._key()
+        path = self.store.path(key) if key else None
+        if path is None or not path.is_file():
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(path.stat().st_size))
+        self.end_headers()
+        with open(path, "rb") as f:
+            shutil.copyfileobj(f, self.wfile)
+
+    def do_PUT(self):
+        key = self._key()
+        length = int(self.headers.get("Content-Length", 0))
+        if key is None or length <= 0:
+            self.send_error(400)
+            return
+        path = self.store.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                remaining = length
+                while remaining:
+                    chunk = self.rfile.read(min(remaining, 1 << 20))
+                    if not chunk:
+                        break
+                    out.write(chunk)
+                    remaining -= len(chunk)
+            if remaining:
+                self.send_error(400)
+                return
+            os.replace(temp, path)
+        finally:
+            Path(temp).unlink(missing_ok=True)  # gone already if it was stored
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(root: str | Path, host: str = "127.0.0.1", port: int = 8766) -> ThreadingHTTPServer:
+    """A cache server storing segments under *root* (call ``serve_forever()``)."""
+    handler = partial(_Handler, store=DirectoryCache(root))
+    return ThreadingHTTPServer((host, port), handler)
@@ -0,0 +1,207 @@
+"""Frame transport between the render process and encoder processes.
+
+`FrameRing` is a ring of frame slots in one `multiprocessing.shared_memory`
+block.  The producer copies a frame into a free slot and sends only the slot
+index; the consumer reads the slot in place and hands it back.  Frames are
+never pickled and never pass through a pipe, which matters at ``-qk`` where
+a frame is 33 MB.  `PipeTransport` has the same interface over a pipe; it is
+the baseline of ``benchmarks/frame_transport.py`` and carries small frames.
+
+`EncoderProcessPool` keeps encoder processes alive for the whole render,
+each fed through its own transport.  `DeckFileWriter` uses it instead of
+encoder threads when ``encoder_processes`` is set in ``manim_deck.toml``.
+Shared memory only pays off reliably for large frames.  Below 1080p
+(`SHARED_MEMORY_MIN_BYTES`) the two queue round trips per frame can cost
+as much as the copy they save, so the pool uses `PipeTransport` there.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+
+# Encoder processes import Manim; spawning them keeps them clear of the
+# render process's threads.
+_CONTEXT = "spawn"
+
+# frames smaller than a 1080p RGBA frame go through a pipe
+SHARED_MEMORY_MIN_BYTES = 1080 * 1920 * 4
+
+
+def transport_class(shape, dtype="uint8") -> type:
+    """`FrameRing` for frames of at least `SHARED_MEMORY_MIN_BYTES`, else `PipeTransport`."""
+    size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    return FrameRing if size >= SHARED_MEMORY_MIN_BYTES else PipeTransport
+
+
+class FrameRing:
+    """Fixed number of frame slots in shared memory, passed by slot index."""
+
+    def __init__(self, shape, dtype="uint8", slots: int = 4, ctx=None):
+        ctx = ctx or mp.get_context(_CONTEXT)
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.slots = slots
+        size = int(np.prod(self.shape)) * self.dtype.itemsize * slots
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._owner = True
+        self._free = ctx.SimpleQueue()
+        self._full = ctx.SimpleQueue()
+        for slot in range(slots):
+            self._free.put(slot)
+        self._attach()
+
+    def _attach(self) -> None:
+        self._views = np.ndarray((self.slots, *self.shape), self.dtype, buffer=self._shm.buf)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_shm"] = self._shm.name
+        state["_owner"] = False
+        del state["_views"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._shm = shared_memory.SharedMemory(name=state["_shm"])
+        self._attach()
+
+    def write(self, frame: np.ndarray, num_frames: int = 1) -> None:
+        """Copy *frame* into a free slot (blocking while all slots are in use)."""
+        slot = self._free.get()
+        np.copyto(self._views[slot], frame)
+        self._full.put((slot, num_frames))
+
+    def close(self) -> None:
+        """Mark the end of the current stream of frames."""
+        self._full.put(None)
+
+    def read(self):
+        """Yield ``(frame, num_frames)`` until `close`; a frame is valid until the next."""
+        while (item := self._full.get()) is not None:
+            slot, num_frames = item
+            try:
+                yield self._views[slot], num_frames
+            finally:
+                self._free.put(slot)
+
+    def release(self) -> None:
+        """Detach from the shared memory (and free it, in the creating process)."""
+        self._views = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+class PipeTransport:
+    """`FrameRing` interface over a pipe: every frame is copied through the kernel."""
+
+    def __init__(self, shape, dtype="uint8", slots: int = 4, ctx=None):
+        ctx = ctx or mp.get_context(_CONTEXT)
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self._recv, self._send = ctx.Pipe(duplex=False)
+
+    def write(self, frame: np.ndarray, num_frames: int = 1) -> None:
+        self._send.send_bytes(num_frames.to_bytes(4, "little"))
+        self._send.send_bytes(np.ascontiguousarray(frame).reshape(-1))
+
+    def close(self) -> None:
+        self._send.send_bytes((0).to_bytes(4, "little"))
+
+    def read(self):
+        while num_frames := int.from_bytes(self._recv.recv_bytes(), "little"):
+            frame = np.frombuffer(self._recv.recv_bytes(), self.dtype).reshape(self.shape)
+            yield frame, num_frames
+
+    def release(self) -> None:
+        self._send.close()
+        self._recv.close()
+
+
+def _encoder_main(ring: FrameRing | PipeTransport, jobs, results) -> None:
+    from manim_deck.render.writer import encode_segment
+
+    while (job := jobs.get()) is not None:
+        path, settings, keyframes = job
+        frames = ring.read()
+        try:
+            encode_segment(path, settings, keyframes, frames)
+        except BaseException as exc:  # drain the segment so the renderer never blocks
+            for _ in frames:
+                pass
+            results.put((path, f"{type(exc).__name__}: {exc}"))
+        else:
+            results.put((path, None))
+    ring.release()
+
+
+class RemoteSegment:
+    """A partial movie being encoded by an `EncoderProcessPool` worker."""
+
+    def __init__(self, pool: EncoderProcessPool, worker: int, path):
+        self.pool = pool
+        self.worker = worker
+        self.path = str(path)
+
+    def write(self, frame: np.ndarray, num_frames: int) -> None:
+        self.pool.rings[self.worker].write(frame, num_frames)
+
+    def close(self) -> None:
+        self.pool.rings[self.worker].close()
+
+    def wait(self) -> None:
+        self.pool.wait(self.path)
+
+
+class EncoderProcessPool:
+    """Persistent encoder processes, one segment per process at a time."""
+
+    def __init__(self, workers: int, shape, slots: int = 4):
+        ctx = mp.get_context(_CONTEXT)
+        transport = transport_class(shape)
+        self.rings = [transport(shape, slots=slots, ctx=ctx) for _ in range(max(1, workers))]
+        self._jobs = [ctx.SimpleQueue() for _ in self.rings]
+        self._results = ctx.SimpleQueue()
+        self._processes = [
+            ctx.Process(target=_encoder_main, args=(ring, jobs, self._results), daemon=True)
+            for ring, jobs in zip(self.rings, self._jobs)
+        ]
+        for process in self._processes:
+            process.start()
+        self._busy: dict[int, str] = {}
+        self._done: dict[str, str | None] = {}
+
+    def _collect(self) -> None:
+        """Block until a worker reports a finished segment."""
+        path, error = self._results.get()
+        self._done[path] = error
+        self._busy = {w: p for w, p in self._busy.items() if p != path}
+
+    def open(self, path, settings: dict, keyframes: frozenset[int]) -> RemoteSegment:
+        """Start encoding the partial movie *path* on the next idle process."""
+        while len(self._busy) == len(self.rings):
+            self._collect()
+        worker = next(w for w in range(len(self.rings)) if w not in self._busy)
+        self._busy[worker] = str(path)
+        self._done.pop(str(path), None)
+        self._jobs[worker].put((str(path), settings, keyframes))
+        return RemoteSegment(self, worker, path)
+
+    def wait(self, path: str) -> None:
+        while path not in self._done:
+            self._collect()
+        error = self._done.pop(path)
+        if error is not None:
+            raise RuntimeError(f"encoding {Path(path).name} failed: {error}")
+
+    def shutdown(self) -> None:
+        for jobs in self._jobs:
+            jobs.put(None)
+        for process in self._processes:
+            process.join()
+        for ring in self.rings:
+            ring.release()
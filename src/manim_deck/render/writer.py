@@ -0,0 +1,504 @@
+"""Scene file writer and renderer used by `TemplateSlide`.
+
+`DeckFileWriter` is Manim's `SceneFileWriter` with two changes:
+
+* Streaming encode.  Every partial movie file is a segment encoded by a
+  persistent pool of encoder threads (PyAV releases the GIL while libx264
+  encodes).  Frames go through a bounded queue into reusable buffers, so the
+  render thread never allocates a frame and never waits for an encoder to
+  finish: closing a segment only queues its end, and the next `play()`
+  rasterizes while the previous segments are still encoding.  The writer
+  waits for all segments before the partial movies are combined.  A frame
+  held by a static wait is converted to the codec's pixel format once.
+* Keyframe markers.  `mark_keyframes` forces key frames at given frame
+  indices of the next partial movie file, and `split_partial_movie` then
+  cuts that file at those key frames by copying packets, without decoding
+  or re-encoding.  This is how `TemplateSlide.play_steps` encodes several
+  slides' worth of animation once and still hands manim-slides one file
+  per slide.
+
+With ``encoder_processes`` set, the segments are encoded in persistent
+processes instead, fed through shared memory (`manim_deck.render.transport`).
+
+`DeckRenderer` hands the camera's pixel array straight to the writer, which
+copies it into a pooled buffer, instead of allocating a copy per frame.  With
+``cull_offscreen`` it also skips mobjects outside the camera frame
+(`manim_deck.render.culling`).
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from queue import Queue
+
+import av
+import numpy as np
+from manim import config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
+from manim.utils.file_ops import write_to_movie
+from manim.utils.iterables import list_update
+
+from manim_deck.render.culling import CullOverlay, CullStats, cull, frame_box
+from manim_deck.render.segment_cache import CACHE_ERRORS, play_digest, segment_key
+from manim_deck.render.transport import EncoderProcessPool
+
+try:  # PyAV >= 14
+    _KEYFRAME = av.video.frame.PictureType.I
+except AttributeError:
+    _KEYFRAME = "I"
+
+ENCODER_THREADS = 2
+FRAME_QUEUE = 8
+# codec pixel formats PyAV builds frames from directly, for copies of a held frame
+_HELD_FORMATS = ("yuv420p",)
+
+
+class FramePool:
+    """Reusable frame buffers, so streaming a frame does not allocate one.
+
+    At most *limit* free buffers are kept; buffers released beyond that are
+    left to the garbage collector.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._free: list[np.ndarray] = []
+        self._lock = threading.Lock()
+
+    def copy(self, frame: np.ndarray) -> np.ndarray:
+        """Return a pooled buffer holding a copy of *frame*."""
+        with self._lock:
+            buffer = self._free.pop() if self._free else None
+        if buffer is None or buffer.shape != frame.shape or buffer.dtype != frame.dtype:
+            buffer = np.empty_like(frame)
+        np.copyto(buffer, frame)
+        return buffer
+
+    def release(self, buffer: np.ndarray) -> None:
+        with self._lock:
+            if len(self._free) < self.limit:
+                self._free.append(buffer)
+
+
+def stream_settings() -> dict:
+    """Codec and options Manim uses for partial movies, under the current config."""
+    codec, pix_fmt = "libx264", "yuv420p"
+    options = {"an": "1", "crf": "23"}
+    if config.movie_file_extension == ".webm":
+        codec = "libvpx-vp9"
+        options["-auto-alt-ref"] = "1"
+        if config.transparent:
+            pix_fmt = "yuva420p"
+    elif config.transparent:
+        codec, pix_fmt = "qtrle", "argb"
+    return {
+        "codec": codec,
+        "pix_fmt": pix_fmt,
+        "options": options,
+        "rate": to_av_frame_rate(config.frame_rate),
+        "width": config.pixel_width,
+        "height": config.pixel_height,
+    }
+
+
+def _held(frame: np.ndarray, pix_fmt: str) -> np.ndarray | None:
+    """*frame* converted to *pix_fmt* once, for repeated encoding (None if unsupported)."""
+    if pix_fmt not in _HELD_FORMATS or frame.shape[0] % 2 or frame.shape[1] % 2:
+        return None
+    return av.VideoFrame.from_ndarray(frame, format="rgba").reformat(format=pix_fmt).to_ndarray()
+
+
+def encode_segment(path, settings: dict, keyframes: frozenset[int], frames) -> None:
+    """Encode the ``(frame, num_frames)`` pairs of *frames* into the movie at *path*.
+
+    A frame held for several frames (a static wait) is converted to the
+    codec's pixel format once; its copies only copy the converted planes.
+    """
+    container = av.open(str(path), mode="w")
+    try:
+        stream = container.add_stream(
+            settings["codec"], rate=settings["rate"], options=settings["options"]
+        )
+        stream.pix_fmt = settings["pix_fmt"]
+        stream.width = settings["width"]
+        stream.height = settings["height"]
+        index = 0
+        for frame, num_frames in frames:
+            held = _held(frame, settings["pix_fmt"]) if num_frames > 1 else None
+            for _ in range(num_frames):
+                # a new VideoFrame per frame: the encoder may still reference the last one
+                if held is None:
+                    av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+                else:
+                    av_frame = av.VideoFrame.from_ndarray(held, format=settings["pix_fmt"])
+                if index in keyframes:
+                    av_frame.pict_type = _KEYFRAME
+                index += 1
+                for packet in stream.encode(av_frame):
+                    container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+    finally:
+        container.close()
+    logger.info("Partial movie file written in %(path)s", {"path": f"'{path}'"})
+
+
+class Segment:
+    """One partial movie file, fed to an encoder thread through a bounded queue."""
+
+    def __init__(self, path, settings: dict, keyframes: frozenset[int], depth: int, pool):
+        self.path = path
+        self.settings = settings
+        self.keyframes = keyframes
+        self.pool = pool
+        self.queue: Queue[tuple[np.ndarray, int] | None] = Queue(maxsize=depth)
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+
+    def write(self, frame: np.ndarray, num_frames: int) -> None:
+        # blocks while the queue is full, so a slow encoder throttles rendering
+        self.queue.put((self.pool.copy(frame), num_frames))
+
+    def close(self) -> None:
+        self.queue.put(None)
+
+    def _frames(self):
+        while (item := self.queue.get()) is not None:
+            frame, num_frames = item
+            try:
+                yield frame, num_frames
+            finally:
+                self.pool.release(frame)
+
+    def encode(self) -> None:
+        frames = self._frames()
+        try:
+            encode_segment(self.path, self.settings, self.keyframes, frames)
+        except BaseException as exc:
+            self.error = exc
+            for _ in frames:  # keep draining so the renderer never blocks
+                pass
+        finally:
+            self.done.set()
+
+    def wait(self) -> None:
+        self.done.wait()
+        if self.error is not None:
+            raise RuntimeError(f"encoding {self.path} failed") from self.error
+
+
+class EncoderPool:
+    """Persistent threads, each encoding one segment at a time, until `shutdown`."""
+
+    def __init__(self, workers: int, depth: int):
+        workers = max(1, workers)
+        self.depth = depth
+        # one queue's worth of frames plus the one each encoder is working on
+        self.pool = FramePool(depth + workers)
+        self._jobs: Queue[Segment | None] = Queue()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"deck-encoder-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _run(self) -> None:
+        while (segment := self._jobs.get()) is not None:
+            segment.encode()
+
+    def open(self, path, settings: dict, keyframes: frozenset[int]) -> Segment:
+        segment = Segment(path, settings, keyframes, self.depth, self.pool)
+        self._jobs.put(segment)
+        return segment
+
+    def shutdown(self) -> None:
+        """Stop the threads once the segments queued so far are encoded."""
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+
+
+class DeckFileWriter(SceneFileWriter):
+    """`SceneFileWriter` with a streaming encoder pool and key frame markers."""
+
+    encoder_threads = ENCODER_THREADS
+    encoder_processes = 0
+    frame_queue = FRAME_QUEUE
+    segment_cache = None
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self._pending_keyframes: frozenset[int] = frozenset()
+        self._encoders: EncoderPool | EncoderProcessPool | None = None
+        self._segment = None
+        self._segments: list = []
+        self._segment_keys: dict[str, str] = {}  # play hash -> segment cache key
+
+    def configure(
+        self,
+        *,
+        encoder_threads: int,
+        frame_queue: int,
+        encoder_processes: int = 0,
+        segment_cache=None,
+    ) -> None:
+        """Set the encoder pool, queue depth and segment cache (before the first play).
+
+        With *encoder_processes*, partial movies are encoded in that many
+        processes fed through shared memory (see `manim_deck.render.transport`)
+        instead of in *encoder_threads* threads.  *segment_cache* is a backend
+        from `manim_deck.render.segment_cache.open_cache`, or None.
+        """
+        self.encoder_threads = encoder_threads
+        self.encoder_processes = encoder_processes
+        self.frame_queue = frame_queue
+        self.segment_cache = segment_cache
+
+    def _pool(self):
+        if self._encoders is None:
+            if self.encoder_processes:
+                shape = (config.pixel_height, config.pixel_width, 4)
+                self._encoders = EncoderProcessPool(
+                    self.encoder_processes, shape, slots=self.frame_queue
+                )
+            else:
+                self._encoders = EncoderPool(self.encoder_threads, self.frame_queue)
+        return self._encoders
+
+    def is_already_cached(self, hash_invocation: str) -> bool:
+        if super().is_already_cached(hash_invocation):
+            return True
+        if self.segment_cache is None or hash_invocation.startswith("uncached_"):
+            return False
+        if not hasattr(self, "partial_movie_directory") or not write_to_movie():
+            return False
+        scene = getattr(self.renderer, "scene", None)
+        if scene is None:
+            return False
+        key = segment_key(hash_invocation, stream_settings(), play_digest(scene))
+        self._segment_keys[hash_invocation] = key
+        path = self.partial_movie_directory / f"{hash_invocation}{config.movie_file_extension}"
+        try:
+            found = self.segment_cache.fetch(key, path)
+        except CACHE_ERRORS as exc:
+            logger.warning(
+                "Segment cache %(cache)r unavailable: %(error)s",
+                {"cache": self.segment_cache, "error": exc},
+            )
+            self.segment_cache = None
+            return False
+        if found:
+            logger.info(
+                "Animation %(n)d : using %(path)s from the segment cache",
+                {"n": self.renderer.num_plays, "path": path.name},
+            )
+        return found
+
+    def _publish(self, path) -> None:
+        """Store the finished partial movie at *path* in the segment cache."""
+        path = Path(path)
+        key = self._segment_keys.pop(path.stem, None)
+        if key is None:
+            return  # not looked up in the cache: uncached or played without a scene
+        try:
+            self.segment_cache.store(key, path)
+        except CACHE_ERRORS as exc:
+            logger.warning(
+                "Could not store %(path)s in segment cache %(cache)r: %(error)s",
+                {"path": path.name, "cache": self.segment_cache, "error": exc},
+            )
+
+    def mark_keyframes(self, frames) -> None:
+        """Force key frames at *frames* (frame indices) of the next partial movie."""
+        self._pending_keyframes = frozenset(frames)
+
+    def open_partial_movie_stream(self, file_path=None) -> None:
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+        keyframes, self._pending_keyframes = self._pending_keyframes, frozenset()
+        self._segment = self._pool().open(file_path, stream_settings(), keyframes)
+        self._segments.append(self._segment)
+
+    def write_frame(self, frame_or_renderer, num_frames: int = 1) -> None:
+        if self._segment is None or not write_to_movie():
+            super().write_frame(frame_or_renderer, num_frames)
+            return
+        self._segment.write(frame_or_renderer, num_frames)
+
+    def close_partial_movie_stream(self) -> None:
+        # the encoder flushes and closes the file while the next play renders
+        self._segment.close()
+        self._segment = None
+        logger.debug(
+            "Animation %(n)d : partial movie file queued for %(path)s",
+            {"n": self.renderer.num_plays, "path": f"'{self.partial_movie_file_path}'"},
+        )
+
+    def flush(self, path=None) -> None:
+        """Wait until the partial movie at *path* (default: every one) is written."""
+        pending = [s for s in self._segments if path is None or Path(s.path) == Path(path)]
+        for segment in pending:
+            segment.wait()
+            if self.segment_cache is not None:
+                self._publish(segment.path)
+        self._segments = [s for s in self._segments if s not in pending]
+
+    def finish(self) -> None:
+        self.flush()
+        if self._encoders is not None:
+            self._encoders.shutdown()
+            self._encoders = None
+        super().finish()
+
+
+class DeckRenderer(CairoRenderer):
+    """`CairoRenderer` that streams frames without a per-frame copy.
+
+    With `cull_offscreen`, mobjects outside the camera frame are not drawn;
+    `cull_overlay` stamps the culled count onto each frame.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cull_offscreen = False
+        self.cull_overlay = False
+        self.cull_stats = CullStats()
+        self._overlay = CullOverlay()
+        self._static_counts = (0, 0)  # culled, total of the static layer
+        self._capturing_static = False
+        self.scene = None  # scene of the current play(), for the segment cache key
+
+    def play(self, scene, *args, **kwargs):
+        self.scene = scene
+        return super().play(scene, *args, **kwargs)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self._static_counts = (0, 0)
+        self._capturing_static = True
+        try:
+            return super().save_static_frame_data(scene, static_mobjects)
+        finally:
+            self._capturing_static = False
+
+    def update_frame(
+        self,
+        scene,
+        mobjects=None,
+        include_submobjects: bool = True,
+        ignore_skipping: bool = True,
+        **kwargs,
+    ):
+        if not self.cull_offscreen:
+            super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+            return
+        if self.skip_animations and not ignore_skipping:
+            return
+        if not mobjects:
+            mobjects = list_update(scene.mobjects, scene.foreground_mobjects)
+        if self.static_image is not None:
+            self.camera.set_frame_to_background(self.static_image)
+        else:
+            self.camera.reset()
+        box = frame_box(self.camera)
+        members = self.camera.get_mobjects_to_display(
+            mobjects, include_submobjects=include_submobjects, **kwargs
+        )
+        kept = members if box is None else cull(members, box)
+        culled = len(members) - len(kept)
+        self.cull_stats.record(len(kept), culled)
+        self.camera.capture_mobjects(kept, include_submobjects=False)
+        if self._capturing_static:
+            self._static_counts = (culled, len(members))
+        elif self.cull_overlay and box is not None:
+            static_culled, static_total = self._static_counts
+            label = self._overlay.label(
+                self.camera, culled + static_culled, len(members) + static_total
+            )
+            self.camera.capture_mobjects([label])
+
+    def render(self, scene, time, moving_mobjects):
+        self.update_frame(scene, moving_mobjects)
+        # DeckFileWriter copies the pixels into a pooled buffer
+        writer = self.file_writer
+        frame = self.camera.pixel_array if isinstance(writer, DeckFileWriter) else self.get_frame()
+        self.add_frame(frame)
+
+
+def piece_paths(path: Path, count: int, folder: Path) -> list[Path]:
+    return [folder / f"{path.stem}.part{i}{path.suffix}" for i in range(count)]
+
+
+def _open_piece(target: Path, template):
+    container = av.open(str(target), mode="w")
+    if hasattr(container, "add_stream_from_template"):
+        stream = container.add_stream_from_template(template)
+    else:
+        stream = container.add_stream(template=template)
+    return container, stream
+
+
+def split_partial_movie(path: str | Path, cuts: list[int], folder: Path) -> list[Path] | None:
+    """Cut the movie at *path* before each frame index in *cuts*.
+
+    Every cut must fall on a key frame (see `DeckFileWriter.mark_keyframes`).
+    Returns the ``len(cuts) + 1`` piece files, written to *folder*, or None if
+    the key frames do not line up with *cuts*.  *folder* must not be Manim's
+    partial movie directory, whose files `SceneFileWriter.clean_cache` may
+    delete while the pieces are still to be combined.  Pieces left over from
+    an earlier render of the same file are reused.
+    """
+    path = Path(path)
+    folder.mkdir(parents=True, exist_ok=True)
+    pieces = piece_paths(path, len(cuts) + 1, folder)
+    mtime = path.stat().st_mtime
+    if all(p.is_file() and p.stat().st_mtime >= mtime for p in pieces):
+        return pieces
+
+    temps = [p.with_name(f"{p.stem}.tmp{p.suffix}") for p in pieces]
+    with av.open(str(path)) as source:
+        stream = source.streams.video[0]
+        rate = stream.average_rate or stream.guessed_rate
+
+        def frame_of(packet) -> int:
+            return round(packet.pts * stream.time_base * rate)
+
+        index, offset = 0, None
+        container, out = _open_piece(temps[0], stream)
+        try:
+            for packet in source.demux(stream):
+                if packet.dts is None:
+                    continue
+                if index < len(cuts) and packet.is_keyframe and frame_of(packet) >= cuts[index]:
+                    if frame_of(packet) != cuts[index]:
+                        break
+                    container.close()
+                    index += 1
+                    container, out = _open_piece(temps[index], stream)
+                    offset = None
+                if offset is None:
+                    # rebase on the first dts: with B-frames it precedes the
+                    # first pts, and both must move together to keep pts >= dts
+                    offset = packet.dts
+                packet.pts -= offset
+                packet.dts -= offset
+                packet.stream = out
+                container.mux(packet)
+        finally:
+            container.close()
+
+    if index != len(cuts):
+        logger.warning(
+            "Could not split %(path)s at frames %(cuts)s: key frames do not line up",
+            {"path": str(path), "cuts": cuts},
+        )
+        for temp in temps:
+            temp.unlink(missing_ok=True)
+        return None
+    for temp, piece in zip(temps, pieces):
+        temp.replace(piece)
+    return pieces
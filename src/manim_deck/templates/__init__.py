@@ -1,2 +1,38 @@
-from manim_deck.templates.base import TemplateSlide  # noqa: F401
-from manim_deck.templates.theme import Theme, DARK_THEME, LIGHT_THEME  # noqa: F401
+"""Slide templates.
+
+The names below are imported on first use (PEP 562): `TemplateSlide`
+imports Manim, the themes do not.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+_EXPORTS = {
+    "TemplateSlide": "manim_deck.templates.base",
+    "Theme": "manim_deck.templates.theme",
+    "DARK_THEME": "manim_deck.templates.theme",
+    "LIGHT_THEME": "manim_deck.templates.theme",
+    "COLOR_ROLES": "manim_deck.templates.theme",
+}
+
+__all__ = ["TemplateSlide", "Theme", "DARK_THEME", "LIGHT_THEME", "COLOR_ROLES"]
+
+if TYPE_CHECKING:
+    from manim_deck.templates.base import TemplateSlide
+    from manim_deck.templates.theme import COLOR_ROLES, DARK_THEME, LIGHT_THEME, Theme
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -19,14 +19,92 @@ Example
 
 from __future__ import annotations
 
-from manim import * # noqa: F401
-from manim_slides import Slide 
+import inspect
+from contextlib import nullcontext
+from pathlib import Path
+
+import numpy as np
+from manim import (
+    DEFAULT_WAIT_TIME,
+    DL,
+    DOWN,
+    LEFT,
+    ORIGIN,
+    RIGHT,
+    UL,
+    UP,
+    UR,
+    Animation,
+    BulletedList,
+    Camera,
+    Circle,
+    Code,
+    FadeIn,
+    FadeOut,
+    Group,
+    ImageMobject,
+    Line,
+    Mobject,
+    Paragraph,
+    RendererType,
+    SceneFileWriter,
+    Succession,
+    Text,
+    VGroup,
+    config,
+    logger,
+)
+from manim_slides import Slide
 from manim.utils.color import ManimColor
 
-from manim_deck.config import load_defaults
-from manim_deck.templates.theme import Theme, DARK_THEME
+from manim_deck.config import RenderSettings, load_config
+from manim_deck.render.budget import SceneBudget, StageMonitor, exclude_hidden
+from manim_deck.render.holds import HOLD_MODES, Hold, HoldLog
+from manim_deck.render.layers import split_moving
+from manim_deck.render.prefetch import Prefetcher
+from manim_deck.render.replay import ReplayLog
+from manim_deck.render.segment_cache import open_cache
+from manim_deck.render.writer import DeckFileWriter, DeckRenderer, split_partial_movie
+from manim_deck.templates.theme import COLOR_ROLES, Theme, DARK_THEME
 
 DEFAULT_RUN_TIME = 0.9
+LIST_REVEALS = ("steps", "single")
+
+
+def _talk_file(cls: type) -> Path | None:
+    """Source file defining *cls*; manim_deck.toml is looked up from there."""
+    try:
+        return Path(inspect.getfile(cls))
+    except (TypeError, OSError):
+        return None
+
+
+def _camera_class(cls: type):
+    """Default ``camera_class`` of the first scene class in *cls*'s MRO that declares one.
+
+    `MovingCameraScene` and `ThreeDScene` pass their camera class on to
+    ``Scene.__init__``, which only works when they come before TemplateSlide.
+    """
+    for base in cls.__mro__:
+        init = base.__dict__.get("__init__")
+        if init is None:
+            continue
+        try:
+            parameter = inspect.signature(init).parameters.get("camera_class")
+        except (TypeError, ValueError):
+            continue
+        if parameter is not None and parameter.default is not inspect.Parameter.empty:
+            return parameter.default
+    return Camera
+
+
+def _overrides(cls: type, name: str) -> bool:
+    """True if a subclass of TemplateSlide sets the class attribute *name*."""
+    return any(
+        name in vars(klass)
+        for klass in cls.__mro__
+        if klass is not TemplateSlide and issubclass(klass, TemplateSlide)
+    )
 
 
 class TemplateSlide(Slide):
@@ -37,32 +115,241 @@ class TemplateSlide(Slide):
         author         : str         — your name (shown on title slide footer).
         email          : str         — your email (available for custom slides).
         theme          : Theme       — visual theme (defaults to DARK_THEME).
+        replay_dir     : str | None  — if set, record a replay log of the render
+                                       into ``<replay_dir>/<ClassName>/``
+                                       (see `manim_deck.render.replay`).
+        scene_budget   : SceneBudget | None — stage size limits, checked on every
+                                       play() (None, the default: no stage monitor).
+        cache_static_background : bool — rasterize mobjects that are not touched by
+                                       a play() once into a background layer
+                                       (see `manim_deck.render.layers`).
+        hold_frames    : bool | str  — emit a single frame for static waits that end
+                                       a slide ("trailing"), and also encode every
+                                       other static wait from one converted frame
+                                       (True) (see `manim_deck.render.holds`).
+        list_reveal    : str         — how `list_slide` reveals bullets one by one:
+                                       "steps" (one animation per bullet) or
+                                       "single" (one animation cut into slides,
+                                       see `play_steps`).
+        encoder_threads : int        — partial movies encoded in the background
+                                       while the next play() renders
+                                       (0: Manim's own writer;
+                                       see `manim_deck.render.writer`).
+        segment_cache  : bool | str  — share rendered partial movies with other
+                                       talks: True (local cache dir), a folder
+                                       or an http:// cache server
+                                       (see `manim_deck.render.segment_cache`).
+        cull_offscreen : bool        — skip drawing mobjects entirely outside the
+                                       camera frame (see `manim_deck.render.culling`).
+        cull_overlay   : bool        — stamp the number of culled mobjects onto
+                                       every frame (for debugging).
+        prefetch_slides : int        — build the texts, bullet lists and code blocks
+                                       of up to this many upcoming slides on a
+                                       worker thread while the current one renders
+                                       (0: off; declarative decks only, see
+                                       `DeckSlide` and `manim_deck.render.prefetch`).
+
+    `scene_budget`, `cache_static_background`, `hold_frames`,
+    `encoder_threads`, `segment_cache`, `cull_offscreen`, `cull_overlay` and
+    `prefetch_slides` default to the ``[render]`` section of the nearest
+    manim_deck.toml above the talk file (see `manim_deck.config`).
+
+    A talk that switches none of these on renders through Manim's own
+    renderer and file writer.  Otherwise `DeckRenderer` (and, for the encode
+    and cache settings and the single-pass list reveal, `DeckFileWriter`) is
+    installed; the camera class of a scene mixed in after TemplateSlide (e.g.
+    ``class Talk(TemplateSlide, MovingCameraScene)``) is honoured then as well.
     """
 
     section_titles: list[str] = []
     author: str = ""
     email: str = ""
     theme: Theme = DARK_THEME
+    replay_dir: str | None = None
+    scene_budget: SceneBudget | None = None
+    cache_static_background: bool = False
+    hold_frames: bool | str = False
+    list_reveal: str = "steps"
+    encoder_threads: int = 0
+    segment_cache: bool | str = False
+    cull_offscreen: bool = False
+    cull_overlay: bool = False
+    prefetch_slides: int = 0
 
     def __init__(self, **kwargs):
+        self.deck_config = load_config(start=_talk_file(type(self)))
+        self._apply_render_settings(self.deck_config.render)
+        uses_writer = self._uses_deck_writer()
+        if (
+            "renderer" not in kwargs
+            and config.renderer == RendererType.CAIRO
+            and (uses_writer or self.cull_offscreen or self.cull_overlay)
+        ):
+            kwargs["renderer"] = DeckRenderer(
+                file_writer_class=DeckFileWriter if uses_writer else SceneFileWriter,
+                camera_class=kwargs.get("camera_class") or _camera_class(type(self)),
+                skip_animations=kwargs.get("skip_animations", False),
+            )
         super().__init__(**kwargs)
-        defaults = load_defaults()
+        defaults = self.deck_config.defaults
         if not self.author:
             self.author = defaults.author
         if not self.email:
             self.email = defaults.email
+        self._configure_renderer(self.deck_config.render)
         self.camera.background_color = ManimColor(self.theme.bg)
         self.slide_counter = 0
         self.wait_time_between_slides = 0.1
         self.current_section: int = 0
+        self._replay = ReplayLog(type(self).__name__, self.theme) if self.replay_dir else None
+        self.stage_monitor = StageMonitor(self.scene_budget) if self.scene_budget else None
+        self._background: list[Mobject] = []
+        if self.hold_frames not in HOLD_MODES:
+            raise ValueError(
+                f"hold_frames must be one of {HOLD_MODES}, got {self.hold_frames!r}"
+            )
+        self._holds = HoldLog() if self.hold_frames else None
+        self._trailing_wait = False
+        self._text_cache: dict[tuple, Text] = {}
+        self._progress_cache: dict[tuple, VGroup] = {}
+        self._split_files: dict[Path, list[Path]] = {}
+        self._preview = None  # set by manim_deck.preview
+        self._prefetcher: Prefetcher | None = None  # set while prefetching, see DeckSlide
+
+    # ── internal helpers
+
+    def _apply_render_settings(self, render: RenderSettings):
+        """Take the ``[render]`` config for every attribute the talk does not set itself."""
+        cls = type(self)
+        if not _overrides(cls, "scene_budget"):
+            self.scene_budget = (
+                SceneBudget(render.max_mobjects, render.max_points, render.prune)
+                if render.scene_budget
+                else None
+            )
+        if not _overrides(cls, "cache_static_background"):
+            self.cache_static_background = render.cache_static_background
+        if not _overrides(cls, "hold_frames"):
+            self.hold_frames = render.hold_frames
+        if not _overrides(cls, "encoder_threads"):
+            self.encoder_threads = render.encoder_threads
+        if not _overrides(cls, "segment_cache"):
+            self.segment_cache = render.segment_cache
+        if not _overrides(cls, "cull_offscreen"):
+            self.cull_offscreen = render.cull_offscreen
+        if not _overrides(cls, "cull_overlay"):
+            self.cull_overlay = render.cull_overlay
+        if not _overrides(cls, "prefetch_slides"):
+            self.prefetch_slides = render.prefetch_slides
+
+    def _uses_deck_writer(self) -> bool:
+        """True if a setting needs `DeckFileWriter`: encoding, segment cache, key frames."""
+        return bool(
+            self.encoder_threads
+            or self.deck_config.render.encoder_processes
+            or self.segment_cache
+            or self.list_reveal == "single"
+            or self.hold_frames is True
+        )
 
-    # ── internal helpers 
+    def _configure_renderer(self, render: RenderSettings):
+        if isinstance(self.renderer, DeckRenderer):
+            self.renderer.cull_offscreen = self.cull_offscreen or self.cull_overlay
+            self.renderer.cull_overlay = self.cull_overlay
+        writer = self.renderer.file_writer
+        if isinstance(writer, DeckFileWriter):
+            writer.configure(
+                encoder_threads=self.encoder_threads,
+                frame_queue=render.frame_queue,
+                encoder_processes=render.encoder_processes,
+                segment_cache=open_cache(self.segment_cache, self.deck_config),
+            )
+
+    def text_styles(self) -> dict[str, dict]:
+        """Text keyword arguments for each text role used by the slide types."""
+        t = self.theme
+        return {
+            "title": {"font_size": t.title_size, "color": t.accent},
+            "footer": {"font_size": t.body_size, "color": t.text},
+            "section": {"font_size": 72, "color": t.accent},
+            "section_number": {"font_size": 144, "color": t.accent},
+            "statement": {"font_size": 42, "color": t.text},
+            "header": {"font_size": 60, "color": t.accent},
+            "heading": {"font_size": t.heading_size, "color": t.accent},
+            "caption": {"font_size": 24, "color": t.text},
+            "counter": {"font_size": 24, "color": t.text},
+            "label": {"font_size": 24, "color": t.accent},
+        }
+
+    def styled_text(self, text: str, role: str) -> Text:
+        """A fresh `Text` for *text* in the style of *role* (see `text_styles`).
+
+        Each distinct (text, role) is laid out once per scene; later calls
+        return copies, so repeated headings and slide numbers are cheap.
+        """
+        key = (text, role)
+        if key not in self._text_cache:
+            self._text_cache[key] = self._prebuilt("_build_text", text, role)
+        return self._text_cache[key].copy()
+
+    def set_color_role(self, mobject: Mobject, role: str) -> Mobject:
+        """Tag *mobject* and its family as drawn in the theme colour *role*.
+
+        Replay logs record the tags, so the deck can later be re-coloured for
+        another theme (see `manim_deck.render.replay`).  Untagged mobjects in
+        exactly a theme colour are matched by value instead; tags settle the
+        cases where two roles share a colour.
+        """
+        if role not in COLOR_ROLES:
+            raise ValueError(f"role must be one of {COLOR_ROLES}, got {role!r}")
+        for mob in mobject.get_family():
+            mob.color_role = role
+        return mobject
+
+    # ── mobject builders (also run on the prefetch thread, see `_prebuilt`)
+
+    def _prebuilt(self, builder: str, *args):
+        """``self.<builder>(*args)``, or its result from the prefetch thread if it has one."""
+        if self._prefetcher is not None:
+            mobject = self._prefetcher.take((builder, args))
+            if mobject is not None:
+                return mobject
+        return getattr(self, builder)(*args)
+
+    def _build_text(self, text: str, role: str) -> Text:
+        style = self.text_styles()[role]
+        text_mob = Text(text, **style)
+        for color_role, color in self.theme.palette().items():
+            if str(style.get("color", "")).upper() == color:
+                self.set_color_role(text_mob, color_role)
+                break
+        return text_mob
+
+    def _build_paragraph(self, lines: tuple[str, ...]) -> Paragraph:
+        t = self.theme
+        return self.set_color_role(Paragraph(*lines, font_size=t.body_size, color=t.text), "text")
+
+    def _build_bullets(self, items: tuple[str, ...]) -> BulletedList:
+        t = self.theme
+        bullets = BulletedList(*items, font_size=t.body_size, buff=0.3).set_color(t.text)
+        return self.set_color_role(bullets, "text")
+
+    def _build_code(self, code: str, language: str, font_size: int) -> Code:
+        return Code(
+            code_string=code,
+            language=language,
+            background="window",
+            add_line_numbers=True,
+            paragraph_config={"font_size": font_size},
+        )
 
     def _show_slide_count(self):
         """Display the current slide number in the bottom-left corner."""
-        num = Text(str(self.slide_counter), font_size=24, color=self.theme.text)
+        num = self.styled_text(str(self.slide_counter), "counter")
         num.to_corner(DL, buff=0.5)
         self.add(num)
+        if self.cache_static_background:
+            self.pin_to_background(num)
 
     def _anim(self, mobject, text_anim=None):
         """Return an animation for *mobject*.  Defaults to FadeIn."""
@@ -70,8 +357,185 @@ class TemplateSlide(Slide):
             text_anim = FadeIn
         return text_anim(mobject)
 
+    # ── render hooks
+
+    def _rendering(self):
+        """Context in which the prefetch thread may build mobjects (see `Prefetcher`)."""
+        return self._prefetcher.rendering() if self._prefetcher is not None else nullcontext()
+
+    def play(self, *args, **kwargs):
+        if self._replay is None:
+            with self._rendering():
+                super().play(*args, **kwargs)
+            return
+        start = self._replay.snapshot(self)
+        with self._rendering():
+            super().play(*args, **kwargs)
+        self._replay.record_play(self, start)
+
+    def wait(self, duration=DEFAULT_WAIT_TIME, stop_condition=None, frozen_frame=None):
+        if self._holds is not None and stop_condition is None:
+            duration = self._hold(duration, frozen_frame)
+        with self._rendering():
+            super().wait(duration, stop_condition=stop_condition, frozen_frame=frozen_frame)
+
+    def _hold(self, duration: float, frozen_frame: bool | None) -> float:
+        """Return the duration to render for a wait of *duration* in hold mode.
+
+        Only waits that end a slide are shortened; other static waits keep
+        their length and are written from one frame by `DeckFileWriter`.
+        """
+        if not self._trailing_wait:
+            return duration
+        # a looping or auto-advancing slide plays its last frames too
+        slide = getattr(self, "_base_slide_config", None)
+        if slide is not None and (slide.loop or slide.auto_next):
+            return duration
+        static = frozen_frame if frozen_frame is not None else not self.should_update_mobjects()
+        frame = 1 / self.camera.frame_rate
+        if not static or duration <= frame:
+            return duration
+        self._holds.add(
+            Hold(
+                animation=self._current_animation,
+                slide=self._current_slide,
+                requested=duration,
+                emitted=frame,
+            )
+        )
+        return frame
+
+    def _slide_end_wait(self, duration: float = DEFAULT_WAIT_TIME):
+        """`wait()` that ends the current slide (may be shortened in hold mode)."""
+        self._trailing_wait = True
+        try:
+            self.wait(duration)
+        finally:
+            self._trailing_wait = False
+
+    def next_slide(self, *args, **kwargs):
+        if self._preview is not None and self._current_animation > self._start_animation:
+            self._preview.capture(self)
+        # manim-slides inserts a wait before the slide boundary
+        self._trailing_wait = True
+        try:
+            super().next_slide(*args, **kwargs)
+        finally:
+            self._trailing_wait = False
+        if self._replay is not None:
+            self._replay.record_next_slide(kwargs)
+
+    @property
+    def _partial_movie_files(self) -> list[Path]:
+        # movies cut by play_steps() stand for one file per slide
+        files = super()._partial_movie_files
+        return [piece for file in files for piece in self._split_files.get(file, (file,))]
+
+    def get_moving_mobjects(self, *animations):
+        moving = super().get_moving_mobjects(*animations)
+        if not moving or not (self._background or self.cache_static_background):
+            return moving
+        return split_moving(
+            self,
+            moving,
+            animations,
+            pinned=self._background,
+            auto=self.cache_static_background,
+        )
+
+    def begin_animations(self):
+        monitor = self.stage_monitor
+        hidden = []
+        if monitor is not None and monitor.budget.prune:
+            hidden = monitor.prune(self, self.animations)
+        super().begin_animations()
+        if hidden:
+            exclude_hidden(self, hidden)
+        if monitor is not None:
+            monitor.record(self, self.slide_counter, hidden)
+
+    def tear_down(self):
+        super().tear_down()
+        if self._preview is not None and self._current_animation > self._start_animation:
+            self._preview.capture(self)
+        if self.stage_monitor is not None:
+            logger.info("Stage size: %(summary)s", {"summary": self.stage_monitor.summary()})
+        if isinstance(self.renderer, DeckRenderer) and self.renderer.cull_offscreen:
+            logger.info("Culling: %(summary)s", {"summary": self.renderer.cull_stats.summary()})
+        if self._holds is not None and self._holds.holds:
+            logger.info(
+                "Skipped %(seconds).1fs of static frames at the end of %(n)d slides",
+                {"seconds": self._holds.saved_seconds, "n": len(self._holds.holds)},
+            )
+        if self._replay is not None:
+            self._replay.record_frame(self)
+            self._replay.save(Path(self.replay_dir) / type(self).__name__)
+
+    def play_steps(self, *steps: Animation):
+        """Play *steps* back to back as one animation, with a slide boundary after each.
+
+        The animation is encoded once, with key frames forced where the steps
+        end, and the movie is then cut at those frames into one file per
+        slide.  The last step is left open, like a plain `play()`.  Falls back
+        to one `play()` per step when the writer cannot force key frames, and
+        in previews, which capture every slide separately.
+        """
+        writer = self.renderer.file_writer
+        if len(steps) < 2 or not isinstance(writer, DeckFileWriter) or self._preview is not None:
+            for i, step in enumerate(steps):
+                if i:
+                    self.next_slide()
+                self.play(step)
+            return
+
+        fps = self.camera.frame_rate
+        ends = np.cumsum([step.run_time for step in steps])[:-1]
+        # the last frame of each piece shows its step complete
+        cuts = [int(end * fps + 1e-9) + 1 for end in ends]
+        index = len(writer.partial_movie_files)
+        writer.mark_keyframes(cuts)
+        self.play(Succession(*steps))
+        writer.mark_keyframes(())  # unused if the play was cached or skipped
+
+        files = writer.partial_movie_files
+        movie = files[index] if index < len(files) else None
+        if movie is not None:
+            writer.flush(movie)
+        pieces = None
+        if movie is not None:
+            folder = self.deck_config.cache_path("pieces", type(self).__name__)
+            pieces = split_partial_movie(movie, cuts, folder)
+        if pieces is None:
+            return
+        self._split_files[Path(movie)] = pieces
+        logger.debug(
+            "Cut %(movie)s into %(n)d slides at %(times)s s",
+            {"movie": movie, "n": len(pieces), "times": [round(t, 3) for t in ends]},
+        )
+        saved, self.wait_time_between_slides = self.wait_time_between_slides, 0
+        try:
+            for _ in pieces[1:]:
+                self.next_slide()
+                self._current_animation += 1
+        finally:
+            self.wait_time_between_slides = saved
+
     # ── canvas management
 
+    def pin_to_background(self, *mobjects: Mobject):
+        """Mark *mobjects* as static so they are rasterized once per play().
+
+        Pinned mobjects are drawn underneath everything that animates; only pin
+        things that do not overlap the moving parts (headers, footers, grids).
+        Animating a pinned mobject still works — it is treated as moving for
+        that play().  Pins are dropped when the canvas is cleared.
+        """
+        self._background.extend(m for m in mobjects if m not in self._background)
+
+    def clear(self):
+        self._background = []
+        return super().clear()
+
     def update_canvas(self, show_slide_count: bool = True):
         """Advance to a new slide, clear the stage, bump the counter."""
         self.next_slide()
@@ -97,8 +561,6 @@ class TemplateSlide(Slide):
         self.next_slide()
         self.clear()
 
-        t = self.theme
-
         if logos:
             logo_group = (
                 Group(*[ImageMobject(p).set_height(1) for p in logos])
@@ -108,7 +570,7 @@ class TemplateSlide(Slide):
             self.play(FadeIn(logo_group), run_time=run_time)
 
         title = (
-            Text(title_text, font_size=t.title_size, color=t.accent)
+            self.styled_text(title_text, "title")
             .move_to(ORIGIN)
             .scale(scale_title)
         )
@@ -117,13 +579,13 @@ class TemplateSlide(Slide):
         if self.author or occasion:
             parts = [p for p in (self.author, occasion) if p]
             footer = (
-                Text(" — ".join(parts), font_size=t.body_size, color=t.text)
+                self.styled_text(" — ".join(parts), "footer")
                 .to_edge(DOWN)
                 .scale(scale_occasion)
             )
             self.play(self._anim(footer, text_anim), run_time=run_time)
 
-        self.wait()
+        self._slide_end_wait()
 
     def section_slide(
         self,
@@ -136,14 +598,9 @@ class TemplateSlide(Slide):
     ):
         """Full-screen section divider with progress bar."""
         self.update_canvas(show_slide_count=False)
-        t = self.theme
 
-        num_mob = (
-            Text(str(number), font_size=144, color=t.accent)
-            if write_num
-            else VGroup()
-        )
-        title = Text(text, font_size=72, color=t.accent)
+        num_mob = self.styled_text(str(number), "section_number") if write_num else VGroup()
+        title = self.styled_text(text, "section")
         if write_num:
             title.next_to(num_mob, DOWN)
         else:
@@ -168,12 +625,9 @@ class TemplateSlide(Slide):
     ):
         """Centred statement — pass a string or a pre-built Mobject."""
         self.update_canvas()
-        t = self.theme
 
         if isinstance(statement_text, str):
-            statement = Text(
-                statement_text, font_size=42, color=t.text
-            ).move_to(ORIGIN)
+            statement = self.styled_text(statement_text, "statement").move_to(ORIGIN)
         else:
             statement = statement_text.move_to(ORIGIN)
 
@@ -205,12 +659,10 @@ class TemplateSlide(Slide):
     ):
         """Heading + paragraph body."""
         self.update_canvas()
-        t = self.theme
 
-        header = Text(title_text, font_size=60, color=t.accent).to_edge(UP)
-        body = Paragraph(
-            *body_lines, font_size=t.body_size, color=t.text
-        ).next_to(header, DOWN, buff=0.7)
+        header = self.styled_text(title_text, "header").to_edge(UP)
+        body = self._prebuilt("_build_paragraph", tuple(body_lines))
+        body.next_to(header, DOWN, buff=0.7)
 
         footer = (
             self.get_progress_mobject(self.current_section) if add_footer else VGroup()
@@ -230,18 +682,23 @@ class TemplateSlide(Slide):
         add_footer: bool = False,
         run_time: float = DEFAULT_RUN_TIME,
         lagged_start: bool = True,
+        reveal: str | None = None,
         text_anim=None,
     ):
-        """Heading + bulleted list, optionally revealed one-by-one."""
+        """Heading + bulleted list, optionally revealed one-by-one.
+
+        *reveal* (default: `list_reveal`) picks how the one-by-one reveal is
+        rendered: "steps" plays each bullet separately, "single" encodes the
+        whole reveal once and cuts it into slides (see `play_steps`).
+        """
+        reveal = reveal or self.list_reveal
+        if reveal not in LIST_REVEALS:
+            raise ValueError(f"reveal must be one of {LIST_REVEALS}, got {reveal!r}")
         self.update_canvas()
-        t = self.theme
 
-        header = Text(title_text, font_size=t.heading_size, color=t.accent).to_corner(
-            UL, buff=1.5
-        )
+        header = self.styled_text(title_text, "heading").to_corner(UL, buff=1.5)
         bullets = (
-            BulletedList(*items, font_size=t.body_size, buff=0.3)
-            .set_color(t.text)
+            self._prebuilt("_build_bullets", tuple(items))
             .next_to(header, DOWN, buff=1.5)
             .to_edge(LEFT, buff=1.5)
         )
@@ -249,7 +706,14 @@ class TemplateSlide(Slide):
             self.get_progress_mobject(self.current_section) if add_footer else VGroup()
         )
 
-        if lagged_start:
+        if lagged_start and reveal == "single":
+            steps = [self._anim(bullet, text_anim).set_run_time(run_time) for bullet in bullets]
+            steps[0] = Succession(
+                self._anim(header, text_anim).set_run_time(run_time), steps[0]
+            )
+            self.play_steps(*steps)
+            self.next_slide()
+        elif lagged_start:
             self.play(self._anim(header, text_anim), run_time=run_time)
             for bullet in bullets:
                 self.play(self._anim(bullet, text_anim), run_time=run_time)
@@ -275,14 +739,13 @@ class TemplateSlide(Slide):
     ):
         """Heading + centred image with optional caption."""
         self.update_canvas()
-        t = self.theme
 
-        header = Text(title_text, font_size=t.heading_size, color=t.accent).to_edge(UP)
+        header = self.styled_text(title_text, "heading").to_edge(UP)
         img = ImageMobject(image_path).set_height(image_height)
 
         group = VGroup(img)
         if caption:
-            cap = Text(caption, font_size=24, color=t.text).next_to(img, DOWN, buff=0.2)
+            cap = self.styled_text(caption, "caption").next_to(img, DOWN, buff=0.2)
             group.add(cap)
         group.next_to(header, DOWN, buff=0.5)
 
@@ -308,16 +771,10 @@ class TemplateSlide(Slide):
     ):
         """Heading + syntax-highlighted code block."""
         self.update_canvas()
-        t = self.theme
 
-        header = Text(title_text, font_size=t.heading_size, color=t.accent).to_edge(UP)
-        code_block = Code(
-            code_string=code,
-            language=language,
-            background="window",
-            add_line_numbers=True,
-            paragraph_config={"font_size": font_size},
-        ).next_to(header, DOWN, buff=0.5)
+        header = self.styled_text(title_text, "heading").to_edge(UP)
+        code_block = self._prebuilt("_build_code", code, language, font_size)
+        code_block.next_to(header, DOWN, buff=0.5)
 
         self.play(
             self._anim(header, text_anim),
@@ -337,9 +794,8 @@ class TemplateSlide(Slide):
     ):
         """Heading + two side-by-side content areas."""
         self.update_canvas()
-        t = self.theme
 
-        header = Text(title_text, font_size=t.heading_size, color=t.accent).to_edge(UP)
+        header = self.styled_text(title_text, "heading").to_edge(UP)
         columns = VGroup(left, right).arrange(RIGHT, buff=1.0).next_to(header, DOWN, buff=0.6)
 
         footer = (
@@ -357,7 +813,18 @@ class TemplateSlide(Slide):
     def get_progress_mobject(
         self, current_section_num: int, *, add_label: bool = False
     ) -> VGroup:
-        """Build a footer progress-bar Mobject (does NOT add it to scene)."""
+        """Build a footer progress-bar Mobject (does NOT add it to scene).
+
+        The bar of each section is built once per scene and copied afterwards.
+        """
+        key = (current_section_num, add_label)
+        if key not in self._progress_cache:
+            self._progress_cache[key] = self._build_progress_mobject(
+                current_section_num, add_label=add_label
+            )
+        return self._progress_cache[key].copy()
+
+    def _build_progress_mobject(self, current_section_num: int, *, add_label: bool) -> VGroup:
         t = self.theme
         titles = self.section_titles
         n = len(titles)
@@ -391,14 +858,14 @@ class TemplateSlide(Slide):
             ).move_to([x, y, 0])
 
             if i == idx:
-                dot.set_color(t.accent).scale(1.5)
+                self.set_color_role(dot.set_color(t.accent).scale(1.5), "accent")
                 if add_label:
-                    lbl = Text(title, font_size=24, color=t.accent).next_to(
-                        dot, UP, buff=0.15
-                    )
+                    lbl = self.styled_text(title, "label").next_to(dot, UP, buff=0.15)
                     labels.add(lbl)
             elif i > idx:
                 dot.set_opacity(0.3)
             dots.add(dot)
 
+        for mob in (line_before, line_after, *dots[:idx], *dots[idx + 1 :]):
+            self.set_color_role(mob, "text")
         return VGroup(line_before, line_after, dots, labels)
@@ -0,0 +1,144 @@
+"""`DeckSlide`: the `TemplateSlide` that renders a declarative deck.
+
+Parsing and planning live in `manim_deck.deck`; this module adds the Manim
+side and is also reachable as ``manim_deck.deck.DeckSlide``.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import manim
+
+from manim_deck.config import load_config
+from manim_deck.deck import (
+    SLIDE_TYPES,
+    THEMES,
+    DeckError,
+    DeckSpec,
+    PlannedSlide,
+    SlideSpec,
+    compile_deck,
+    load_deck,
+    load_module,
+)
+from manim_deck.render.prefetch import Job, Prefetcher
+from manim_deck.templates.base import TemplateSlide, _talk_file
+
+
+class DeckSlide(TemplateSlide):
+    """`TemplateSlide` that renders a declarative deck.
+
+    Class attributes to override in your subclass:
+        deck   : str | Path | DeckSpec — the deck, or the path of its TOML file
+                                         (relative to the file defining the class).
+        slides : tuple[int, int] | None — render only slides ``start..stop-1``.
+        prefetch_texts : bool          — lay out all texts of the rendered slides
+                                         before the first one.
+
+    With `prefetch_slides` set, the texts, paragraphs, bullet lists and code
+    blocks of the next slides are built on a worker thread while the current
+    slide renders, instead of all texts up front.
+    """
+
+    deck: str | Path | DeckSpec | None = None
+    slides: tuple[int, int] | None = None
+    prefetch_texts: bool = True
+
+    def __init__(self, **kwargs):
+        deck = self._load_spec()
+        self.theme = THEMES[deck.theme]
+        self.section_titles = list(deck.section_titles)
+        self.author = deck.author or self.author
+        self.email = deck.email or self.email
+        if not self.author:
+            # plan the title footer with the author TemplateSlide falls back to
+            self.author = load_config(start=_talk_file(type(self))).defaults.author
+        self.plan = compile_deck(deck, author=self.author)
+        super().__init__(**kwargs)
+
+    def _load_spec(self) -> DeckSpec:
+        if isinstance(self.deck, DeckSpec):
+            return self.deck
+        if self.deck is None:
+            raise DeckError(f"{type(self).__name__}.deck is not set")
+        path = Path(self.deck)
+        talk = _talk_file(type(self))
+        if not path.is_absolute() and talk is not None:
+            path = talk.parent / path
+        return load_deck(path)
+
+    def construct(self):
+        start, stop = self.slides or (0, len(self.plan.slides))
+        planned = self.plan.slides[start:stop]
+        if not planned:
+            return
+        self.current_section = planned[0].section
+        self.slide_counter = planned[0].counter
+        if self.prefetch_slides > 0:
+            self._render_prefetched(planned)
+            return
+        if self.prefetch_texts:
+            for text, role in self.plan.texts(start, stop):
+                self.styled_text(text, role)
+        for slide in planned:
+            self.render_slide(slide.spec)
+
+    def _render_prefetched(self, planned: list[PlannedSlide]):
+        def build(builder: str, *args):
+            return getattr(self, builder)(*args)
+
+        prefetcher = Prefetcher(build, lookahead=self.prefetch_slides)
+        self._prefetcher = prefetcher.start(_prefetch_jobs(slide) for slide in planned)
+        try:
+            for slide in planned:
+                self.render_slide(slide.spec)
+                prefetcher.advance()
+        finally:
+            self._prefetcher = None
+            prefetcher.close()
+        manim.logger.info("Prefetching: %(summary)s", {"summary": prefetcher.summary()})
+
+    def render_slide(self, spec: SlideSpec):
+        """Run the slide method (or animation module) for one deck entry."""
+        params = dict(spec.params)
+        if spec.type == "module":
+            module = load_module(params.pop("module"))
+            self.update_canvas()
+            module(self, **params).run()
+            self.next_slide()
+            return
+        kind = SLIDE_TYPES[spec.type]
+        args = [params.pop(name) for name in kind.args]
+        if "text_anim" in params:
+            params["text_anim"] = getattr(manim, params["text_anim"])
+        getattr(self, kind.method)(*args, **params)
+
+
+def _prefetch_jobs(slide: PlannedSlide) -> list[Job]:
+    """The `TemplateSlide._prebuilt` builds *slide*'s method asks for, in its order."""
+    p = slide.spec.params
+    kind = slide.spec.type
+    jobs: list[Job] = [("_build_text", pair) for pair in slide.texts]
+    if kind == "text":
+        jobs.append(("_build_paragraph", (tuple(p["body_lines"]),)))
+    elif kind == "list":
+        jobs.append(("_build_bullets", (tuple(p["items"]),)))
+    elif kind == "code":
+        code = (p["code"], p.get("language", "python"), p.get("font_size", 18))
+        jobs.append(("_build_code", code))
+    return jobs
+
+
+def deck_scene(
+    deck: str | Path | DeckSpec, *, name: str | None = None, slides: tuple[int, int] | None = None
+) -> type[DeckSlide]:
+    """Create a `DeckSlide` subclass for *deck* (a `DeckSpec` or a TOML path)."""
+    spec = deck if isinstance(deck, DeckSpec) else load_deck(deck)
+    caller = sys._getframe(1).f_globals.get("__name__", __name__)
+    return type(
+        name or spec.name,
+        (DeckSlide,),
+        {"deck": spec, "slides": slides, "__module__": caller},
+    )
@@ -2,10 +2,16 @@
 
 A Theme is a simple dataclass holding all visual constants. Pass one to
 TemplateSlide to change the look of your entire deck in one place.
+
+The four colours are the theme's colour roles (`COLOR_ROLES`).  Mobjects
+drawn in a role's colour can be re-coloured for another theme without
+re-running the deck (see `manim_deck.render.replay`).
 """
 
 from dataclasses import dataclass
 
+COLOR_ROLES = ("bg", "panel", "accent", "text")
+
 @dataclass(frozen=True)
 class Theme:
     """Visual theme for a slide deck.
@@ -34,6 +40,10 @@ class Theme:
     body_size: int = 36
     code_font: str = "Monospace"
 
+    def palette(self) -> dict[str, str]:
+        """Colour of each role in `COLOR_ROLES`, as upper-case hex."""
+        return {role: getattr(self, role).upper() for role in COLOR_ROLES}
+
 
 # ── Built-in themes
 
@@ -0,0 +1,11 @@
+"""ExampleTalk rendered from the declarative deck in deck.toml.
+
+Render:  manim-slides render talks/example-talk/deck.py ExampleDeck
+Present: manim-slides ExampleDeck
+"""
+
+from manim_deck.deck import DeckSlide
+
+
+class ExampleDeck(DeckSlide):
+    deck = "deck.toml"
@@ -0,0 +1,115 @@
+"""Tests for `manim_deck.build`: scene discovery and job fingerprints (no rendering)."""
+
+from pathlib import Path
+
+import pytest
+
+from manim_deck.build import (
+    TalkJob,
+    _is_source,
+    discover_jobs,
+    find_scenes,
+    job_fingerprint,
+    static_estimate,
+)
+
+TALK = '''
+from manim_deck import TemplateSlide
+import manim_deck.deck as deck
+
+
+class Helper:
+    pass
+
+
+class Base(TemplateSlide):
+    pass
+
+
+class Talk(Base):
+    pass
+
+
+class Deck(deck.DeckSlide):
+    pass
+
+
+class Unrelated(Helper):
+    pass
+'''
+
+
+@pytest.fixture
+def talks(tmp_path):
+    talk = tmp_path / "my-talk"
+    talk.mkdir()
+    (talk / "main.py").write_text(TALK, encoding="utf-8")
+    (talk / "data.npy").write_bytes(b"cells")
+    return tmp_path
+
+
+def test_find_scenes_follows_local_base_classes(talks):
+    assert find_scenes(talks / "my-talk" / "main.py") == ["Base", "Talk", "Deck"]
+
+
+def test_discover_jobs(talks):
+    (talks / ".hidden").mkdir()
+    (talks / ".hidden" / "main.py").write_text(TALK, encoding="utf-8")
+    jobs = discover_jobs(talks)
+    assert [job.name for job in jobs] == ["my-talk:Base", "my-talk:Talk", "my-talk:Deck"]
+    assert all(job.source == talks / "my-talk" / "main.py" for job in jobs)
+
+
+@pytest.mark.parametrize(
+    "path, source",
+    [
+        ("main.py", True),
+        ("data/cells.npy", True),
+        ("media/videos/Talk/1080p60/Talk.mp4", False),
+        ("slides/Talk.json", False),
+        ("__pycache__/main.cpython-311.pyc", False),
+        (".manim-deck-build/state.json", False),
+        (".venv/lib/site.py", False),
+        ("Talk.html", False),
+        ("Talk_assets/slide_0.mp4", False),
+    ],
+)
+def test_is_source(path, source):
+    assert _is_source(Path(path)) is source
+
+
+def test_fingerprint_follows_sources_only(talks):
+    job = discover_jobs(talks)[1]
+    base = job_fingerprint(job, "pkg", "h")
+    assert job_fingerprint(job, "pkg", "h") == base
+    assert job_fingerprint(job, "pkg", "l") != base
+    assert job_fingerprint(job, "pkg2", "h") != base
+
+    # render output does not change the fingerprint
+    (talks / "my-talk" / "media").mkdir()
+    (talks / "my-talk" / "media" / "Talk.mp4").write_bytes(b"movie")
+    (talks / "my-talk" / "Talk.html").write_text("<html>")
+    assert job_fingerprint(job, "pkg", "h") == base
+
+    # data files and the manim_deck.toml above the talk do
+    (talks / "my-talk" / "data.npy").write_bytes(b"other cells")
+    changed = job_fingerprint(job, "pkg", "h")
+    assert changed != base
+    (talks / "manim_deck.toml").write_text('[render]\nquality = "m"\n')
+    assert job_fingerprint(job, "pkg", "h") != changed
+
+
+def test_static_estimate_counts_slide_calls(tmp_path):
+    source = tmp_path / "main.py"
+    source.write_text(
+        "class Talk(TemplateSlide):\n"
+        "    def construct(self):\n"
+        "        self.title_slide('A talk')\n"
+        "        for item in range(3):\n"
+        "            self.play(item)\n"
+        "        self.next_slide()\n"
+        "        self.helper()\n",
+        encoding="utf-8",
+    )
+    job = TalkJob(talk=tmp_path, source=source, scene="Talk")
+    assert static_estimate(job) == 3
@@ -0,0 +1,101 @@
+"""Tests for `manim_deck.config`: discovery, validation and caching of manim_deck.toml."""
+
+import os
+
+import pytest
+
+from manim_deck import config
+from manim_deck.config import (
+    CONFIG_FILENAME,
+    ConfigError,
+    DeckConfig,
+    RenderSettings,
+    find_config,
+    load_config,
+)
+
+
+def _write(folder, text):
+    path = folder / CONFIG_FILENAME
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_find_config_walks_up_from_a_talk_file(tmp_path):
+    path = _write(tmp_path, "")
+    talk = tmp_path / "talks" / "my-talk" / "main.py"
+    talk.parent.mkdir(parents=True)
+    talk.write_text("")
+    assert find_config(talk) == path
+    assert find_config(talk.parent) == path
+
+
+def test_nearest_config_wins(tmp_path):
+    _write(tmp_path, "")
+    inner = tmp_path / "talk"
+    inner.mkdir()
+    path = _write(inner, "")
+    assert find_config(inner / "main.py") == path
+
+
+def test_defaults_without_a_file(tmp_path):
+    assert load_config(start=tmp_path) == DeckConfig()
+
+
+def test_values_are_read(tmp_path):
+    _write(
+        tmp_path,
+        '[defaults]\nauthor = "A. Author"\n\n'
+        '[render]\nquality = "m"\nworkers = 3\nhold_frames = "trailing"\n',
+    )
+    loaded = load_config(start=tmp_path)
+    assert loaded.path == (tmp_path / CONFIG_FILENAME).resolve()
+    assert loaded.defaults.author == "A. Author"
+    assert loaded.defaults.email == ""
+    assert loaded.render.quality == "m"
+    assert loaded.render.workers == 3
+    assert loaded.render.hold_frames == "trailing"
+    assert loaded.render.scene_budget is False  # off unless a talk opts in
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[render]\nquality = 'x'\n",
+        "[render]\nworkers = 0\n",
+        "[render]\nworkers = true\n",
+        "[render]\nencoder_threads = -1\n",
+        "[render]\nhold_frames = 'always'\n",
+        "[render]\nunknown_knob = 1\n",
+        "[defaults]\nauthor = 3\n",
+        "render = 1\n",
+        "[render\n",
+    ],
+)
+def test_invalid_files_raise(tmp_path, text):
+    _write(tmp_path, text)
+    with pytest.raises(ConfigError, match=CONFIG_FILENAME):
+        load_config(start=tmp_path)
+
+
+def test_cache_is_reused_until_the_file_changes(tmp_path, monkeypatch):
+    path = _write(tmp_path, '[render]\nquality = "l"\n')
+    calls = []
+    parse = config._parse
+    monkeypatch.setattr(config, "_parse", lambda p: calls.append(p) or parse(p))
+
+    first = load_config(path)
+    assert load_config(start=tmp_path) is first
+    assert len(calls) == 1
+
+    path.write_text('[render]\nquality = "k"\n', encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config(path).render.quality == "k"
+    assert len(calls) == 2
+
+
+def test_cache_path_is_relative_to_the_config(tmp_path):
+    _write(tmp_path, '[render]\ncache_dir = "cache"\n')
+    assert load_config(start=tmp_path).cache_path("a") == (tmp_path / "cache" / "a").resolve()
+    assert DeckConfig(render=RenderSettings(cache_dir="/x")).cache_path("b").as_posix() == "/x/b"
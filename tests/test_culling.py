@@ -0,0 +1,43 @@
+"""Tests for `manim_deck.render.culling` (need Manim)."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from manim_deck.render.culling import STROKE_UNIT, cull, frame_box, stroke_margin  # noqa: E402
+
+BOX = np.array([-7.0, -4.0, 7.0, 4.0])
+
+
+def test_frame_box_follows_a_moving_camera():
+    camera = SimpleNamespace(
+        frame_center=np.array([10.0, -2.0, 0.0]), frame_width=4, frame_height=2
+    )
+    np.testing.assert_allclose(frame_box(camera), [8, -3, 12, -1])
+    assert frame_box(manim.ThreeDCamera()) is None
+
+
+def test_cull_keeps_what_touches_the_frame():
+    inside = manim.Square(side_length=1)
+    outside = manim.Square(side_length=1).move_to([20, 0, 0])
+    straddling = manim.Square(side_length=2).move_to([7.5, 0, 0])
+    assert cull([inside, outside, straddling], BOX) == [inside, straddling]
+
+
+def test_cull_skips_mobjects_without_points():
+    assert cull([manim.VGroup(), manim.Group()], BOX) == []
+
+
+def test_thick_strokes_reach_into_the_frame():
+    line = manim.Line([-1, 4.05, 0], [1, 4.05, 0], stroke_width=20)
+    thin = manim.Line([-1, 4.05, 0], [1, 4.05, 0], stroke_width=1)
+    assert stroke_margin(line) == pytest.approx(20 * STROKE_UNIT)
+    assert cull([line, thin], BOX) == [line]
+
+
+def test_images_have_no_stroke_margin():
+    image = manim.ImageMobject(np.zeros((4, 4, 4), dtype=np.uint8))
+    assert stroke_margin(image) == 0.0
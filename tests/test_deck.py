@@ -0,0 +1,118 @@
+"""Tests for `manim_deck.deck`: parsing, planning, scheduling and diffs (no Manim)."""
+
+from pathlib import Path
+
+import pytest
+
+from manim_deck.deck import DeckError, balanced_chunks, compile_deck, load_deck, parse_deck
+
+EXAMPLE = Path(__file__).parents[1] / "talks" / "example-talk" / "deck.toml"
+
+
+def _deck(*slides, **meta):
+    return parse_deck({"deck": {"name": "Deck", **meta}, "slides": list(slides)})
+
+
+TITLE = {"type": "title", "title_text": "Talk", "occasion": "Lab"}
+SECTION = {"type": "section", "number": 1, "text": "Intro"}
+LIST = {"type": "list", "title_text": "Items", "items": ["a", "b", "c"]}
+STATEMENT = {"type": "statement", "statement_text": "Why?"}
+
+
+def test_example_deck_compiles():
+    plan = compile_deck(load_deck(EXAMPLE))
+    assert plan.deck.name == "ExampleDeck"
+    assert [s.index for s in plan.slides] == list(range(len(plan.slides)))
+    assert plan.texts() == list(dict.fromkeys(plan.texts()))
+
+
+@pytest.mark.parametrize(
+    "slide",
+    [
+        {"type": "nope"},
+        {"type": "list", "title_text": "T"},
+        {"type": "list", "title_text": "T", "items": ["a"], "colour": "red"},
+        {"type": "list", "title_text": "T", "items": "abc"},
+        {"type": "section", "number": "1", "text": "Intro"},
+        {"type": "title", "title_text": ["T"]},
+        {"type": "statement", "statement_text": "S", "text_anim": "Explode"},
+        {"type": "module", "module": "nope"},
+    ],
+)
+def test_invalid_slides_raise(slide):
+    with pytest.raises(DeckError, match="slide 0"):
+        _deck(slide)
+
+
+@pytest.mark.parametrize(
+    "meta",
+    [
+        {"name": 3},
+        {"name": "not a class"},
+        {"theme": "blue"},
+        {"author": 1},
+        {"section_titles": "ab"},
+    ],
+)
+def test_invalid_metadata_raises(meta):
+    with pytest.raises(DeckError):
+        parse_deck({"deck": {"name": "Deck", **meta}, "slides": []})
+
+
+def test_starting_state_of_every_slide():
+    plan = compile_deck(_deck(TITLE, SECTION, LIST, STATEMENT, SECTION | {"number": 2}, LIST))
+    assert [(s.section, s.counter) for s in plan.slides] == [
+        (0, 0),
+        (0, 0),
+        (1, 1),
+        (1, 2),
+        (1, 3),
+        (2, 4),
+    ]
+    # the list after the first section shows slide number 2
+    assert ("2", "counter") in plan.slides[2].texts
+
+
+def test_footer_is_planned_with_the_runtime_author():
+    deck = _deck(TITLE)
+    assert ("Lab", "footer") in compile_deck(deck).slides[0].texts
+    planned = compile_deck(deck, author="A. Author").slides[0].texts
+    assert ("A. Author — Lab", "footer") in planned
+
+
+def test_diff_reports_changed_and_shifted_slides():
+    old = compile_deck(_deck(TITLE, SECTION, LIST, STATEMENT))
+    assert compile_deck(_deck(TITLE, SECTION, LIST, STATEMENT)).diff(old) == []
+
+    edited = compile_deck(_deck(TITLE, SECTION, LIST | {"items": ["a"]}, STATEMENT))
+    assert edited.diff(old) == [2]
+
+    # a new section before the list shifts the starting state of every later slide
+    inserted = compile_deck(_deck(TITLE, SECTION, SECTION | {"number": 2}, LIST, STATEMENT))
+    assert inserted.diff(old) == [2, 3, 4]
+
+    assert compile_deck(_deck(TITLE, SECTION, LIST, STATEMENT, LIST)).diff(old) == [4]
+    themed = compile_deck(_deck(TITLE, SECTION, LIST, STATEMENT, theme="light"))
+    assert themed.diff(old) == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 5, 10])
+def test_balanced_chunks_cover_the_deck(workers):
+    costs = [1, 5, 1, 1, 8, 2, 2, 1]
+    chunks = balanced_chunks(costs, workers)
+    assert len(chunks) == min(workers, len(costs))
+    assert chunks[0][0] == 0 and chunks[-1][1] == len(costs)
+    assert all(a < b for a, b in chunks)
+    assert all(prev[1] == nxt[0] for prev, nxt in zip(chunks, chunks[1:]))
+
+
+def test_balanced_chunks_balance_the_cost():
+    assert balanced_chunks([1, 1, 1, 1, 1, 1], 3) == [(0, 2), (2, 4), (4, 6)]
+    assert balanced_chunks([10, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], 2) == [(0, 1), (1, 11)]
+
+
+def test_schedule_uses_the_slide_costs():
+    plan = compile_deck(_deck(TITLE, LIST, LIST, LIST, STATEMENT))
+    assert plan.schedule(1) == [(0, 5)]
+    assert plan.cost == sum(s.cost for s in plan.slides)
+    assert plan.slides[1].cost == 1 + len(LIST["items"])
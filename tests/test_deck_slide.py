@@ -0,0 +1,57 @@
+"""A prefetched `DeckSlide` builds the same slides as a sequential one (needs Manim)."""
+
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+pytest.importorskip("manim_slides")
+
+from manim.utils.family import extract_mobject_family_members  # noqa: E402
+
+from manim_deck.deck import parse_deck  # noqa: E402
+from manim_deck.templates.deck_slide import deck_scene  # noqa: E402
+
+DECK = parse_deck(
+    {
+        "deck": {"name": "PrefetchDeck", "author": "A. Author"},
+        "slides": [
+            {"type": "title", "title_text": "Prefetching", "occasion": "Tests"},
+            {"type": "section", "number": 1, "text": "One"},
+            {"type": "list", "title_text": "Items", "items": ["1", "2", "3"]},
+            {"type": "text", "title_text": "One", "body_lines": ["2", "3"]},
+            {"type": "code", "title_text": "Code", "code": "x = 1"},
+            {"type": "list", "title_text": "Items", "items": ["1", "2"]},
+        ],
+    }
+)
+
+
+def _stage(scene) -> list:
+    family = extract_mobject_family_members(scene.mobjects, only_those_with_points=True)
+    return [
+        (type(mob).__name__, np.round(mob.points, 6).tobytes(), str(mob.get_color()))
+        for mob in family
+    ]
+
+
+def _render(prefetch_slides: int) -> list[list]:
+    stages = []
+
+    class Recorded(deck_scene(DECK)):
+        def render_slide(self, spec):
+            super().render_slide(spec)
+            stages.append(_stage(self))
+
+    Recorded.prefetch_slides = prefetch_slides
+    with manim.tempconfig({"dry_run": True}):
+        scene = Recorded()
+        scene.construct()
+        assert scene._prefetcher is None
+    return stages
+
+
+def test_prefetched_deck_matches_sequential_build():
+    sequential = _render(0)
+    prefetched = _render(2)
+    assert len(prefetched) == len(DECK.slides)
+    assert prefetched == sequential
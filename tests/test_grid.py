@@ -0,0 +1,28 @@
+"""Tests for the `manim_deck.animations.grid` stroke rules (need Manim)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manim_deck.animations.grid import CellGrid, stroke_pixels  # noqa: E402
+
+LOW = SimpleNamespace(pixel_width=854, frame_width=14.222)  # -ql
+HIGH = SimpleNamespace(pixel_width=3840, frame_width=14.222)  # -qk
+
+
+def _width(grid: CellGrid) -> float:
+    return grid.cell(0, 0).get_stroke_width()
+
+
+def test_default_stroke_is_dropped_below_a_pixel():
+    assert _width(CellGrid(2, 2, 0.5, camera=LOW)) == 0
+    assert _width(CellGrid(2, 2, 0.5, camera=HIGH)) == 1
+
+
+def test_explicit_stroke_stays_at_least_a_pixel_wide():
+    width = _width(CellGrid(2, 2, 0.5, stroke_width=1, camera=LOW))
+    assert stroke_pixels(width, LOW) == pytest.approx(1)
+    assert _width(CellGrid(2, 2, 0.5, stroke_width=3, camera=HIGH)) == 3
+    assert _width(CellGrid(2, 2, 0.5, stroke_width=0, camera=HIGH)) == 0
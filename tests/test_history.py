@@ -0,0 +1,107 @@
+"""Tests for `manim_deck.animations.history` (NumPy only)."""
+
+import numpy as np
+import pytest
+
+from manim_deck.animations.history import (
+    ENCODINGS,
+    SimulationHistory,
+    compact_field,
+    encode_states,
+)
+
+
+@pytest.fixture
+def states():
+    """A small fire-like rollout: states 0-2 spreading over a 5 × 7 grid."""
+    rng = np.random.default_rng(0)
+    steps = [np.zeros((5, 7), dtype=np.uint8)]
+    for _ in range(40):
+        step = steps[-1].copy()
+        step[rng.random(step.shape) < 0.1] += 1
+        steps.append(np.minimum(step, 2))
+    return np.stack(steps)
+
+
+def _options(encoding):
+    # a short interval, so seeking crosses several keyframes
+    return {"interval": 4} if encoding == "delta" else {}
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_random_access(states, encoding):
+    encoded = encode_states(states, encoding, **_options(encoding))
+    assert len(encoded) == len(states)
+    assert tuple(encoded.shape) == states.shape
+    for t in (0, 1, 5, len(states) - 1, -1):
+        np.testing.assert_array_equal(encoded[t], states[t])
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+@pytest.mark.parametrize("start", [0, 1, 7, 40])
+def test_stream(states, encoding, start):
+    encoded = encode_states(states, encoding, **_options(encoding))
+    seen = []
+    for t, frame, changed in encoded.stream(start):
+        seen.append(t)
+        np.testing.assert_array_equal(frame, states[t])
+        if t == 0:
+            expected = np.arange(states[0].size)
+        else:
+            expected = np.flatnonzero(states[t] != states[t - 1])
+        np.testing.assert_array_equal(np.sort(changed), expected)
+    assert seen == list(range(start, len(states)))
+
+
+def test_stream_past_the_end(states):
+    for encoding in ENCODINGS:
+        assert list(encode_states(states, encoding).stream(len(states))) == []
+
+
+def test_packed_rejects_large_states(states):
+    with pytest.raises(ValueError):
+        encode_states(states + 2, "packed")
+
+
+def test_unknown_encoding(states):
+    with pytest.raises(ValueError):
+        encode_states(states, "zip")
+
+
+def test_compact_field_collapses_constant_axes():
+    shape = (4, 3, 5)
+    uniform = compact_field(np.full(shape, 7), shape, np.uint8)
+    assert uniform.shape == (1, 1, 1)
+    static = np.broadcast_to(np.arange(15).reshape(1, 3, 5), shape)
+    assert compact_field(static, shape, np.float16).shape == (1, 3, 5)
+    varying = np.arange(60).reshape(shape)
+    assert compact_field(varying, shape, np.float16).shape == shape
+    with pytest.raises(ValueError):
+        compact_field(np.zeros((2, 3, 5)), shape, np.float16)
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_save_load(tmp_path, states, encoding):
+    landcover = np.full(states.shape, 3)
+    wind = np.linspace(0, 1, len(states))[:, None, None] * np.ones(states.shape)
+    history = SimulationHistory.from_arrays(
+        states, encoding=encoding, keyframe_interval=4, landcover=landcover, wind_speed=wind
+    )
+    assert history.landcover.dtype == np.uint8
+    assert history.wind_speed.dtype == np.float16
+    assert history.landcover.shape == (1, 1, 1)
+    np.testing.assert_array_equal(np.broadcast_to(history.landcover, history.shape)[0], 3)
+
+    path = tmp_path / "rollout.npz"
+    history.save(path)
+    loaded = SimulationHistory.load(path)
+    assert loaded.shape == states.shape
+    assert loaded.states.encoding == encoding
+    assert loaded.nbytes == history.nbytes
+    for t in range(len(states)):
+        np.testing.assert_array_equal(loaded.states[t], states[t])
+    assert sorted(loaded.fields) == ["landcover", "wind_speed"]
+    np.testing.assert_array_equal(loaded.landcover, history.landcover)
+    np.testing.assert_array_equal(loaded.wind_speed, history.wind_speed)
+    with pytest.raises(AttributeError):
+        loaded.vegetation_density
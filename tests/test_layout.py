@@ -0,0 +1,95 @@
+"""Tests for `manim_deck.animations.layout` (pure Python)."""
+
+import json
+import random
+from collections import OrderedDict
+
+import pytest
+
+from manim_deck.animations import layout as layout_module
+from manim_deck.animations.layout import Layout, cached_layout, graph_key, layered_layout
+
+DIAMOND = (4, [(0, 1), (0, 2), (1, 3), (2, 3)])
+
+
+@pytest.fixture(autouse=True)
+def empty_memory(monkeypatch):
+    monkeypatch.setattr(layout_module, "_memory", OrderedDict())
+
+
+def _random_dag(n, m, seed):
+    rng = random.Random(seed)
+    edges = set()
+    while len(edges) < m:
+        a, b = sorted(rng.sample(range(n), 2))
+        edges.add((a, b))
+    return sorted(edges)
+
+
+def _positions(layout: Layout, n: int, edges) -> dict[int, list[float]]:
+    """Slots of nodes and edge bends, by layer."""
+    by_layer: dict[int, list[float]] = {}
+    for node in range(n):
+        by_layer.setdefault(layout.layers[node], []).append(layout.slots[node])
+    for a, b in edges:
+        for rank, slot in layout.route(a, b):
+            by_layer.setdefault(rank, []).append(slot)
+    return by_layer
+
+
+def test_docstring_example():
+    layout = layered_layout(*DIAMOND)
+    assert layout.layers == [0, 1, 1, 2]
+    assert layout.slots == [0.0, -0.5, 0.5, 0.0]
+
+
+def test_cycles_are_rejected():
+    with pytest.raises(ValueError, match="acyclic"):
+        layered_layout(3, [(0, 1), (1, 2), (2, 0)])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_edges_point_right_and_nothing_overlaps(seed):
+    n, edges = 30, _random_dag(30, 45, seed)
+    layout = layered_layout(n, edges)
+    for a, b in edges:
+        assert layout.layers[a] < layout.layers[b]
+        bends = layout.route(a, b)
+        assert len(bends) == layout.layers[b] - layout.layers[a] - 1
+        assert [rank for rank, _ in bends] == list(range(layout.layers[a] + 1, layout.layers[b]))
+    for slots in _positions(layout, n, edges).values():
+        slots = sorted(slots)
+        assert all(b - a >= 1 - 1e-9 for a, b in zip(slots, slots[1:]))
+
+
+def test_graph_key_ignores_edge_order_and_duplicates():
+    n, edges = DIAMOND
+    assert graph_key(n, edges) == graph_key(n, list(reversed(edges)) + edges[:1])
+    assert graph_key(n, edges) != graph_key(n + 1, edges)
+
+
+def test_memory_cache_returns_the_same_layout():
+    assert cached_layout(*DIAMOND) is cached_layout(*DIAMOND)
+
+
+def test_disk_cache_round_trip(tmp_path, monkeypatch):
+    n, edges = 6, [(0, 1), (0, 3), (1, 2), (2, 5), (3, 5), (0, 5), (4, 5)]
+    layout = cached_layout(n, edges, tmp_path)
+    path = tmp_path / f"{graph_key(n, edges)}.json"
+    assert path.is_file()
+
+    monkeypatch.setattr(layout_module, "_memory", OrderedDict())
+    calls = []
+    monkeypatch.setattr(layout_module, "layered_layout", lambda *a: calls.append(a))
+    loaded = cached_layout(n, edges, tmp_path)
+    assert calls == []
+    assert loaded == layout
+    assert loaded.route(0, 5) == layout.route(0, 5) != []
+
+
+def test_stale_or_corrupt_cache_files_are_recomputed(tmp_path):
+    n, edges = DIAMOND
+    path = tmp_path / f"{graph_key(n, edges)}.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert cached_layout(n, edges, tmp_path) == layered_layout(n, edges)
+    assert json.loads(path.read_text(encoding="utf-8"))["version"] == layout_module.LAYOUT_VERSION
@@ -0,0 +1,73 @@
+"""Tests for `manim_deck.outline`."""
+
+import json
+
+import pytest
+
+from manim_deck.outline import _THROWAWAY_SETTINGS, Outline, SlideOutline, _throwaway_class
+
+
+def _outline() -> Outline:
+    slides = [
+        SlideOutline(index=0, section=0, counter=0, type="title", plays=1, cost=2.0, memory=10),
+        SlideOutline(index=1, section=1, counter=0, type="section", plays=1, cost=1.0, memory=30),
+        SlideOutline(index=2, section=1, counter=1, type="list", plays=3, cost=4.0, memory=20),
+        SlideOutline(index=3, section=2, counter=2, wait_frames=15, cost=1.0, memory=5),
+    ]
+    return Outline(scene="Talk", frame_rate=15, pixel_width=854, pixel_height=480, slides=slides)
+
+
+def test_totals():
+    outline = _outline()
+    assert outline.cost == 8.0
+    assert outline.memory == 30
+    assert outline.sections == [0, 1, 2]
+    assert outline.schedule(2) == [(0, 2), (2, 4)]
+
+
+def test_empty_slides():
+    assert SlideOutline(index=0, section=0, counter=0).empty
+    assert not SlideOutline(index=0, section=0, counter=0, wait_frames=1).empty
+    assert not SlideOutline(index=0, section=0, counter=0, glyphs=3).empty
+
+
+def test_to_dict_is_json():
+    data = json.loads(json.dumps(_outline().to_dict()))
+    assert data["resolution"] == [854, 480]
+    assert [s["type"] for s in data["slides"]] == ["title", "section", "list", None]
+
+
+def test_throwaway_class_turns_off_every_render_setting():
+    class Talk:
+        segment_cache = True
+        prefetch_slides = 2
+
+    class Mixin:
+        pass
+
+    cls = _throwaway_class(Talk, Mixin, cull_overlay=False)
+    assert cls.__name__ == "Talk" and cls.__mro__[1:3] == (Mixin, Talk)
+    assert {name: getattr(cls, name) for name in _THROWAWAY_SETTINGS} == _THROWAWAY_SETTINGS
+    assert cls.cull_overlay is False
+
+
+def test_outline_scene_records_slides_without_rendering():
+    manim = pytest.importorskip("manim")
+    pytest.importorskip("manim_slides")
+    from manim_deck.outline import outline_scene
+    from manim_deck.templates.base import TemplateSlide
+
+    class Talk(TemplateSlide):
+        section_titles = ["Intro"]
+
+        def construct(self):
+            self.title_slide("A talk", occasion="Tests")
+            self.section_slide(1, "Intro")
+            self.list_slide("Items", ["one", "two"])
+
+    outline = outline_scene(Talk, quality="l")
+    assert outline.frame_rate == manim.constants.QUALITIES["low_quality"]["frame_rate"]
+    types = [s.type for s in outline.slides if not s.empty]
+    assert types[:2] == ["title", "section"]
+    assert "list" in types
+    assert {s.section for s in outline.slides if s.type == "list"} == {1}
@@ -0,0 +1,133 @@
+"""Tests for `manim_deck.render.segment_cache` (keys, directory and HTTP backends)."""
+
+import http.client
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from manim_deck.config import DeckConfig
+from manim_deck.render.segment_cache import (
+    DirectoryCache,
+    HttpCache,
+    array_digest,
+    open_cache,
+    segment_key,
+    serve,
+)
+
+SETTINGS = {"codec": "libx264", "pix_fmt": "yuv420p", "options": {"crf": "23"}}
+KEY = "0123456789abcdef0123456789abcdef01234567"
+
+
+class _Mob:
+    """Just enough of a Mobject for `array_digest`."""
+
+    def __init__(self, points, *children):
+        self.points = points
+        self.submobjects = list(children)
+
+    def get_family(self):
+        family = [self]
+        for child in self.submobjects:
+            family.extend(child.get_family())
+        return family
+
+
+def test_segment_key_depends_on_every_input():
+    base = segment_key("1_2_3", SETTINGS, "digest")
+    assert base == segment_key("1_2_3", dict(reversed(SETTINGS.items())), "digest")
+    assert len(base) == 40
+    assert segment_key("1_2_4", SETTINGS, "digest") != base
+    assert segment_key("1_2_3", {**SETTINGS, "pix_fmt": "yuv444p"}, "digest") != base
+    assert segment_key("1_2_3", SETTINGS, "other") != base
+
+
+def test_array_digest_sees_the_middle_of_large_arrays():
+    # Manim's own hash keeps only a few corner values of arrays this size
+    points = np.zeros((5000, 3))
+    moved = points.copy()
+    moved[2500, 1] = 1e-3
+    assert array_digest([_Mob(points)]) == array_digest([_Mob(points.copy())])
+    assert array_digest([_Mob(points)]) != array_digest([_Mob(moved)])
+    assert array_digest([_Mob(np.zeros(0), _Mob(points))]) != array_digest(
+        [_Mob(np.zeros(0), _Mob(moved))]
+    )
+
+
+def test_directory_cache_round_trip(tmp_path):
+    cache = DirectoryCache(tmp_path / "segments")
+    movie = tmp_path / "movie.mp4"
+    movie.write_bytes(b"frames")
+    target = tmp_path / "media" / "partial.mp4"
+
+    assert not cache.fetch(KEY, target)
+    cache.store(KEY, movie)
+    assert cache.path(KEY) == tmp_path / "segments" / KEY[:2] / KEY
+    assert cache.fetch(KEY, target)
+    assert target.read_bytes() == b"frames"
+    assert list(cache.path(KEY).parent.glob("*.tmp")) == []
+
+
+def test_open_cache(tmp_path):
+    config = DeckConfig(path=tmp_path / "manim_deck.toml")
+    assert open_cache(False, config) is None
+    assert open_cache(True, config).root == config.cache_path("segments")
+    assert open_cache("shared", config).root == tmp_path / "shared"
+    assert isinstance(open_cache("http://render-box:8766/", config), HttpCache)
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = serve(tmp_path / "store", port=0)
+    server.daemon_threads = False  # so server_close() waits for the handlers
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, tmp_path / "store"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_cache_round_trip(server, tmp_path):
+    srv, store = server
+    cache = HttpCache(f"http://127.0.0.1:{srv.server_address[1]}")
+    movie = tmp_path / "movie.mp4"
+    movie.write_bytes(b"x" * 100_000)
+    target = tmp_path / "media" / "partial.mp4"
+
+    assert not cache.fetch(KEY, target)
+    cache.store(KEY, movie)
+    assert DirectoryCache(store).path(KEY).read_bytes() == movie.read_bytes()
+    assert cache.fetch(KEY, target)
+    assert target.read_bytes() == movie.read_bytes()
+
+
+def test_http_handler_rejects_bad_keys(server):
+    srv, _ = server
+    url = f"http://127.0.0.1:{srv.server_address[1]}"
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        urllib.request.urlopen(f"{url}/segments/../../etc/passwd")
+    assert exc.value.code == 404
+    request = urllib.request.Request(f"{url}/segments/not-a-key", data=b"x", method="PUT")
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        urllib.request.urlopen(request)
+    assert exc.value.code == 400
+
+
+def test_truncated_upload_leaves_no_file(server):
+    srv, store = server
+    connection = http.client.HTTPConnection("127.0.0.1", srv.server_address[1])
+    connection.putrequest("PUT", f"/segments/{KEY}")
+    connection.putheader("Content-Length", "1000")
+    connection.endheaders()
+    connection.send(b"only part of the body")
+    connection.sock.shutdown(2)  # the client goes away mid-upload
+    connection.close()
+    srv.shutdown()
+    srv.server_close()  # joins the handler thread
+    folder = Path(DirectoryCache(store).path(KEY)).parent
+    assert not DirectoryCache(store).path(KEY).exists()
+    assert list(folder.glob("*.tmp")) == []
@@ -0,0 +1,42 @@
+"""Tests for `manim_deck.templates.base.TemplateSlide` (need Manim and manim-slides)."""
+
+import pytest
+
+manim = pytest.importorskip("manim")
+pytest.importorskip("manim_slides")
+
+from manim_slides import Slide  # noqa: E402
+
+from manim_deck.templates.base import TemplateSlide  # noqa: E402
+
+
+class _Default(TemplateSlide):
+    pass
+
+
+class _Cached(TemplateSlide):
+    cache_static_background = True
+
+
+def _stage(scene):
+    scene.slide_counter = 3
+    scene._show_slide_count()
+    square = manim.Square()
+    scene.add(square)
+    return manim.FadeOut(square)
+
+
+def test_default_slide_keeps_stock_moving_mobjects():
+    with manim.tempconfig({"dry_run": True}):
+        scene = _Default()
+        animation = _stage(scene)
+        assert scene._background == []
+        moving = scene.get_moving_mobjects(animation)
+        assert moving == Slide.get_moving_mobjects(scene, animation)
+
+
+def test_cached_background_pins_the_counter():
+    with manim.tempconfig({"dry_run": True}):
+        scene = _Cached()
+        _stage(scene)
+        assert len(scene._background) == 1